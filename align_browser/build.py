@@ -1,8 +1,9 @@
+import os
 import shutil
 import json
-import socket
 from pathlib import Path
 import argparse
+from contextlib import ExitStack
 from datetime import datetime
 
 try:
@@ -11,11 +12,40 @@ except ImportError:
     # Fallback for Python < 3.9
     from importlib_resources import files
 from align_browser.experiment_parser import (
-    parse_experiments_directory,
-    build_manifest_from_experiments,
-    copy_experiment_files,
+    EXPERIMENT_DATA_FILES,
+    LINK_MODES,
+    iter_experiment_results,
+    build_manifest_from_summaries,
+    run_variant_changes,
+    sync_experiment_files,
 )
-from align_browser.csv_exporter import write_experiments_to_csv
+from align_browser.build_cache import (
+    BUILD_CACHE_DIR,
+    CHECKSUM_CACHE_FILE,
+    BuildCache,
+    ChecksumCache,
+)
+from align_browser.csv_exporter import (
+    CSV_PARTITIONS_DIR,
+    PartitionedCsvWriter,
+    open_csv_writer,
+    rewrite_run_variants,
+)
+from align_browser.manifest_columnar import (
+    COLUMNAR_MANIFEST_FILE,
+    write_columnar_manifest,
+)
+from align_browser.manifest_shards import (
+    MANIFEST_INDEX_FILE,
+    MANIFEST_SHARDS_DIR,
+    write_manifest_shards,
+)
+from align_browser.precompress import (
+    PRECOMPRESS_ASSET_SUFFIXES,
+    gzip_sibling,
+    precompress_files,
+)
+from align_browser.server import DEFAULT_RESPONSE_CACHE_BYTES, serve_directory
 
 
 def copy_static_assets(output_dir):
@@ -38,6 +68,15 @@ def build_frontend(
     output_dir: Path,
     dev_mode: bool = False,
     build_only: bool = True,
+    jobs: int = 1,
+    discovery_threads: int = 1,
+    use_cache: bool = True,
+    clean: bool = False,
+    sync_compare: str = "mtime",
+    link_mode: str = "copy",
+    manifest_only: bool = False,
+    precompress: bool = False,
+    columnar_manifest: bool = False,
 ):
     """
     Build frontend with experiment data.
@@ -47,6 +86,21 @@ def build_frontend(
         output_dir: Output directory for the site
         dev_mode: Use development mode (no static asset copying)
         build_only: Only build data, don't start server
+        jobs: Number of worker processes for parsing experiments (0 = all cores)
+        discovery_threads: Number of threads for walking the experiments tree
+        use_cache: Reuse parse results for unchanged experiment directories
+            from the cache kept in the output directory
+        clean: Delete the data directory first instead of syncing it
+        sync_compare: How to detect changed data files, "mtime" or "checksum"
+        link_mode: How to publish data files: "copy", "hardlink", "symlink"
+            or "reflink" (links fall back to copies where unsupported)
+        manifest_only: Build only the manifest, skipping full validation of
+            input_output items and the CSV export
+        precompress: Also write gzip-compressed .gz siblings of the static
+            assets (except in dev mode), manifest, data files and CSV export
+            for the server
+        columnar_manifest: Also write the dictionary-encoded columnar
+            manifest (v3), which the frontend then loads instead of shards
     """
     print(f"Processing experiments directory: {experiments_root}")
 
@@ -56,28 +110,165 @@ def build_frontend(
         output_dir.mkdir(parents=True, exist_ok=True)
         copy_static_assets(output_dir)
 
-    # Create data subdirectory and clean it
+    # Create data subdirectory, only wiping it when a clean build is requested
     data_output_dir = output_dir / "data"
-    if data_output_dir.exists():
+    if clean and data_output_dir.exists():
         shutil.rmtree(data_output_dir)
     data_output_dir.mkdir(exist_ok=True)
 
-    # Parse experiments and build manifest
-    experiments = parse_experiments_directory(experiments_root)
-    manifest = build_manifest_from_experiments(experiments, experiments_root)
+    # Parse experiments (or load unchanged ones from the cache) and build manifest
+    cache = None
+    checksum_cache = None
+    if use_cache:
+        cache = BuildCache(output_dir / BUILD_CACHE_DIR)
+        checksum_cache = ChecksumCache(
+            output_dir / BUILD_CACHE_DIR / CHECKSUM_CACHE_FILE
+        )
+
+    # Results arrive one directory at a time. Their CSV rows are written out
+    # straight away and only the small manifest summaries are kept, so memory
+    # use does not grow with the number of decisions in the experiments tree.
+    csv_output_path = data_output_dir / "experiment_data.csv"
+    csv_temp_path = csv_output_path.with_name(".experiment_data.csv.tmp")
+    summaries = []
+    published_dirs = []
+    csv_partitions_dir = data_output_dir / CSV_PARTITIONS_DIR
+    with ExitStack() as stack:
+        csv_writer = None
+        partition_writer = None
+        if not manifest_only:
+            csv_writer = stack.enter_context(open_csv_writer(csv_temp_path))
+            partition_writer = stack.enter_context(
+                PartitionedCsvWriter(csv_partitions_dir)
+            )
+        for result in iter_experiment_results(
+            experiments_root,
+            jobs=jobs,
+            discovery_threads=discovery_threads,
+            cache=cache,
+            checksum_cache=checksum_cache,
+            # Plain copies can be written from the buffers read for parsing
+            publish_dir=data_output_dir if link_mode == "copy" else None,
+            manifest_only=manifest_only,
+        ):
+            summaries.extend(result.summaries)
+            if result.summaries:
+                published_dirs.append(result.experiment_dir)
+            if csv_writer:
+                csv_writer.writerows(result.csv_rows)
+                partition_writer.writerows(result.csv_rows)
+    if cache:
+        cache.save()
+
+    manifest = build_manifest_from_summaries(summaries, experiments_root)
 
     manifest.generated_at = datetime.now().isoformat()
 
-    # Copy experiment data files
-    copy_experiment_files(experiments, experiments_root, data_output_dir)
+    # Sync experiment data files, copying only what changed
+    sync_stats = sync_experiment_files(
+        published_dirs,
+        experiments_root,
+        data_output_dir,
+        compare=sync_compare,
+        link_mode=link_mode,
+        checksum_cache=checksum_cache,
+    )
+    print(
+        f"Synced data files: {sync_stats.files_copied} copied "
+        f"({sync_stats.bytes_copied / 1e6:.1f} MB), "
+        f"{sync_stats.files_linked} linked, "
+        f"{sync_stats.files_skipped} unchanged "
+        f"({sync_stats.bytes_skipped / 1e6:.1f} MB skipped), "
+        f"{sync_stats.files_deleted} removed"
+    )
+    if sync_stats.link_fallbacks:
+        print(
+            f"Could not {link_mode} {sync_stats.link_fallbacks} files, copied them instead"
+        )
+
+    if checksum_cache:
+        checksum_cache.save()
 
-    # Save manifest in data subdirectory
-    with open(data_output_dir / "manifest.json", "w") as f:
+    # Save manifest in data subdirectory. Generated files are written to a
+    # temporary name first so the site keeps working while it is rebuilt.
+    manifest_path = data_output_dir / "manifest.json"
+    with open(manifest_path.with_name(".manifest.json.tmp"), "w") as f:
         json.dump(manifest.model_dump(), f, indent=2)
+    os.replace(manifest_path.with_name(".manifest.json.tmp"), manifest_path)
+    columnar_manifest_path = data_output_dir / COLUMNAR_MANIFEST_FILE
+    if columnar_manifest:
+        write_columnar_manifest(manifest, data_output_dir)
+        print(
+            f"Wrote columnar manifest "
+            f"({columnar_manifest_path.stat().st_size / 1e3:.1f} KB, "
+            f"{manifest_path.stat().st_size / columnar_manifest_path.stat().st_size:.1f}x "
+            f"smaller than manifest.json)"
+        )
+    else:
+        columnar_manifest_path.unlink(missing_ok=True)
+        gzip_sibling(columnar_manifest_path).unlink(missing_ok=True)
+    shard_index = write_manifest_shards(
+        manifest,
+        data_output_dir,
+        columnar_manifest=COLUMNAR_MANIFEST_FILE if columnar_manifest else None,
+    )
+    print(
+        f"Wrote manifest shards for {len(shard_index['shards'])} scenarios "
+        f"to {MANIFEST_SHARDS_DIR}/"
+    )
 
-    # Generate CSV export
-    csv_output_path = data_output_dir / "experiment_data.csv"
-    write_experiments_to_csv(experiments, experiments_root, csv_output_path)
+    # Publish the CSV exports written while parsing
+    if manifest_only:
+        # CSVs from an earlier build would no longer match the manifest
+        csv_output_path.unlink(missing_ok=True)
+        gzip_sibling(csv_output_path).unlink(missing_ok=True)
+        shutil.rmtree(csv_partitions_dir, ignore_errors=True)
+        print("Skipped CSV export (manifest-only build)")
+    else:
+        # Rows were written with each experiment's own run_variant; use the
+        # one the manifest resolved for experiments with identical parameters
+        run_variants = run_variant_changes(summaries, experiments_root)
+        if run_variants:
+            with PartitionedCsvWriter(csv_partitions_dir) as partition_writer:
+                rewrite_run_variants(csv_temp_path, run_variants, partition_writer)
+            print(f"Rewrote the run_variant of {len(run_variants)} experiments in CSVs")
+        os.replace(csv_temp_path, csv_output_path)
+        partition_writer.publish()
+        index = partition_writer.index
+        print(
+            f"Wrote CSV partitions for {len(index['partitions']['adm_name'])} ADMs "
+            f"and {len(index['partitions']['scenario_id'])} scenarios "
+            f"to {CSV_PARTITIONS_DIR}/"
+        )
+
+    if precompress:
+        # In dev mode output_dir is the package's static/ source directory,
+        # whose assets are edited live, so only generated data is compressed
+        precompress_paths = []
+        if not dev_mode:
+            precompress_paths.extend(
+                path
+                for path in output_dir.iterdir()
+                if path.suffix in PRECOMPRESS_ASSET_SUFFIXES and path.is_file()
+            )
+        precompress_paths.append(manifest_path)
+        precompress_paths.append(data_output_dir / MANIFEST_INDEX_FILE)
+        if columnar_manifest:
+            precompress_paths.append(columnar_manifest_path)
+        precompress_paths.extend((data_output_dir / MANIFEST_SHARDS_DIR).iterdir())
+        if not manifest_only:
+            precompress_paths.append(csv_output_path)
+        for dirpath, _, filenames in os.walk(data_output_dir):
+            precompress_paths.extend(
+                Path(dirpath) / name
+                for name in filenames
+                if name in EXPERIMENT_DATA_FILES
+            )
+        written = precompress_files(precompress_paths)
+        print(
+            f"Precompressed {written} files "
+            f"({len(precompress_paths) - written} unchanged)"
+        )
 
     return output_dir
 
@@ -114,11 +305,67 @@ def main():
         default="localhost",
         help="Host to bind to (default: localhost, use 0.0.0.0 for all interfaces)",
     )
+    parser.add_argument(
+        "--response-cache-mb",
+        type=int,
+        default=DEFAULT_RESPONSE_CACHE_BYTES // (1024 * 1024),
+        help="Memory for caching served files, in MB (default: 64, 0 disables the cache)",
+    )
     parser.add_argument(
         "--dev",
         action="store_true",
         help="Development mode: serve from dist/ directory and edit files directly",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes for parsing experiments (default: 1, use 0 for all CPU cores)",
+    )
+    parser.add_argument(
+        "--discovery-threads",
+        type=int,
+        default=1,
+        help="Number of threads for finding experiment directories, useful on network filesystems (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-parse every experiment instead of reusing unchanged results from {BUILD_CACHE_DIR}/ in the output directory",
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Delete the output data directory before building instead of syncing only changed files",
+    )
+    parser.add_argument(
+        "--sync-compare",
+        choices=["mtime", "checksum"],
+        default="mtime",
+        help="How to detect changed data files when syncing: size and modification time, or file checksum (default: mtime)",
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default="copy",
+        help="How to publish experiment files into the site: copy them, or hardlink, symlink or reflink them to save disk space; links fall back to copies where unsupported (default: copy)",
+    )
+    parser.add_argument(
+        "--manifest-only",
+        action="store_true",
+        help="Build only the manifest, skipping full validation of input_output.json items and the CSV export (faster, less memory)",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Also write gzip-compressed .gz copies of the manifest, data files, CSV and static assets, which the server sends to clients that accept gzip",
+    )
+    parser.add_argument(
+        "--columnar-manifest",
+        action="store_true",
+        help="Also write a compact dictionary-encoded columnar manifest (v3) for the frontend to load instead of the per-scenario shards",
+    )
     args = parser.parse_args()
 
     experiments_root = Path(args.experiments).resolve()
@@ -140,86 +387,47 @@ def main():
             )
 
         build_frontend(
-            experiments_root, output_dir, dev_mode=True, build_only=args.build_only
+            experiments_root,
+            output_dir,
+            dev_mode=True,
+            build_only=args.build_only,
+            jobs=args.jobs,
+            discovery_threads=args.discovery_threads,
+            use_cache=not args.no_cache,
+            clean=args.clean,
+            sync_compare=args.sync_compare,
+            link_mode=args.link_mode,
+            manifest_only=args.manifest_only,
+            precompress=args.precompress,
+            columnar_manifest=args.columnar_manifest,
         )
     else:
         # Production mode: use specified output directory
         output_dir = Path(args.output_dir).resolve()
         build_frontend(
-            experiments_root, output_dir, dev_mode=False, build_only=args.build_only
+            experiments_root,
+            output_dir,
+            dev_mode=False,
+            build_only=args.build_only,
+            jobs=args.jobs,
+            discovery_threads=args.discovery_threads,
+            use_cache=not args.no_cache,
+            clean=args.clean,
+            sync_compare=args.sync_compare,
+            link_mode=args.link_mode,
+            manifest_only=args.manifest_only,
+            precompress=args.precompress,
+            columnar_manifest=args.columnar_manifest,
         )
 
     # Start HTTP server if not build-only
     if not args.build_only:
-        serve_directory(output_dir, args.host, args.port)
-
-
-def serve_directory(directory, host="localhost", port=8000):
-    """Start HTTP server to serve the specified directory."""
-    from waitress import serve
-    import mimetypes
-    from pathlib import Path
-
-    # Find an available port starting from the requested port
-    actual_port = find_available_port(port, host)
-
-    def static_app(environ, start_response):
-        """Simple WSGI app for serving static files."""
-        path_info = environ["PATH_INFO"]
-        if path_info == "/":
-            path_info = "/index.html"
-
-        file_path = Path(directory) / path_info.lstrip("/")
-
-        if not file_path.exists() or not file_path.is_file():
-            start_response("404 Not Found", [("Content-Type", "text/plain")])
-            return [b"404 Not Found"]
-
-        content_type, _ = mimetypes.guess_type(str(file_path))
-        if content_type is None:
-            content_type = "application/octet-stream"
-
-        start_response("200 OK", [("Content-Type", content_type)])
-        with open(file_path, "rb") as f:
-            return [f.read()]
-
-    if actual_port != port:
-        print(f"Port {port} was busy, using port {actual_port} instead")
-
-    # Display appropriate URL based on host
-    if host == "0.0.0.0":
-        url = f"http://localhost:{actual_port}"
-        print(f"Serving {directory} on all network interfaces at port {actual_port}")
-        print(f"Local access: {url}")
-        print(f"Network access: http://<your-ip>:{actual_port}")
-    else:
-        url = f"http://{host}:{actual_port}"
-        print(f"Serving {directory} at {url}")
-
-    print("Press Ctrl+C to stop the server")
-    try:
-        serve(static_app, host=host, port=actual_port)
-    except KeyboardInterrupt:
-        print("\nServer stopped")
-
-
-def find_available_port(start_port=8000, host="localhost"):
-    """Find an available port starting from start_port."""
-    port = start_port
-    bind_host = "" if host == "0.0.0.0" else host
-
-    while port < start_port + 100:  # Try up to 100 ports
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind((bind_host, port))
-                return port
-        except OSError:
-            port += 1
-
-    # If no port found in range, let the system assign one
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind((bind_host, 0))
-        return s.getsockname()[1]
+        serve_directory(
+            output_dir,
+            args.host,
+            args.port,
+            response_cache_bytes=args.response_cache_mb * 1024 * 1024,
+        )
 
 
 if __name__ == "__main__":
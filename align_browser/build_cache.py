@@ -0,0 +1,262 @@
+"""Persistent caches that let rebuilds skip work on unchanged experiment files."""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from align_browser import __version__
+from align_browser.experiment_models import (
+    MANIFEST_VERSION,
+    DirectoryResult,
+    calculate_file_checksum,
+)
+
+# Name of the cache directory created inside the site output directory
+BUILD_CACHE_DIR = ".align-browser-cache"
+
+# Bump when the layout of cache entries or the CSV rows they hold change
+CACHE_FORMAT_VERSION = 2
+
+# Name of the checksum cache file inside the cache directory
+CHECKSUM_CACHE_FILE = "checksums.json"
+
+# Files whose size and modification time decide whether an entry is stale
+FINGERPRINT_FILES = (
+    "input_output.json",
+    "timing.json",
+    "scores.json",
+    ".hydra/config.yaml",
+)
+
+
+def directory_fingerprint(experiment_dir: Path) -> List[List[Any]]:
+    """Describe the experiment files in a directory by path, size and mtime_ns."""
+    fingerprint = []
+    for name in FINGERPRINT_FILES:
+        try:
+            stat = os.stat(experiment_dir / name)
+            fingerprint.append([name, stat.st_size, stat.st_mtime_ns])
+        except FileNotFoundError:
+            fingerprint.append([name, None, None])
+    return fingerprint
+
+
+class BuildCache:
+    """
+    On-disk cache of DirectoryResult objects keyed by experiment directory.
+
+    Each entry is a JSON file holding the directory's fingerprint and the
+    manifest summaries and CSV rows derived from it. Those hold paths
+    relative to the experiments root of the build, so entries are keyed by
+    the root as well as the directory. An entry is only used while the
+    fingerprint still matches. The whole cache is discarded when the
+    package version, manifest version or cache format changes.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.entries_dir = cache_dir / "entries"
+        self.hits = 0
+        self.misses = 0
+        self._fingerprints: Dict[Tuple[Path, Path], List[List[Any]]] = {}
+        self._used_entries = set()
+
+        if self._read_info() != self._expected_info():
+            shutil.rmtree(self.entries_dir, ignore_errors=True)
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _expected_info() -> Dict[str, Any]:
+        return {
+            "cache_format_version": CACHE_FORMAT_VERSION,
+            "package_version": __version__,
+            "manifest_version": MANIFEST_VERSION,
+        }
+
+    def _read_info(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.cache_dir / "cache_info.json") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _entry_path(self, experiment_dir: Path, experiments_root: Path) -> Path:
+        key = f"{experiments_root}\0{experiment_dir}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.entries_dir / f"{digest[:32]}.json"
+
+    def get(
+        self,
+        experiment_dir: Path,
+        experiments_root: Path,
+        manifest_only: bool = False,
+    ) -> Optional[DirectoryResult]:
+        """Return the cached result for a directory if its files are unchanged.
+
+        Results of manifest-only parses lack CSV rows, so they are only
+        returned when manifest_only is set.
+        """
+        fingerprint = directory_fingerprint(experiment_dir)
+        # Remember the fingerprint taken before parsing, so a file changing
+        # while the build runs invalidates the entry on the next build
+        self._fingerprints[(experiment_dir, experiments_root)] = fingerprint
+
+        entry_path = self._entry_path(experiment_dir, experiments_root)
+        self._used_entries.add(entry_path.name)
+
+        try:
+            with open(entry_path) as f:
+                entry = json.load(f)
+            if (
+                entry["experiment_dir"] == str(experiment_dir)
+                and entry["experiments_root"] == str(experiments_root)
+                and entry["fingerprint"] == fingerprint
+            ):
+                result = DirectoryResult.model_validate(entry["result"])
+                if manifest_only or not result.manifest_only:
+                    self.hits += 1
+                    return result
+        except (OSError, ValueError, KeyError):
+            pass
+
+        self.misses += 1
+        return None
+
+    def put(self, result: DirectoryResult, experiments_root: Path):
+        """Store the result for a directory under the fingerprint seen by get()."""
+        experiment_dir = result.experiment_dir
+        fingerprint = self._fingerprints.get((experiment_dir, experiments_root))
+        if fingerprint is None:
+            fingerprint = directory_fingerprint(experiment_dir)
+
+        entry_path = self._entry_path(experiment_dir, experiments_root)
+        self._used_entries.add(entry_path.name)
+
+        entry = {
+            "experiment_dir": str(experiment_dir),
+            "experiments_root": str(experiments_root),
+            "fingerprint": fingerprint,
+            "result": result.model_dump(mode="json"),
+        }
+        temp_path = entry_path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(temp_path, entry_path)
+
+    def save(self):
+        """Write cache metadata and drop entries not used by this build."""
+        for entry_path in self.entries_dir.iterdir():
+            if entry_path.name not in self._used_entries:
+                entry_path.unlink()
+
+        with open(self.cache_dir / "cache_info.json", "w") as f:
+            json.dump(self._expected_info(), f, indent=2)
+
+
+class ChecksumCache:
+    """
+    Persistent map from file identity to SHA256 checksum.
+
+    Entries are stored per (device, inode) and hold the size and mtime_ns the
+    checksum was computed for, so a checksum is reused until the file is
+    rewritten and hardlinked copies share it. Rewriting a file replaces its
+    entry. Lookups are thread safe so the cache can back
+    calculate_file_checksums, which hashes cache misses on a thread pool.
+    Entries for files the build did not look at are dropped when the cache
+    is saved.
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._used_keys: Set[str] = set()
+
+        try:
+            with open(cache_file) as f:
+                self._entries: Dict[str, List[Any]] = json.load(f)["checksums"]
+        except (OSError, ValueError, KeyError):
+            self._entries = {}
+
+    def lookup(self, file_path: Path) -> Optional[str]:
+        """Return the cached checksum of a file, or None if it must be hashed."""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+
+        key = f"{stat.st_dev}:{stat.st_ino}"
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+                self._used_keys.add(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            return None
+
+    def keep(self, file_path: Path):
+        """Keep the entry of a file the build did not need to hash."""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return
+
+        with self._lock:
+            self._used_keys.add(f"{stat.st_dev}:{stat.st_ino}")
+
+    def record(self, identity: List[int], checksum: str):
+        """
+        Remember a checksum calculated elsewhere.
+
+        identity is [st_dev, st_ino, st_size, st_mtime_ns] of the file as it
+        was when its contents were read.
+        """
+        dev, ino, size, mtime_ns = identity
+        key = f"{dev}:{ino}"
+        with self._lock:
+            self._entries[key] = [size, mtime_ns, checksum]
+            self._used_keys.add(key)
+
+    def checksum(self, file_path: Path) -> str:
+        """Return the "sha256:" checksum of a file, hashing it only if needed."""
+        cached = self.lookup(file_path)
+        if cached is not None:
+            return cached
+
+        try:
+            before = os.stat(file_path)
+        except FileNotFoundError:
+            return ""
+        checksum = calculate_file_checksum(file_path)
+
+        # Only remember the result if the file did not change while hashing
+        try:
+            after = os.stat(file_path)
+        except FileNotFoundError:
+            return checksum
+        identity = [after.st_dev, after.st_ino, after.st_size, after.st_mtime_ns]
+        if identity == [
+            before.st_dev,
+            before.st_ino,
+            before.st_size,
+            before.st_mtime_ns,
+        ]:
+            self.record(identity, checksum)
+        return checksum
+
+    def save(self):
+        """Write the checksums used by this build to disk."""
+        entries = {
+            key: entry for key, entry in self._entries.items() if key in self._used_keys
+        }
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_file.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump({"checksums": entries}, f)
+        os.replace(temp_path, self.cache_file)
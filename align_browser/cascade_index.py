@@ -0,0 +1,122 @@
+"""Precomputed index of the frontend's parameter cascade."""
+
+import math
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from align_browser.experiment_models import Manifest
+
+# The frontend's PARAMETER_PRIORITY_ORDER, from the root of the index down
+CASCADE_PARAMETERS = ("scenario", "scene", "kdma_values", "adm", "llm", "run_variant")
+
+# Largest array index of a JavaScript object key, plus one
+_JS_ARRAY_INDEX_LIMIT = 2**32 - 1
+
+
+def _is_js_array_index(key: str) -> bool:
+    return key.isdigit() and str(int(key)) == key and int(key) < _JS_ARRAY_INDEX_LIMIT
+
+
+def js_object_items(mapping: Mapping[str, Any]) -> List[Tuple[str, Any]]:
+    """
+    List a dict's items in the order JavaScript iterates the parsed JSON object.
+
+    Keys that are array indices ("0", "12", but not "01") come first in
+    ascending numeric order, followed by the other keys in insertion order.
+    """
+    items = list(mapping.items())
+    index_items = [item for item in items if _is_js_array_index(item[0])]
+    if not index_items:
+        return items
+    index_items.sort(key=lambda item: int(item[0]))
+    return index_items + [item for item in items if not _is_js_array_index(item[0])]
+
+
+def _normalize_kdma_value(value: Any) -> float:
+    """Round a KDMA value to one decimal the way the frontend does (half up)."""
+    return math.floor(float(value) * 10 + 0.5) / 10
+
+
+def _kdma_key(kdma_values: List[Dict[str, Any]]) -> Tuple:
+    """Key KDMA values the way the frontend compares them (order-independent)."""
+    return tuple(
+        sorted(
+            (kv["kdma"], _normalize_kdma_value(kv["value"]))
+            for kv in kdma_values or []
+            if kv.get("kdma") and "value" in kv
+        )
+    )
+
+
+def iter_cascade_entries(manifest: Manifest) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield the value of each CASCADE_PARAMETERS parameter for every scene.
+
+    Scenes come in the order the frontend lists them in its flat entries
+    array, which iterates the parsed manifest's objects (see
+    js_object_items), so an entry's position is the same on both sides.
+    """
+    for _, experiment in js_object_items(manifest.experiments):
+        parameters = experiment.parameters
+        llm = parameters["llm"]
+        kdma_values = parameters["kdma_values"]
+        for scenario_id, scenario in js_object_items(experiment.scenarios):
+            for scene_id, _ in js_object_items(scenario.scenes):
+                yield (
+                    scenario_id,
+                    scene_id,
+                    kdma_values,
+                    parameters["adm"]["name"],
+                    (llm or {}).get("model_name") or None,
+                    parameters.get("run_variant"),
+                )
+
+
+def build_cascade_index(
+    manifest: Manifest, encode: Optional[Callable[[str, Any], Any]] = None
+) -> List[List[Any]]:
+    """
+    Build a trie over the manifest's scenes in CASCADE_PARAMETERS order.
+
+    Each node is a list [value, children], where children is a list of
+    nodes one parameter further down. Nodes of the last level
+    (run_variant) are [value, first] instead, where first is the position
+    of their scene in the frontend's entries array. Children are in order
+    of the first scene below them, so the valid options for a parameter
+    under a full selection of the parameters above it are a node's
+    children as they are. Lists rather than objects keep that order for
+    scene IDs that look like integers.
+
+    Args:
+        manifest: Manifest to index
+        encode: Optional function mapping a parameter name and value to
+            what is stored in the nodes, e.g. a string table code
+
+    Returns:
+        The scenario-level nodes
+    """
+    root: Dict[Any, Any] = {}
+    for position, entry in enumerate(iter_cascade_entries(manifest)):
+        children = root
+        for depth, value in enumerate(entry):
+            key = (
+                _kdma_key(value)
+                if CASCADE_PARAMETERS[depth] == "kdma_values"
+                else value
+            )
+            node = children.get(key)
+            if node is None:
+                if encode is not None:
+                    value = encode(CASCADE_PARAMETERS[depth], value)
+                node = children[key] = [value, position, {}]
+            children = node[2]
+    return _node_lists(root, depth=0)
+
+
+def _node_lists(children: Dict[Any, Any], depth: int) -> List[List[Any]]:
+    if depth == len(CASCADE_PARAMETERS) - 1:
+        return [[value, first] for value, first, _ in children.values()]
+    # An inner node's first scene is that of its first child
+    return [
+        [value, _node_lists(grandchildren, depth + 1)]
+        for value, _, grandchildren in children.values()
+    ]
@@ -11,6 +11,7 @@ from pathlib import Path
 from contextlib import contextmanager
 import pytest
 from playwright.sync_api import sync_playwright
+from align_browser.test_sample_data import build_sample_site
 
 
 @contextmanager
@@ -353,3 +354,14 @@ def page(browser_context):
     page = browser_context.new_page()
     yield page
     page.close()
+
+
+@pytest.fixture
+def build_site():
+    """
+    Return a function that builds the sample site into a directory.
+
+    Call it as build_site(temp_path, **build_options); the site is written
+    to temp_path / "site" and its path returned.
+    """
+    return build_sample_site
@@ -1,11 +1,20 @@
 """CSV export functionality for experiment data."""
 
 import csv
+import gzip
+import json
+import os
+import re
+import shutil
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from align_browser.experiment_models import (
     ExperimentData,
     InputOutputItem,
+    ScoresFile,
+    TimingData,
     parse_alignment_target_id,
 )
 
@@ -114,37 +123,27 @@ def extract_choice_info(item: InputOutputItem) -> str:
     return json.dumps(filtered_choice_info, separators=(",", ":"))
 
 
-def get_decision_time(
-    timing_data: Optional[Dict[str, Any]], item_index: int
-) -> Optional[float]:
+def get_decision_time(timing: Optional[TimingData], item_index: int) -> Optional[float]:
     """Get the decision time for a specific item index from timing data."""
-    if not timing_data or "scenarios" not in timing_data:
+    if not timing or item_index >= len(timing.scenarios):
         return None
 
-    scenarios = timing_data.get("scenarios", [])
-    if item_index >= len(scenarios):
-        return None
-
-    scenario_timing = scenarios[item_index]
-    raw_times = scenario_timing.get("raw_times_s", [])
+    scenario_timing = timing.scenarios[item_index]
 
     # Use the first raw time as the decision time for this scenario
-    if raw_times:
-        return raw_times[0]
+    if scenario_timing.raw_times_s:
+        return scenario_timing.raw_times_s[0]
 
     # Fallback to average time if raw times not available
-    return scenario_timing.get("avg_time_s")
+    return scenario_timing.avg_time_s
 
 
-def get_score(
-    scores_data: Optional[Dict[str, Any]], item_index: int
-) -> Optional[float]:
+def get_score(scores: Optional[ScoresFile], item_index: int) -> Optional[float]:
     """Get the score for a specific item index from scores data."""
-    if not scores_data or "scores" not in scores_data:
-        return None
-
-    scores_list = scores_data.get("scores", [])
-    if item_index >= len(scores_list):
+    # Per-item scores live under a "scores" field, which ScoresFile (run-level
+    # alignment data) does not have, so this is empty for current files
+    scores_list = getattr(scores, "scores", None) if scores else None
+    if not scores_list or item_index >= len(scores_list):
         return None
 
     score_item = scores_list[item_index]
@@ -155,8 +154,13 @@ def experiment_to_csv_rows(
     experiment: ExperimentData, experiments_root: Path
 ) -> List[Dict[str, Any]]:
     """Convert an experiment to CSV rows (one per scenario decision)."""
-    rows = []
+    return list(iter_experiment_csv_rows(experiment, experiments_root))
 
+
+def iter_experiment_csv_rows(
+    experiment: ExperimentData, experiments_root: Path
+) -> Iterator[Dict[str, Any]]:
+    """Yield the CSV rows of an experiment (one per scenario decision)."""
     # Get relative experiment path
     relative_path = experiment.experiment_path.relative_to(experiments_root)
     experiment_path_str = str(relative_path)
@@ -178,16 +182,6 @@ def experiment_to_csv_rows(
         [{"kdma": kv.kdma, "value": kv.value} for kv in kdma_values]
     )
 
-    # Load timing data if available
-    timing_data = None
-    if experiment.timing:
-        timing_data = experiment.timing.model_dump()
-
-    # Load scores data if available
-    scores_data = None
-    if experiment.scores:
-        scores_data = experiment.scores.model_dump()
-
     # Process each input/output item
     for idx, item in enumerate(experiment.input_output.data):
         row = {
@@ -206,8 +200,8 @@ def experiment_to_csv_rows(
             "choice_kdma_association": extract_choice_kdma(item),
             "choice_info": extract_choice_info(item),
             "justification": extract_justification(item),
-            "decision_time_s": get_decision_time(timing_data, idx),
-            "score": get_score(scores_data, idx),
+            "decision_time_s": get_decision_time(experiment.timing, idx),
+            "score": get_score(experiment.scores, idx),
         }
 
         # Convert None values to empty strings for CSV
@@ -215,50 +209,233 @@ def experiment_to_csv_rows(
             if value is None:
                 row[key] = ""
 
-        rows.append(row)
-
-    return rows
+        yield row
+
+
+# Largest field read back from a written CSV
+CSV_FIELD_SIZE_LIMIT = 2**31 - 1
+
+# CSV columns in order
+CSV_FIELDNAMES = [
+    "experiment_path",
+    "adm_name",
+    "llm_backbone",
+    "run_variant",
+    "kdma_config",
+    "alignment_target_id",
+    "scenario_id",
+    "scene_id",
+    "state_description",
+    "choice_kdma_association",
+    "choice_text",
+    "choice_info",
+    "justification",
+    "decision_time_s",
+    "score",
+]
+
+
+@contextmanager
+def open_csv_writer(output_file: Path) -> Iterator[csv.DictWriter]:
+    """Open a CSV file with its header written, for writing rows as they are made."""
+    with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        yield writer
+
+
+# Columns the build splits the CSV export by, and where the partitions go
+CSV_PARTITION_COLUMNS = ("adm_name", "scenario_id")
+CSV_PARTITIONS_DIR = "csv_partitions"
+
+# Partition files kept open at once; others are reopened to append
+MAX_OPEN_PARTITIONS = 64
+
+
+class _CsvPartition:
+    """One gzip-compressed CSV file holding the rows for a column value."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows = 0
+        self.file = None
+        self.writer = None
+
+    def open(self):
+        # Reopening appends a new gzip member, which decompresses as one file
+        self.file = gzip.open(
+            self.path, "at", newline="", encoding="utf-8", compresslevel=6
+        )
+        self.writer = csv.DictWriter(self.file, fieldnames=CSV_FIELDNAMES)
+        if self.rows == 0:
+            self.writer.writeheader()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+
+
+class PartitionedCsvWriter:
+    """
+    Write CSV rows into one gzip-compressed CSV per value of each partition column.
+
+    Used as a context manager. Partitions are written into a temporary
+    directory next to output_dir together with an index.json that lists
+    every partition with its row count and compressed size. publish() then
+    moves them into place, so a served site never sees a partial set.
+    """
+
+    def __init__(
+        self, output_dir: Path, columns: Tuple[str, ...] = CSV_PARTITION_COLUMNS
+    ):
+        self.output_dir = output_dir
+        self.temp_dir = output_dir.with_name(f".{output_dir.name}.tmp")
+        self.columns = columns
+        self.total_rows = 0
+        self.index: Optional[Dict[str, Any]] = None  # Set when writing finishes
+        self._partitions: Dict[str, Dict[str, _CsvPartition]] = {
+            column: {} for column in columns
+        }
+        self._file_names: Dict[str, set] = {column: set() for column in columns}
+        self._open_partitions: "OrderedDict[int, _CsvPartition]" = OrderedDict()
+
+    def __enter__(self) -> "PartitionedCsvWriter":
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        for column in self.columns:
+            (self.temp_dir / column).mkdir(parents=True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for partition in self._open_partitions.values():
+            partition.close()
+        self._open_partitions.clear()
+
+        if exc_type is not None:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            return
+
+        self.index = self._build_index()
+        with open(self.temp_dir / "index.json", "w") as f:
+            json.dump(self.index, f, indent=2)
+
+    def _partition_path(self, column: str, value: str) -> Path:
+        """Pick a unique, filesystem-safe file name for a column value."""
+        stem = re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("._") or "empty"
+        name = stem
+        suffix = 1
+        while name in self._file_names[column]:
+            suffix += 1
+            name = f"{stem}_{suffix}"
+        self._file_names[column].add(name)
+        return self.temp_dir / column / f"{name}.csv.gz"
+
+    def _writer(self, column: str, value: str) -> _CsvPartition:
+        partition = self._partitions[column].get(value)
+        if partition is None:
+            partition = _CsvPartition(self._partition_path(column, value))
+            self._partitions[column][value] = partition
+
+        key = id(partition)
+        if key in self._open_partitions:
+            self._open_partitions.move_to_end(key)
+        else:
+            if len(self._open_partitions) >= MAX_OPEN_PARTITIONS:
+                _, least_recent = self._open_partitions.popitem(last=False)
+                least_recent.close()
+            partition.open()
+            self._open_partitions[key] = partition
+        return partition
+
+    def writerows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Append rows to the partitions matching their column values."""
+        for row in rows:
+            self.total_rows += 1
+            for column in self.columns:
+                partition = self._writer(column, str(row[column]))
+                partition.writer.writerow(row)
+                partition.rows += 1
+
+    def _build_index(self) -> Dict[str, Any]:
+        """Describe the partitions, with paths relative to output_dir."""
+        partitions = {}
+        for column, column_partitions in self._partitions.items():
+            partitions[column] = {
+                value: {
+                    "file": f"{column}/{partition.path.name}",
+                    "rows": partition.rows,
+                    "bytes": partition.path.stat().st_size,
+                }
+                for value, partition in sorted(column_partitions.items())
+            }
+        return {"total_rows": self.total_rows, "partitions": partitions}
+
+    def publish(self) -> None:
+        """Replace output_dir with the partitions written by this writer."""
+        old_dir = self.output_dir.with_name(f".{self.output_dir.name}.old")
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if self.output_dir.exists():
+            os.replace(self.output_dir, old_dir)
+        os.replace(self.temp_dir, self.output_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def rewrite_run_variants(
+    csv_path: Path,
+    run_variants: Dict[Tuple[str, str], str],
+    partition_writer: Optional[PartitionedCsvWriter] = None,
+) -> None:
+    """
+    Rewrite the run_variant of CSV rows in place.
+
+    Args:
+        csv_path: CSV file written by open_csv_writer
+        run_variants: Mapping of (experiment_path, alignment_target_id) to
+            the run_variant their rows should have
+        partition_writer: Optional PartitionedCsvWriter to write the
+            rewritten rows into as well
+    """
+    # Rows hold whole state descriptions, which can exceed the reader's default limit
+    csv.field_size_limit(max(csv.field_size_limit(), CSV_FIELD_SIZE_LIMIT))
+    temp_path = csv_path.with_name(f".{csv_path.name}.rewrite")
+    with open(csv_path, newline="", encoding="utf-8") as source:
+        with open_csv_writer(temp_path) as writer:
+            for row in csv.DictReader(source):
+                key = (row["experiment_path"], row["alignment_target_id"])
+                row["run_variant"] = run_variants.get(key, row["run_variant"])
+                writer.writerow(row)
+                if partition_writer:
+                    partition_writer.writerows([row])
+    os.replace(temp_path, csv_path)
+
+
+def write_csv_rows(rows: List[Dict[str, Any]], output_file: Path) -> None:
+    """Write already generated CSV rows to a CSV file."""
+    with open_csv_writer(output_file) as writer:
+        writer.writerows(rows)
 
 
 def write_experiments_to_csv(
-    experiments: List[ExperimentData], experiments_root: Path, output_file: Path
+    experiments: Iterable[ExperimentData], experiments_root: Path, output_file: Path
 ) -> None:
-    """Write all experiments to a CSV file."""
-
-    # Define CSV columns in order
-    fieldnames = [
-        "experiment_path",
-        "adm_name",
-        "llm_backbone",
-        "run_variant",
-        "kdma_config",
-        "alignment_target_id",
-        "scenario_id",
-        "scene_id",
-        "state_description",
-        "choice_kdma_association",
-        "choice_text",
-        "choice_info",
-        "justification",
-        "decision_time_s",
-        "score",
-    ]
-
-    all_rows = []
-
-    # Convert all experiments to CSV rows
-    for experiment in experiments:
-        try:
-            rows = experiment_to_csv_rows(experiment, experiments_root)
-            all_rows.extend(rows)
-        except Exception as e:
-            print(
-                f"Warning: Failed to export experiment {experiment.experiment_path}: {e}"
-            )
-            continue
-
-    # Write CSV file
-    with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_rows)
+    """
+    Write experiments to a CSV file.
+
+    Rows are written as each experiment is converted, so memory use stays
+    flat and experiments can come from a generator such as
+    iter_experiments_directory. Experiments are converted in the calling
+    process; builds generate rows in parallel instead, in the parse workers
+    of iter_experiment_results (--jobs).
+    """
+    with open_csv_writer(output_file) as writer:
+        for experiment in experiments:
+            try:
+                # Convert a whole experiment first so a failure writes no rows
+                rows = experiment_to_csv_rows(experiment, experiments_root)
+            except Exception as e:
+                print(
+                    f"Warning: Failed to export experiment {experiment.experiment_path}: {e}"
+                )
+                continue
+            writer.writerows(rows)
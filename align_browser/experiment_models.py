@@ -4,10 +4,24 @@ import json
 import yaml
 import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
+if TYPE_CHECKING:
+    from align_browser.build_cache import ChecksumCache
+
+# Version of the manifest layout written by the build
+MANIFEST_VERSION = "2.0"
+
+
+# Read size used when hashing files
+CHECKSUM_BUFFER_SIZE = 1024 * 1024
+
+# Upper bound on the threads hashing files at once
+MAX_CHECKSUM_THREADS = 8
+
 
 def calculate_file_checksum(file_path: Path) -> str:
     """Calculate SHA256 checksum of a file."""
@@ -15,20 +29,49 @@ def calculate_file_checksum(file_path: Path) -> str:
         return ""
 
     sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        # Read in chunks to handle large files efficiently
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(chunk)
+    # Read into one reusable buffer; large reads keep hashlib (which releases
+    # the GIL) busy instead of the Python loop
+    buffer = bytearray(CHECKSUM_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            sha256_hash.update(view[:size])
 
     return f"sha256:{sha256_hash.hexdigest()}"
 
 
-def calculate_file_checksums(file_paths: List[Path]) -> Dict[str, str]:
-    """Calculate checksums for multiple files."""
-    checksums = {}
-    for file_path in file_paths:
-        checksums[str(file_path)] = calculate_file_checksum(file_path)
-    return checksums
+def calculate_data_checksum(data: bytes) -> str:
+    """Calculate the SHA256 checksum of file contents already read into memory."""
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+def calculate_file_checksums(
+    file_paths: List[Path],
+    cache: Optional["ChecksumCache"] = None,
+    threads: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Calculate checksums for multiple files on a bounded thread pool.
+
+    Args:
+        file_paths: Files to hash
+        cache: Optional ChecksumCache; only files it does not know are hashed
+        threads: Number of hashing threads (None uses up to MAX_CHECKSUM_THREADS)
+
+    Returns:
+        Mapping of str(file_path) to "sha256:<hex>" ("" for missing files)
+    """
+    checksum = cache.checksum if cache else calculate_file_checksum
+    if threads is None:
+        threads = min(MAX_CHECKSUM_THREADS, os.cpu_count() or 1)
+
+    if threads > 1 and len(file_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(threads, len(file_paths))) as executor:
+            values = list(executor.map(checksum, file_paths))
+    else:
+        values = [checksum(file_path) for file_path in file_paths]
+
+    return {str(file_path): value for file_path, value in zip(file_paths, values)}
 
 
 class KDMAValue(BaseModel):
@@ -128,6 +171,31 @@ class ExperimentConfig(BaseModel):
     alignment_target: AlignmentTarget = Field(default_factory=AlignmentTarget)
     run_variant: str = "default"
 
+    @classmethod
+    def from_manifest_parameters(cls, parameters: Dict[str, Any]) -> "ExperimentConfig":
+        """Rebuild the config of an experiment from its manifest parameters."""
+        llm = parameters.get("llm")
+        return cls(
+            adm=ADMConfig(
+                name=parameters["adm"]["name"],
+                instance=parameters["adm"].get("instance"),
+                structured_inference_engine=dict(llm) if llm else None,
+            ),
+            alignment_target=AlignmentTarget(
+                id=parameters.get("alignment_target_id", "unknown_target"),
+                kdma_values=parameters.get("kdma_values", []),
+            ),
+            run_variant=parameters.get("run_variant", "default"),
+        )
+
+    def with_alignment_target_id(self, alignment_target_id: str) -> "ExperimentConfig":
+        """Return a shallow copy aligned to the target named by alignment_target_id."""
+        alignment_target = AlignmentTarget(
+            id=alignment_target_id,
+            kdma_values=parse_alignment_target_id(alignment_target_id),
+        )
+        return self.model_copy(update={"alignment_target": alignment_target})
+
     def generate_key(self) -> str:
         """Generate a unique key for this experiment configuration."""
         kdma_parts = [
@@ -216,7 +284,11 @@ class InputOutputFile(BaseModel):
         """Load input_output.json file."""
         with open(path) as f:
             raw_data = json.load(f)
+        return cls.from_data(raw_data)
 
+    @classmethod
+    def from_data(cls, raw_data: List[Dict[str, Any]]) -> "InputOutputFile":
+        """Build from the decoded contents of an input_output.json file."""
         # Convert to InputOutputItem objects with original indices
         items = []
         for i, item_data in enumerate(raw_data):
@@ -233,6 +305,77 @@ class InputOutputFile(BaseModel):
         return "unknown_scenario"
 
 
+def _scene_id_from_full_state(full_state: Any, source_index: int) -> str:
+    """Extract scene_id from full_state.meta_info.scene_id if available."""
+    scene_id = "unknown"
+    if full_state and isinstance(full_state, dict):
+        meta_info = full_state.get("meta_info", {})
+        if isinstance(meta_info, dict):
+            scene_id = meta_info.get("scene_id", f"scene_{source_index}")
+            scene_id = (
+                str(scene_id) if scene_id is not None else f"scene_{source_index}"
+            )
+    return scene_id
+
+
+class ManifestItem(BaseModel):
+    """The fields of an input_output.json item that the manifest needs."""
+
+    scenario_id: str
+    alignment_target_id: Optional[str] = None
+    scene_id: str
+    original_index: int  # Index in the original file
+
+    @classmethod
+    def from_item(cls, item: InputOutputItem) -> "ManifestItem":
+        """Project a fully validated item."""
+        return cls.model_construct(
+            scenario_id=item.input.scenario_id,
+            alignment_target_id=item.input.alignment_target_id,
+            scene_id=_scene_id_from_full_state(
+                item.input.full_state, item.original_index
+            ),
+            original_index=item.original_index,
+        )
+
+    @classmethod
+    def from_data(cls, raw_data: List[Dict[str, Any]]) -> List["ManifestItem"]:
+        """
+        Project the decoded contents of an input_output.json file.
+
+        Only the fields the manifest uses are read and checked, so the
+        states, choices and outputs of the items are never validated or
+        copied.
+        """
+        if not isinstance(raw_data, list):
+            raise ValueError("input_output.json must contain a list of items")
+
+        items = []
+        for i, item_data in enumerate(raw_data):
+            input_data = item_data.get("input") if isinstance(item_data, dict) else None
+            if not isinstance(input_data, dict):
+                raise ValueError(f"input_output item {i} has no input object")
+
+            scenario_id = input_data.get("scenario_id", "unknown_scenario")
+            alignment_target_id = input_data.get("alignment_target_id")
+            if not isinstance(scenario_id, str) or not isinstance(
+                alignment_target_id, (str, type(None))
+            ):
+                raise ValueError(
+                    f"input_output item {i} has an invalid scenario_id or alignment_target_id"
+                )
+
+            items.append(
+                cls.model_construct(
+                    scenario_id=scenario_id,
+                    alignment_target_id=alignment_target_id,
+                    scene_id=_scene_id_from_full_state(input_data.get("full_state"), i),
+                    original_index=i,
+                )
+            )
+        return items
+
+
 class ScoresFile(BaseModel):
     """Wrapper for scores.json which contains an array of scoring data."""
 
@@ -246,6 +389,82 @@ class ScoresFile(BaseModel):
         return cls(data=raw_data)
 
 
+class ExperimentFiles(BaseModel):
+    """
+    Decoded contents of the files in one experiment directory.
+
+    Lets a directory be read once and then handed to the ExperimentData
+    constructors, instead of each of them opening the files again. Values
+    are kept as decoded JSON/YAML and validated by the constructors.
+    """
+
+    config: Dict[str, Any]
+    input_output: Any  # Decoded input_output.json (a list of item dicts)
+    timing: Any  # Decoded timing.json
+    scores: Any = None  # Decoded scores.json, if the directory has one
+
+    @classmethod
+    def read(cls, experiment_dir: Path) -> "ExperimentFiles":
+        """Read and decode the experiment files in a directory."""
+        with open(experiment_dir / ".hydra" / "config.yaml") as f:
+            config = yaml.safe_load(f)
+        with open(experiment_dir / "input_output.json") as f:
+            input_output = json.load(f)
+        with open(experiment_dir / "timing.json") as f:
+            timing = json.load(f)
+
+        scores = None
+        scores_path = experiment_dir / "scores.json"
+        if scores_path.exists():
+            with open(scores_path) as f:
+                scores = json.load(f)
+
+        return cls(
+            config=config, input_output=input_output, timing=timing, scores=scores
+        )
+
+
+class ExperimentDirectory(BaseModel):
+    """
+    An experiment directory with each of its files parsed and validated once.
+
+    Every ExperimentData derived from a directory (one per alignment target
+    for mixed KDMA runs) shares this object's TimingData, ScoresFile and
+    InputOutputItem instances rather than validating copies of them.
+    """
+
+    experiment_path: Path
+    # For mixed KDMA runs this has no alignment target; one is set per target
+    config: ExperimentConfig
+    has_config_alignment: bool  # Whether config.yaml defines the alignment target
+    input_output: InputOutputFile
+    scores: Optional[ScoresFile] = None
+    timing: TimingData
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)  # Allow Path type
+
+    @classmethod
+    def load(
+        cls, experiment_dir: Path, files: Optional[ExperimentFiles] = None
+    ) -> "ExperimentDirectory":
+        """Load a directory, or build from files that were already read."""
+        if files is None:
+            files = ExperimentFiles.read(experiment_dir)
+
+        scores = None
+        if files.scores is not None:
+            scores = ScoresFile(data=files.scores)
+
+        return cls(
+            experiment_path=experiment_dir,
+            config=ExperimentConfig(**files.config),
+            has_config_alignment="alignment_target" in files.config,
+            input_output=InputOutputFile.from_data(files.input_output),
+            scores=scores,
+            timing=TimingData(**files.timing),
+        )
+
+
 class ExperimentData(BaseModel):
     """Complete experiment data loaded from a directory."""
 
@@ -258,33 +477,29 @@ class ExperimentData(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)  # Allow Path type
 
     @classmethod
-    def from_directory(cls, experiment_dir: Path) -> "ExperimentData":
-        """Load all experiment data from a directory."""
-        # Load config
-        config_path = experiment_dir / ".hydra" / "config.yaml"
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f)
-        config = ExperimentConfig(**config_data)
-
-        # Load other files
-        input_output = InputOutputFile.from_file(experiment_dir / "input_output.json")
-
-        # Load scores if available
-        scores = None
-        scores_path = experiment_dir / "scores.json"
-        if scores_path.exists():
-            scores = ScoresFile.from_file(scores_path)
+    def from_directory(
+        cls, experiment_dir: Path, files: Optional[ExperimentFiles] = None
+    ) -> "ExperimentData":
+        """Load all experiment data from a directory.
 
-        with open(experiment_dir / "timing.json") as f:
-            timing_data = json.load(f)
-        timing = TimingData(**timing_data)
+        Pass files to build from contents that were already read.
+        """
+        return cls.from_experiment_directory(
+            ExperimentDirectory.load(experiment_dir, files)
+        )
 
+    @classmethod
+    def from_experiment_directory(
+        cls, directory: ExperimentDirectory
+    ) -> "ExperimentData":
+        """Create the experiment for a uniform KDMA directory that is already loaded."""
+        # Pydantic keeps model instances as they are, so nothing is copied
         return cls(
-            config=config,
-            input_output=input_output,
-            scores=scores,
-            timing=timing,
-            experiment_path=experiment_dir,
+            config=directory.config,
+            input_output=directory.input_output,
+            scores=directory.scores,
+            timing=directory.timing,
+            experiment_path=directory.experiment_path,
         )
 
     @classmethod
@@ -293,6 +508,7 @@ class ExperimentData(BaseModel):
         experiment_dir: Path,
         alignment_target_id: str,
         filtered_data: List[InputOutputItem],
+        directory: Optional[ExperimentDirectory] = None,
     ) -> "ExperimentData":
         """Load experiment data from mixed KDMA directory for a specific alignment target.
 
@@ -300,48 +516,25 @@ class ExperimentData(BaseModel):
         configurations, with KDMAs defined per scene in alignment_target_id rather than config.yaml.
 
         This method works with logical filtering - the original files remain intact.
+        Pass the already loaded directory to share its parsed files between targets.
         """
-        # Load config
-        config_path = experiment_dir / ".hydra" / "config.yaml"
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f)
+        if directory is None:
+            directory = ExperimentDirectory.load(experiment_dir)
 
-        # Create alignment_target from alignment_target_id
-        kdma_values = parse_alignment_target_id(alignment_target_id)
-        alignment_target = AlignmentTarget(
-            id=alignment_target_id, kdma_values=kdma_values
-        )
-
-        # Add alignment_target to config
-        config_data["alignment_target"] = alignment_target.model_dump()
-        config = ExperimentConfig(**config_data)
+        # Only the alignment target differs between the targets of a directory
+        config = directory.config.with_alignment_target_id(alignment_target_id)
 
         # Create input_output from the logically filtered data (already InputOutputItems)
         input_output = InputOutputFile(data=filtered_data)
 
-        # Load scores if available
-        scores = None
-        scores_path = experiment_dir / "scores.json"
-        if scores_path.exists():
-            scores = ScoresFile.from_file(scores_path)
-
-        # Load timing data from default location
-        timing_path = experiment_dir / "timing.json"
-        with open(timing_path) as f:
-            timing_data = json.load(f)
-        timing = TimingData(**timing_data)
-
-        # Create experiment instance
-        experiment = cls(
+        return cls(
             config=config,
             input_output=input_output,
-            scores=scores,
-            timing=timing,
+            scores=directory.scores,
+            timing=directory.timing,
             experiment_path=experiment_dir,
         )
 
-        return experiment
-
     @property
     def key(self) -> str:
         """Get the unique key for this experiment."""
@@ -412,6 +605,111 @@ class FileInfo(BaseModel):
     )  # Experiment keys using this file
 
 
+class ExperimentSummary(BaseModel):
+    """Manifest-ready summary of one experiment.
+
+    Holds everything the manifest needs from an experiment without its
+    input/output items, so it is small enough to keep around or cache.
+    """
+
+    config: ExperimentConfig
+    experiment_path: Path
+    input_output_checksum: str = ""
+    scenarios: Dict[str, Scenario] = Field(
+        default_factory=dict
+    )  # scenario_id -> scenario
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)  # Allow Path type
+
+    @classmethod
+    def from_experiment(
+        cls,
+        experiment: "ExperimentData",
+        experiments_root: Path,
+        input_output_checksum: str,
+    ) -> "ExperimentSummary":
+        """Summarize an experiment, mapping its scenes to source indices."""
+        return cls.from_manifest_items(
+            experiment.config,
+            experiment.experiment_path,
+            experiments_root,
+            input_output_checksum,
+            [ManifestItem.from_item(item) for item in experiment.input_output.data],
+            experiment.timing.raw_times_s,
+            has_scores=experiment.scores is not None,
+        )
+
+    @classmethod
+    def from_manifest_items(
+        cls,
+        config: ExperimentConfig,
+        experiment_path: Path,
+        experiments_root: Path,
+        input_output_checksum: str,
+        items: List[ManifestItem],
+        raw_times_s: List[float],
+        has_scores: bool,
+    ) -> "ExperimentSummary":
+        """Summarize an experiment from the manifest fields of its items."""
+        # Calculate relative paths
+        relative_experiment_path = experiment_path.relative_to(experiments_root)
+
+        # Use standard file paths
+        input_output_path = str(
+            Path("data") / relative_experiment_path / "input_output.json"
+        )
+        timing_path = str(Path("data") / relative_experiment_path / "timing.json")
+        scores_path = None
+        if has_scores:
+            scores_path = str(Path("data") / relative_experiment_path / "scores.json")
+
+        # Create scenario mapping - group by actual scenario_id
+        scenarios_dict = {}
+        for item in items:
+            # Use the scenario_id as-is since we no longer add numeric suffixes
+            scenario_id = item.scenario_id
+
+            # Use the original index from the InputOutputItem
+            source_index = item.original_index
+
+            if scenario_id not in scenarios_dict:
+                scenarios_dict[scenario_id] = Scenario(
+                    input_output=InputOutputFileInfo(
+                        file=input_output_path,
+                        checksum=input_output_checksum,
+                        alignment_target_filter=config.alignment_target.id,
+                    ),
+                    scores=scores_path,
+                    timing=timing_path,
+                    scenes={},
+                )
+
+            scenarios_dict[scenario_id].scenes[item.scene_id] = SceneInfo(
+                source_index=source_index,
+                scene_id=item.scene_id,
+                timing_s=raw_times_s[source_index],
+            )
+
+        return cls(
+            config=config,
+            experiment_path=experiment_path,
+            input_output_checksum=input_output_checksum,
+            scenarios=scenarios_dict,
+        )
+
+
+class DirectoryResult(BaseModel):
+    """Everything a build derives from one experiment directory."""
+
+    experiment_dir: Path
+    summaries: List[ExperimentSummary] = Field(default_factory=list)
+    csv_rows: List[Dict[str, Any]] = Field(default_factory=list)
+    error: Optional[str] = None  # Set when the directory could not be parsed
+    manifest_only: bool = False  # Parsed without full validation or CSV rows
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)  # Allow Path type
+
+
 class ManifestIndices(BaseModel):
     """Indices for fast experiment lookups."""
 
@@ -438,99 +736,59 @@ class Manifest(BaseModel):
         source_file_checksums: Dict[str, str],
     ):
         """Add an experiment to the enhanced manifest."""
+        # Get checksum for input_output file
+        full_input_output_path = str(experiment.experiment_path / "input_output.json")
+        input_output_checksum = source_file_checksums.get(full_input_output_path, "")
+
+        summary = ExperimentSummary.from_experiment(
+            experiment, experiments_root, input_output_checksum
+        )
+        self.add_summary(summary, experiments_root)
+
+    def add_summary(self, summary: ExperimentSummary, experiments_root: Path):
+        """Add a summarized experiment to the enhanced manifest."""
+        config = summary.config
+
         # Generate experiment key with path for uniqueness
-        exp_key = experiment.config.generate_experiment_key(experiment.experiment_path)
+        exp_key = config.generate_experiment_key(summary.experiment_path)
 
         # Create parameter structure
         parameters = {
             "adm": {
-                "name": experiment.config.adm.name,
-                "instance": experiment.config.adm.instance,
+                "name": config.adm.name,
+                "instance": config.adm.instance,
             },
             "llm": None
-            if experiment.config.adm.llm_backbone == "no_llm"
+            if config.adm.llm_backbone == "no_llm"
             else {
-                "model_name": experiment.config.adm.llm_backbone,
+                "model_name": config.adm.llm_backbone,
                 # Add other LLM config from structured_inference_engine if available
-                **(experiment.config.adm.structured_inference_engine or {}),
+                **(config.adm.structured_inference_engine or {}),
             },
             "kdma_values": [
-                kv.model_dump() for kv in experiment.config.alignment_target.kdma_values
+                kv.model_dump() for kv in config.alignment_target.kdma_values
             ],
-            "alignment_target_id": experiment.config.alignment_target.id,
-            "run_variant": experiment.config.run_variant,
+            "alignment_target_id": config.alignment_target.id,
+            "run_variant": config.run_variant,
         }
 
-        # Calculate relative paths
-        relative_experiment_path = experiment.experiment_path.relative_to(
-            experiments_root
-        )
-
-        # Use standard file paths
+        relative_experiment_path = summary.experiment_path.relative_to(experiments_root)
         input_output_path = str(
             Path("data") / relative_experiment_path / "input_output.json"
         )
-        timing_path = str(Path("data") / relative_experiment_path / "timing.json")
-
-        # Get checksum for input_output file
-        full_input_output_path = str(experiment.experiment_path / "input_output.json")
-        input_output_checksum = source_file_checksums.get(full_input_output_path, "")
-
-        # Create scenario mapping - group by actual scenario_id
-        scenarios_dict = {}
-        for i, item in enumerate(experiment.input_output.data):
-            # Use the scenario_id as-is since we no longer add numeric suffixes
-            scenario_id = item.input.scenario_id
-            scene_id = "unknown"
-
-            # Use the original index from the InputOutputItem
-            source_index = item.original_index
-
-            # Extract scene_id from full_state.meta_info.scene_id if available
-            if item.input.full_state and isinstance(item.input.full_state, dict):
-                meta_info = item.input.full_state.get("meta_info", {})
-                if isinstance(meta_info, dict):
-                    scene_id = meta_info.get("scene_id", f"scene_{source_index}")
-                    scene_id = (
-                        str(scene_id)
-                        if scene_id is not None
-                        else f"scene_{source_index}"
-                    )
-
-            if scenario_id not in scenarios_dict:
-                scores_path = None
-                if experiment.scores is not None:
-                    scores_path = str(
-                        Path("data") / relative_experiment_path / "scores.json"
-                    )
-
-                scenarios_dict[scenario_id] = Scenario(
-                    input_output=InputOutputFileInfo(
-                        file=input_output_path,
-                        checksum=input_output_checksum,
-                        alignment_target_filter=experiment.config.alignment_target.id,
-                    ),
-                    scores=scores_path,
-                    timing=timing_path,
-                    scenes={},
-                )
-
-            scenarios_dict[scenario_id].scenes[scene_id] = SceneInfo(
-                source_index=source_index,
-                scene_id=scene_id,
-                timing_s=experiment.timing.raw_times_s[source_index],
-            )
 
         # Create enhanced experiment
-        enhanced_exp = Experiment(parameters=parameters, scenarios=scenarios_dict)
+        enhanced_exp = Experiment(parameters=parameters, scenarios=summary.scenarios)
 
         self.experiments[exp_key] = enhanced_exp
 
         # Update indices
-        self._update_indices(exp_key, parameters, scenarios_dict.keys())
+        self._update_indices(exp_key, parameters, summary.scenarios.keys())
 
         # Update file tracking
-        self._update_file_info(input_output_path, input_output_checksum, exp_key)
+        self._update_file_info(
+            input_output_path, summary.input_output_checksum, exp_key
+        )
 
     def _update_indices(
         self, exp_key: str, parameters: Dict[str, Any], scenario_ids: List[str]
@@ -596,6 +854,7 @@ class ChunkedExperimentData(BaseModel):
     chunk_type: str  # "by_adm", "by_scenario", "by_kdma"
     experiments: List[Dict[str, Any]]
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    cascade: Optional[List[Any]] = None  # Parameter cascade index of the chunk
 
     @classmethod
     def create_adm_chunk(
@@ -620,3 +879,51 @@ class ChunkedExperimentData(BaseModel):
             experiments=[exp.model_dump() for exp in experiments],
             metadata={"scenario_id": scenario_id, "count": len(experiments)},
         )
+
+    @classmethod
+    def create_manifest_scenario_chunk(
+        cls,
+        scenario_id: str,
+        experiments: Dict[str, Experiment],
+        cascade: Optional[List[Any]] = None,
+    ) -> "ChunkedExperimentData":
+        """
+        Create a manifest shard holding every experiment's entry for a scenario.
+
+        Only the parameters the frontend selects runs by are kept, without
+        the ADM instance or inference engine configuration. cascade is the
+        scenario's scene-level nodes of the cascade index, if given.
+        """
+        chunk_experiments = []
+        for exp_key, experiment in experiments.items():
+            scenario = experiment.scenarios.get(scenario_id)
+            if scenario is None:
+                continue
+            parameters = experiment.parameters
+            llm = parameters["llm"]
+            chunk_experiments.append(
+                {
+                    "key": exp_key,
+                    "parameters": {
+                        "adm": {"name": parameters["adm"]["name"]},
+                        "llm": {"model_name": llm["model_name"]} if llm else None,
+                        "kdma_values": parameters["kdma_values"],
+                        "alignment_target_id": parameters["alignment_target_id"],
+                        "run_variant": parameters["run_variant"],
+                    },
+                    "scenario": scenario.model_dump(),
+                }
+            )
+        return cls(
+            chunk_id=f"scenario_{scenario_id}",
+            chunk_type="by_scenario",
+            experiments=chunk_experiments,
+            metadata={
+                "scenario_id": scenario_id,
+                "count": len(chunk_experiments),
+                "scenes": sum(
+                    len(exp["scenario"]["scenes"]) for exp in chunk_experiments
+                ),
+            },
+            cascade=cascade,
+        )
@@ -1,16 +1,46 @@
 """Parser for experiment directory structures using Pydantic models."""
 
+import json
+import os
 import re
+import shutil
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Tuple
 from collections import defaultdict
+from pydantic import BaseModel
 from align_browser.experiment_models import (
+    MANIFEST_VERSION,
+    DirectoryResult,
+    ExperimentConfig,
     ExperimentData,
+    ExperimentDirectory,
+    ExperimentFiles,
+    ExperimentSummary,
     Manifest,
-    InputOutputFile,
+    ManifestItem,
+    TimingData,
+    calculate_data_checksum,
+    calculate_file_checksum,
     calculate_file_checksums,
 )
+from align_browser.build_cache import BuildCache, ChecksumCache
+from align_browser.parallel import Finished, imap_ordered
+from align_browser.precompress import GZIP_SUFFIX
+from align_browser.csv_exporter import experiment_to_csv_rows
+
+# Files that must sit directly in an experiment directory, plus the Hydra
+# config directory that must hold config.yaml
+EXPERIMENT_FILES = ("input_output.json", "timing.json")
+EXPERIMENT_CONFIG_DIR = ".hydra"
+
+# Files copied from each experiment directory into the site's data directory
+EXPERIMENT_DATA_FILES = ("input_output.json", "scores.json", "timing.json")
+
+# Ways experiment files can be published into the data directory
+LINK_MODES = ("copy", "hardlink", "symlink", "reflink")
 
 
 def _extract_run_variant(
@@ -94,35 +124,33 @@ def _extract_run_variant(
     return adm_dir
 
 
-def _create_experiments_from_directory(experiment_dir: Path) -> List[ExperimentData]:
+def _create_experiments_from_directory(
+    experiment_dir: Path, files: Optional[ExperimentFiles] = None
+) -> List[ExperimentData]:
     """Create experiments from a directory, handling both uniform and mixed KDMA alignment.
 
     This unified function handles both cases:
     - Uniform KDMA: All scenes use same alignment target (defined in config.yaml)
     - Mixed KDMA: Different scenes have different alignment targets (defined per input item)
 
+    Each file of the directory is read and validated once, unless already-read
+    files are passed in, and the parsed timing and scores are shared by all
+    of the directory's experiments.
+
     Returns a list of experiments (one per unique alignment target).
     """
     experiments = []
 
-    # Load input_output using the standard method (which now sets original_index)
-    input_output = InputOutputFile.from_file(experiment_dir / "input_output.json")
-
-    # Load config to check for uniform alignment target
-    config_path = experiment_dir / ".hydra" / "config.yaml"
-    with open(config_path) as f:
-        config_data = yaml.safe_load(f)
-
-    has_config_alignment = "alignment_target" in config_data
+    directory = ExperimentDirectory.load(experiment_dir, files)
 
     # Group by alignment_target_id
     grouped_data = defaultdict(list)
 
-    for item in input_output.data:
+    for item in directory.input_output.data:
         # Determine alignment target for this item
-        if has_config_alignment:
+        if directory.has_config_alignment:
             # Uniform KDMA: Use alignment target from config for all items
-            alignment_target_id = config_data["alignment_target"]["id"]
+            alignment_target_id = directory.config.alignment_target.id
         else:
             # Mixed KDMA: Use alignment target from input item
             alignment_target_id = item.input.alignment_target_id
@@ -134,9 +162,9 @@ def _create_experiments_from_directory(experiment_dir: Path) -> List[ExperimentD
     # Create experiments for each alignment target group
     for alignment_target_id, items in grouped_data.items():
         try:
-            if has_config_alignment:
-                # Uniform KDMA: Use standard from_directory method
-                experiment = ExperimentData.from_directory(experiment_dir)
+            if directory.has_config_alignment:
+                # Uniform KDMA: The whole directory is one experiment
+                experiment = ExperimentData.from_experiment_directory(directory)
                 experiments.append(experiment)
                 break  # Only one experiment for uniform KDMA
             else:
@@ -145,6 +173,7 @@ def _create_experiments_from_directory(experiment_dir: Path) -> List[ExperimentD
                     experiment_dir,
                     alignment_target_id,
                     items,  # items already have original_index
+                    directory,
                 )
                 experiments.append(experiment)
 
@@ -157,7 +186,375 @@ def _create_experiments_from_directory(experiment_dir: Path) -> List[ExperimentD
     return experiments
 
 
-def parse_experiments_directory(experiments_root: Path) -> List[ExperimentData]:
+class DiscoveryStats(BaseModel):
+    """Counters describing how much of the filesystem discovery touched."""
+
+    directories_scanned: int = 0  # Directory listings read with os.scandir
+    stat_calls: int = 0  # Extra stat calls beyond the directory listings
+    directories_pruned: int = 0  # OUTDATED subtrees that were never entered
+    experiment_directories: int = 0
+
+
+def _scan_directory(directory: Path) -> Tuple[List[Path], List[Path], DiscoveryStats]:
+    """
+    List a directory once and classify it.
+
+    Returns the experiment directories found (the directory itself, or
+    symlinked subdirectories that are experiments), the subdirectories that
+    should be descended into, and the work done. Experiment directories are
+    leaves, and symlinked directories are never descended into, matching
+    Path.rglob.
+    """
+    stats = DiscoveryStats(directories_scanned=1)
+    file_names = set()
+    subdirs = []
+    linked_dirs = []
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_symlink():
+                        # DirEntry.is_dir() only needs a stat call for symlinks
+                        stats.stat_calls += 1
+                        if entry.is_dir():
+                            linked_dirs.append(entry.name)
+                            continue
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                        continue
+                except OSError:
+                    continue
+                file_names.add(entry.name)
+    except OSError:
+        return [], [], stats
+
+    if all(name in file_names for name in EXPERIMENT_FILES) and (
+        EXPERIMENT_CONFIG_DIR in subdirs or EXPERIMENT_CONFIG_DIR in linked_dirs
+    ):
+        stats.stat_calls += 1
+        if (directory / EXPERIMENT_CONFIG_DIR / "config.yaml").is_file():
+            stats.experiment_directories += 1
+            return [directory], [], stats
+
+    experiment_dirs = []
+    descend = []
+    for name in sorted(subdirs + linked_dirs):
+        if name == EXPERIMENT_CONFIG_DIR:
+            continue
+        # Skip directories containing "OUTDATED" without walking their contents
+        if "OUTDATED" in name.upper():
+            stats.directories_pruned += 1
+            continue
+        if name in linked_dirs:
+            stats.stat_calls += len(EXPERIMENT_FILES) + 1
+            if ExperimentData.has_required_files(directory / name):
+                stats.experiment_directories += 1
+                experiment_dirs.append(directory / name)
+            continue
+        descend.append(directory / name)
+
+    return experiment_dirs, descend, stats
+
+
+def discover_experiment_directories(
+    experiments_root: Path, threads: int = 1
+) -> Tuple[List[Path], DiscoveryStats]:
+    """
+    Find all experiment directories under experiments_root.
+
+    Walks the tree with os.scandir, checking for the required files from each
+    directory listing. Subtrees with "OUTDATED" in their name are pruned before
+    they are entered, and the walk does not descend into experiment
+    directories. Each level of the tree can be scanned on a thread pool, which
+    helps on network filesystems where every listing is a round trip.
+
+    Args:
+        experiments_root: Path to the root experiments directory or a direct experiment directory
+        threads: Number of threads used to scan directories
+
+    Returns:
+        Tuple of (experiment directories in sorted path order, discovery stats)
+    """
+    total = DiscoveryStats()
+    experiment_dirs = []
+    frontier = [experiments_root]
+
+    executor = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+    try:
+        while frontier:
+            if executor:
+                results = executor.map(_scan_directory, frontier)
+            else:
+                results = map(_scan_directory, frontier)
+
+            next_frontier = []
+            for found, subdirs, stats in results:
+                total.directories_scanned += stats.directories_scanned
+                total.stat_calls += stats.stat_calls
+                total.directories_pruned += stats.directories_pruned
+                total.experiment_directories += stats.experiment_directories
+                experiment_dirs.extend(found)
+                next_frontier.extend(subdirs)
+            frontier = next_frontier
+    finally:
+        if executor:
+            executor.shutdown()
+
+    # Breadth-first scanning finishes levels out of depth-first order, so sort
+    # to keep the result independent of the number of threads
+    experiment_dirs.sort(key=lambda path: path.relative_to(experiments_root).parts)
+
+    return experiment_dirs, total
+
+
+def _parse_experiment_directory(
+    experiment_dir: Path,
+) -> Tuple[List[ExperimentData], Optional[str]]:
+    """Parse one experiment directory, returning its experiments and any error.
+
+    Errors are returned rather than printed so that results coming back from
+    worker processes are reported in discovery order.
+    """
+    try:
+        return _create_experiments_from_directory(experiment_dir), None
+    except Exception as e:
+        return [], f"Error processing {experiment_dir}: {e}"
+
+
+class IngestReport(BaseModel):
+    """What a parse worker did with a directory's files besides decoding them."""
+
+    input_output_checksum: str = ""
+    # [st_dev, st_ino, st_size, st_mtime_ns] of input_output.json when the
+    # checksum was calculated from the ingested contents
+    input_output_identity: Optional[List[int]] = None
+    files_written: int = 0  # Published copies written from the read buffer
+    bytes_written: int = 0
+
+
+def _copy_is_current(source_stat: os.stat_result, target: Path) -> bool:
+    """Check whether target is a plain copy matching source's size and mtime."""
+    try:
+        target_stat = os.stat(target, follow_symlinks=False)
+    except OSError:
+        return False
+    return (
+        target_stat.st_size == source_stat.st_size
+        and target_stat.st_mtime_ns == source_stat.st_mtime_ns
+        and (target_stat.st_dev, target_stat.st_ino)
+        != (source_stat.st_dev, source_stat.st_ino)
+    )
+
+
+def _ingest_file(
+    source: Path, target: Optional[Path], report: IngestReport
+) -> Tuple[bytes, os.stat_result]:
+    """
+    Read a file once, optionally writing its published copy from the same buffer.
+
+    The copy is written under a temporary name, given the source's mtime and
+    permissions like shutil.copy2, and moved into place. It is skipped when
+    target already matches the source.
+
+    Returns:
+        Tuple of (file contents, stat of the file that was read)
+    """
+    with open(source, "rb") as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+
+    if target is not None and not _copy_is_current(stat, target):
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_target = target.with_name(f".{target.name}.tmp")
+        temp_target.unlink(missing_ok=True)
+        with open(temp_target, "wb") as f:
+            f.write(data)
+        os.chmod(temp_target, stat.st_mode & 0o7777)
+        os.utime(temp_target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(temp_target, target)
+        report.files_written += 1
+        report.bytes_written += len(data)
+
+    return data, stat
+
+
+def _ingest_experiment_directory(
+    experiment_dir: Path,
+    input_output_checksum: Optional[str] = None,
+    target_dir: Optional[Path] = None,
+) -> Tuple[ExperimentFiles, IngestReport]:
+    """
+    Read each file of an experiment directory exactly once.
+
+    The JSON files are decoded from the bytes that were read. The
+    input_output.json checksum is calculated from the same bytes unless it is
+    already known, and when target_dir is given the data files are copied
+    there from the same bytes too.
+    """
+    report = IngestReport()
+
+    def ingest(name: str) -> Tuple[Any, os.stat_result]:
+        target = target_dir / name if target_dir is not None else None
+        data, stat = _ingest_file(experiment_dir / name, target, report)
+        if name == "input_output.json":
+            if input_output_checksum is None:
+                report.input_output_checksum = calculate_data_checksum(data)
+                report.input_output_identity = [
+                    stat.st_dev,
+                    stat.st_ino,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ]
+            else:
+                report.input_output_checksum = input_output_checksum
+        return json.loads(data), stat
+
+    with open(experiment_dir / EXPERIMENT_CONFIG_DIR / "config.yaml") as f:
+        config = yaml.safe_load(f)
+
+    input_output, _ = ingest("input_output.json")
+    timing, _ = ingest("timing.json")
+    scores = None
+    if (experiment_dir / "scores.json").exists():
+        scores, _ = ingest("scores.json")
+
+    files = ExperimentFiles(
+        config=config, input_output=input_output, timing=timing, scores=scores
+    )
+    return files, report
+
+
+def _summarize_manifest_only(
+    experiment_dir: Path,
+    files: ExperimentFiles,
+    experiments_root: Path,
+    input_output_checksum: str,
+) -> List[ExperimentSummary]:
+    """
+    Summarize a directory for the manifest without building full item models.
+
+    Mirrors _create_experiments_from_directory followed by
+    ExperimentSummary.from_experiment, but only projects the manifest fields
+    of each input_output item and does not validate scores.json.
+    """
+    config = ExperimentConfig(**files.config)
+    timing = TimingData(**files.timing)
+    items = ManifestItem.from_data(files.input_output)
+
+    # Group by alignment_target_id, as _create_experiments_from_directory does
+    grouped_items = defaultdict(list)
+    if "alignment_target" in files.config:
+        if items:
+            grouped_items[config.alignment_target.id] = items
+    else:
+        for item in items:
+            grouped_items[item.alignment_target_id or "unaligned"].append(item)
+
+    summaries = []
+    for alignment_target_id, target_items in grouped_items.items():
+        try:
+            target_config = config
+            if "alignment_target" not in files.config:
+                target_config = config.with_alignment_target_id(alignment_target_id)
+            summaries.append(
+                ExperimentSummary.from_manifest_items(
+                    target_config,
+                    experiment_dir,
+                    experiments_root,
+                    input_output_checksum,
+                    target_items,
+                    timing.raw_times_s,
+                    has_scores=files.scores is not None,
+                )
+            )
+        except Exception as e:
+            print(f"Error adding experiment {experiment_dir}: {e}")
+    return summaries
+
+
+def _summarize_experiment_directory(
+    experiment_dir: Path,
+    input_output_checksum: Optional[str],
+    experiments_root: Path,
+    publish_dir: Optional[Path] = None,
+    manifest_only: bool = False,
+) -> Tuple[DirectoryResult, IngestReport]:
+    """Parse one experiment directory into manifest summaries and CSV rows.
+
+    Each file is read once (see _ingest_experiment_directory). When
+    publish_dir is given, copies of the data files are written below it at
+    the directory's path relative to experiments_root. With manifest_only,
+    only the manifest summaries are built, skipping full validation of the
+    input_output items and the CSV rows that need it.
+    """
+    target_dir = None
+    if publish_dir is not None:
+        target_dir = publish_dir / experiment_dir.relative_to(experiments_root)
+
+    try:
+        files, report = _ingest_experiment_directory(
+            experiment_dir, input_output_checksum, target_dir
+        )
+        if manifest_only:
+            summaries = _summarize_manifest_only(
+                experiment_dir, files, experiments_root, report.input_output_checksum
+            )
+        else:
+            experiments = _create_experiments_from_directory(experiment_dir, files)
+    except Exception as e:
+        result = DirectoryResult(
+            experiment_dir=experiment_dir,
+            error=f"Error processing {experiment_dir}: {e}",
+            manifest_only=manifest_only,
+        )
+        return result, IngestReport()
+    input_output_checksum = report.input_output_checksum
+
+    if manifest_only:
+        result = DirectoryResult(
+            experiment_dir=experiment_dir, summaries=summaries, manifest_only=True
+        )
+        return result, report
+
+    result = DirectoryResult(experiment_dir=experiment_dir)
+    for experiment in experiments:
+        try:
+            result.summaries.append(
+                ExperimentSummary.from_experiment(
+                    experiment, experiments_root, input_output_checksum
+                )
+            )
+        except Exception as e:
+            print(f"Error adding experiment {experiment.experiment_path}: {e}")
+
+        try:
+            result.csv_rows.extend(experiment_to_csv_rows(experiment, experiments_root))
+        except Exception as e:
+            print(
+                f"Warning: Failed to export experiment {experiment.experiment_path}: {e}"
+            )
+
+    return result, report
+
+
+def _discover_and_report(experiments_root: Path, discovery_threads: int) -> List[Path]:
+    """Discover experiment directories and print a summary of the walk."""
+    experiment_dirs, stats = discover_experiment_directories(
+        experiments_root, threads=discovery_threads
+    )
+    print(
+        f"Found {len(experiment_dirs)} experiment directories "
+        f"({stats.directories_scanned} directories scanned, "
+        f"{stats.stat_calls} extra stat calls, "
+        f"{stats.directories_pruned} OUTDATED directories skipped)"
+    )
+    return experiment_dirs
+
+
+def parse_experiments_directory(
+    experiments_root: Path, jobs: int = 1, discovery_threads: int = 1
+) -> List[ExperimentData]:
     """
     Parse the experiments directory structure and return a list of ExperimentData.
 
@@ -166,137 +563,338 @@ def parse_experiments_directory(experiments_root: Path) -> List[ExperimentData]:
     that contain the required experiment files (input_output.json, timing.json,
     and .hydra/config.yaml). scores.json is optional.
 
+    Directories are discovered up front and then parsed, optionally on a pool of
+    worker processes. Results are collected in discovery order, so the output is
+    the same regardless of the number of jobs. Use iter_experiments_directory
+    to process experiments without holding them all in memory.
+
     Args:
         experiments_root: Path to the root experiments directory or a direct experiment directory
+        jobs: Number of worker processes used for parsing (0 uses one per CPU core)
+        discovery_threads: Number of threads used to walk the directory tree
 
     Returns:
         List of successfully parsed ExperimentData objects
     """
-    experiments = []
-
-    directories_found = 0
-    directories_with_files = 0
-    directories_processed = 0
-
-    # First check if the root path itself is an experiment directory
-    if ExperimentData.has_required_files(experiments_root):
-        directories_found += 1
-        directories_with_files += 1
+    return list(iter_experiments_directory(experiments_root, jobs, discovery_threads))
 
-        try:
-            directory_experiments = _create_experiments_from_directory(experiments_root)
-            experiments.extend(directory_experiments)
-            directories_processed += 1
-        except Exception as e:
-            print(f"Error processing {experiments_root}: {e}")
 
-    # Recursively find all directories that have required experiment files
-    for experiment_dir in experiments_root.rglob("*"):
-        if not experiment_dir.is_dir():
-            continue
-
-        directories_found += 1
+def iter_experiments_directory(
+    experiments_root: Path, jobs: int = 1, discovery_threads: int = 1
+) -> Iterator[ExperimentData]:
+    """
+    Parse the experiments directory, yielding ExperimentData in discovery order.
 
-        # Skip directories containing "OUTDATED" in their path
-        if "OUTDATED" in str(experiment_dir).upper():
+    Like parse_experiments_directory, but only the experiments of the
+    directories being parsed are held in memory at a time.
+    """
+    experiment_dirs = _discover_and_report(experiments_root, discovery_threads)
+    if len(experiment_dirs) < 2:
+        jobs = 1
+
+    for directory_experiments, error in imap_ordered(
+        _parse_experiment_directory,
+        ((experiment_dir,) for experiment_dir in experiment_dirs),
+        jobs,
+    ):
+        if error:
+            print(error)
             continue
+        yield from directory_experiments
+
+
+def summarize_experiments_directory(
+    experiments_root: Path,
+    jobs: int = 1,
+    discovery_threads: int = 1,
+    cache: Optional[BuildCache] = None,
+    checksum_cache: Optional[ChecksumCache] = None,
+    publish_dir: Optional[Path] = None,
+    manifest_only: bool = False,
+) -> List[DirectoryResult]:
+    """
+    Parse the experiments directory into per-directory summaries and CSV rows.
 
-        # Check if directory has all required files
-        if not ExperimentData.has_required_files(experiment_dir):
-            continue
+    Collects the results of iter_experiment_results into a list; see there
+    for the arguments.
 
-        directories_with_files += 1
+    Returns:
+        List of DirectoryResult objects in discovery order
+    """
+    return list(
+        iter_experiment_results(
+            experiments_root,
+            jobs=jobs,
+            discovery_threads=discovery_threads,
+            cache=cache,
+            checksum_cache=checksum_cache,
+            publish_dir=publish_dir,
+            manifest_only=manifest_only,
+        )
+    )
 
-        try:
-            directory_experiments = _create_experiments_from_directory(experiment_dir)
-            experiments.extend(directory_experiments)
-            directories_processed += 1
 
-        except Exception as e:
-            print(f"Error processing {experiment_dir}: {e}")
-            continue
+def iter_experiment_results(
+    experiments_root: Path,
+    jobs: int = 1,
+    discovery_threads: int = 1,
+    cache: Optional[BuildCache] = None,
+    checksum_cache: Optional[ChecksumCache] = None,
+    publish_dir: Optional[Path] = None,
+    manifest_only: bool = False,
+) -> Iterator[DirectoryResult]:
+    """
+    Parse the experiments directory, yielding per-directory summaries and CSV rows.
+
+    Like parse_experiments_directory, but yields only what the build needs
+    from each directory, in discovery order. Only the directories being
+    parsed (at most two per job) and the result being consumed are held in
+    memory, so a consumer that writes out each result before taking the next
+    uses memory independent of the size of the experiments tree. When a
+    cache is given, directories whose files are unchanged since the last
+    build are loaded from it instead of parsed.
+
+    Every file of a directory that needs parsing is read exactly once: the
+    input_output.json checksum is calculated from the bytes that are decoded
+    (unless the checksum cache already knows the file), and when publish_dir
+    is given the data files are copied there from the same bytes. Directories
+    loaded from the cache are not read at all, so publish_dir does not
+    replace a sync of the data directory.
+
+    With manifest_only, directories are summarized from a projection of the
+    manifest fields of their input_output items instead of full models, and
+    no CSV rows are produced. Cached full results are reused in this mode,
+    but manifest-only results are never used for a full build.
 
-    return experiments
+    Args:
+        experiments_root: Path to the root experiments directory or a direct experiment directory
+        jobs: Number of worker processes used for parsing (0 uses one per CPU core)
+        discovery_threads: Number of threads used to walk the directory tree
+        cache: Optional BuildCache holding results from previous builds
+        checksum_cache: Optional ChecksumCache holding checksums from previous builds
+        publish_dir: Optional data directory to copy parsed files into
+        manifest_only: Skip full validation and CSV rows, for manifest-only builds
+
+    Yields:
+        DirectoryResult objects in discovery order
+    """
+    experiment_dirs = _discover_and_report(experiments_root, discovery_threads)
+    if len(experiment_dirs) < 2:
+        jobs = 1
+
+    def tasks():
+        for experiment_dir in experiment_dirs:
+            cached = (
+                cache.get(experiment_dir, experiments_root, manifest_only)
+                if cache
+                else None
+            )
+            input_output_path = experiment_dir / "input_output.json"
+            if cached is not None:
+                if checksum_cache:
+                    checksum_cache.keep(input_output_path)
+                yield Finished((cached, None))
+                continue
+            known_checksum = (
+                checksum_cache.lookup(input_output_path) if checksum_cache else None
+            )
+            yield (experiment_dir, known_checksum)
+
+    files_written = 0
+    bytes_written = 0
+    for result, report in imap_ordered(
+        partial(
+            _summarize_experiment_directory,
+            experiments_root=experiments_root,
+            publish_dir=publish_dir,
+            manifest_only=manifest_only,
+        ),
+        tasks(),
+        jobs,
+    ):
+        if report is not None:
+            # Freshly parsed rather than loaded from the cache
+            if cache:
+                cache.put(result, experiments_root)
+            if checksum_cache and report.input_output_identity:
+                checksum_cache.record(
+                    report.input_output_identity, report.input_output_checksum
+                )
+            files_written += report.files_written
+            bytes_written += report.bytes_written
+        if result.error:
+            print(result.error)
+        yield result
+
+    if cache:
+        print(f"Build cache: {cache.hits} hits, {cache.misses} misses")
+    if checksum_cache:
+        print(
+            f"Checksum cache: {checksum_cache.hits} hits, {checksum_cache.misses} misses"
+        )
+    if publish_dir is not None:
+        print(
+            f"Copied {files_written} data files "
+            f"({bytes_written / 1e6:.1f} MB) while parsing"
+        )
 
 
 def build_manifest_from_experiments(
-    experiments: List[ExperimentData], experiments_root: Path
+    experiments: Iterable[ExperimentData], experiments_root: Path
 ) -> Manifest:
     """
-    Build the enhanced global manifest from a list of parsed experiments.
+    Build the enhanced global manifest from parsed experiments.
 
     Uses the new flexible parameter-based structure with integrity validation
-    and fast lookup indices.
+    and fast lookup indices. Experiments are consumed one at a time and only
+    their summaries are kept, so a generator such as
+    iter_experiments_directory can be passed to avoid holding every
+    experiment in memory.
 
     Args:
-        experiments: List of ExperimentData objects
+        experiments: Iterable of ExperimentData objects
         experiments_root: Path to experiments root (for calculating relative paths)
 
     Returns:
         Manifest object with new structure
     """
-    from datetime import datetime, timezone
+    # Experiments of a mixed KDMA directory share one input_output.json
+    source_file_checksums: Dict[Path, str] = {}
+    summaries = []
+    for experiment in experiments:
+        input_output_path = experiment.experiment_path / "input_output.json"
+        if input_output_path not in source_file_checksums:
+            source_file_checksums[input_output_path] = calculate_file_checksum(
+                input_output_path
+            )
+        summaries.append(
+            ExperimentSummary.from_experiment(
+                experiment,
+                experiments_root,
+                source_file_checksums[input_output_path],
+            )
+        )
 
-    # Initialize manifest
-    manifest = Manifest(
-        manifest_version="2.0", generated_at=datetime.now(timezone.utc).isoformat()
-    )
+    return build_manifest_from_summaries(summaries, experiments_root)
 
-    # Collect all input_output files for checksum calculation
-    input_output_files = set()
-    for experiment in experiments:
-        # Add default input_output.json path
-        input_output_files.add(experiment.experiment_path / "input_output.json")
 
-    # Calculate checksums for all files
-    source_file_checksums = calculate_file_checksums(list(input_output_files))
+def resolve_run_variants(
+    summaries: List[ExperimentSummary], experiments_root: Path
+) -> List[ExperimentSummary]:
+    """
+    Tell apart experiments with identical parameters by their run_variant.
+
+    Experiments whose parameters conflict get a run_variant derived from
+    their directory structure; the others are returned unchanged.
+
+    Args:
+        summaries: List of ExperimentSummary objects
+        experiments_root: Path to experiments root
 
+    Returns:
+        List of ExperimentSummary objects with resolved run variants
+    """
     # Process experiments with conflict detection similar to original
     # First pass: detect conflicts by grouping experiments by their base parameters
-    base_key_groups: Dict[str, List[ExperimentData]] = {}
+    base_key_groups: Dict[str, List[ExperimentSummary]] = {}
 
-    for experiment in experiments:
+    for summary in summaries:
         # Group experiments by their full key (including default run_variant)
-        base_key = experiment.config.generate_key()
+        base_key = summary.config.generate_key()
 
         if base_key not in base_key_groups:
             base_key_groups[base_key] = []
-        base_key_groups[base_key].append(experiment)
+        base_key_groups[base_key].append(summary)
 
     # Second pass: add run_variant for conflicts and process all experiments
-    enhanced_experiments = []
+    enhanced_summaries = []
 
-    for base_key, group_experiments in base_key_groups.items():
-        if len(group_experiments) == 1:
+    for base_key, group_summaries in base_key_groups.items():
+        if len(group_summaries) == 1:
             # No conflict, use original experiment
-            enhanced_experiments.append(group_experiments[0])
+            enhanced_summaries.append(group_summaries[0])
         else:
             # Conflict detected - add run_variant from directory structure
-            conflicting_dirs = [exp.experiment_path for exp in group_experiments]
-            for experiment in group_experiments:
+            conflicting_dirs = [summary.experiment_path for summary in group_summaries]
+            for summary in group_summaries:
                 run_variant = _extract_run_variant(
-                    experiment.experiment_path, experiments_root, conflicting_dirs
+                    summary.experiment_path, experiments_root, conflicting_dirs
                 )
                 # Always create experiment with run_variant (will be "default" if not extracted)
-                enhanced_config = experiment.config.model_copy(deep=True)
+                enhanced_config = summary.config.model_copy(deep=True)
                 enhanced_config.run_variant = run_variant
 
-                enhanced_experiment = ExperimentData(
-                    config=enhanced_config,
-                    input_output=experiment.input_output,
-                    scores=experiment.scores,
-                    timing=experiment.timing,
-                    experiment_path=experiment.experiment_path,
+                enhanced_summaries.append(
+                    summary.model_copy(update={"config": enhanced_config})
                 )
 
-                enhanced_experiments.append(enhanced_experiment)
+    return enhanced_summaries
+
+
+def run_variant_changes(
+    summaries: List[ExperimentSummary], experiments_root: Path
+) -> Dict[Tuple[str, str], str]:
+    """
+    Find the experiments whose run_variant is changed by resolve_run_variants.
+
+    CSV rows are written before every experiment is known, with the
+    run_variant of the experiment's own config; this tells which rows must
+    be rewritten to match the manifest.
+
+    Returns:
+        Mapping of (experiment_path, alignment_target_id), as in the CSV
+        columns, to the resolved run_variant
+    """
+
+    def csv_key(summary: ExperimentSummary) -> Tuple[str, str]:
+        return (
+            str(summary.experiment_path.relative_to(experiments_root)),
+            summary.config.alignment_target.id,
+        )
+
+    written = {
+        csv_key(summary): summary.config.run_variant or "default"
+        for summary in summaries
+    }
+    return {
+        csv_key(summary): summary.config.run_variant
+        for summary in resolve_run_variants(summaries, experiments_root)
+        if summary.config.run_variant != written[csv_key(summary)]
+    }
+
+
+def build_manifest_from_summaries(
+    summaries: List[ExperimentSummary], experiments_root: Path
+) -> Manifest:
+    """
+    Build the enhanced global manifest from experiment summaries.
+
+    Detects experiments with identical parameters and tells them apart with a
+    run_variant derived from their directory structure.
+
+    Args:
+        summaries: List of ExperimentSummary objects
+        experiments_root: Path to experiments root (for calculating relative paths)
+
+    Returns:
+        Manifest object with new structure
+    """
+    from datetime import datetime, timezone
+
+    # Initialize manifest
+    manifest = Manifest(
+        manifest_version=MANIFEST_VERSION,
+        generated_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+    enhanced_summaries = resolve_run_variants(summaries, experiments_root)
 
     # Add experiments to enhanced manifest
-    for experiment in enhanced_experiments:
+    for summary in enhanced_summaries:
         try:
-            manifest.add_experiment(experiment, experiments_root, source_file_checksums)
+            manifest.add_summary(summary, experiments_root)
         except Exception as e:
-            print(f"Error adding experiment {experiment.experiment_path}: {e}")
+            print(f"Error adding experiment {summary.experiment_path}: {e}")
             continue
 
     # Add metadata
@@ -312,39 +910,245 @@ def build_manifest_from_experiments(
     return manifest
 
 
-def copy_experiment_files(
-    experiments: List[ExperimentData], experiments_root: Path, data_output_dir: Path
-):
+class SyncStats(BaseModel):
+    """Counters describing what a data directory sync did."""
+
+    files_copied: int = 0  # Written as full copies
+    bytes_copied: int = 0
+    files_linked: int = 0  # Published as hardlinks, symlinks or reflinks
+    link_fallbacks: int = 0  # Links that were not possible and were copied instead
+    files_skipped: int = 0  # Destination already up to date
+    bytes_skipped: int = 0
+    files_deleted: int = 0  # Orphans with no source experiment
+
+
+# Linux ioctl request that clones a file's extents (copy-on-write reflink)
+FICLONE = 0x40049409
+
+
+def _reflink_file(source: Path, target: Path):
+    """Create target as a copy-on-write clone of source."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("reflinks are not supported on this platform")
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    shutil.copystat(source, target)
+
+
+def _publish_file(source: Path, target: Path, link_mode: str) -> bool:
+    """
+    Write target from source using link_mode.
+
+    The file is created under a temporary name and moved into place, so
+    readers never see a partial file. Links that cannot be created (a
+    hardlink across filesystems, a filesystem without reflinks) fall back to
+    a copy.
+
+    Returns:
+        True if the file was linked, False if it was copied
+    """
+    temp_target = target.with_name(f".{target.name}.tmp")
+    temp_target.unlink(missing_ok=True)
+
+    linked = False
+    try:
+        if link_mode == "hardlink":
+            os.link(source, temp_target)
+            linked = True
+        elif link_mode == "symlink":
+            os.symlink(os.path.abspath(source), temp_target)
+            linked = True
+        elif link_mode == "reflink":
+            _reflink_file(source, temp_target)
+            linked = True
+    except OSError:
+        temp_target.unlink(missing_ok=True)
+
+    if not linked:
+        # copy2 keeps the source mtime so the next sync can compare it
+        shutil.copy2(source, temp_target)
+
+    os.replace(temp_target, target)
+    return linked
+
+
+def _files_match(
+    source: Path,
+    target: Path,
+    compare: str,
+    checksums: Optional[Dict[str, str]] = None,
+) -> bool:
+    """
+    Check whether target is an up to date copy of source.
+
+    With compare "checksum", checksums calculated up front are used when
+    given, and the files are hashed otherwise.
+    """
+    try:
+        source_stat = source.stat()
+        target_stat = target.stat()
+    except OSError:
+        return False
+
+    if source_stat.st_size != target_stat.st_size:
+        return False
+    if compare == "checksum":
+        checksums = checksums or {}
+
+        def checksum(path: Path) -> str:
+            known = checksums.get(str(path))
+            return known if known is not None else calculate_file_checksum(path)
+
+        return checksum(source) == checksum(target)
+    return source_stat.st_mtime_ns == target_stat.st_mtime_ns
+
+
+def _needs_content_check(source: Path, target: Path) -> bool:
+    """Check whether deciding if target is up to date may need both checksums."""
+    try:
+        if target.is_symlink() or os.path.samefile(source, target):
+            return False
+        return source.stat().st_size == target.stat().st_size
+    except OSError:
+        return False
+
+
+def _target_up_to_date(
+    source: Path,
+    target: Path,
+    compare: str,
+    link_mode: str,
+    checksums: Optional[Dict[str, str]] = None,
+) -> bool:
+    """Check whether target already publishes source the way link_mode asks."""
+    if target.is_symlink():
+        return link_mode == "symlink" and os.readlink(target) == os.path.abspath(source)
+    if link_mode == "symlink" or not target.exists():
+        return False
+
+    is_hardlink = os.path.samefile(source, target)
+    if link_mode == "hardlink":
+        if is_hardlink:
+            return True
+        # A copy is the best possible result across filesystems
+        if source.stat().st_dev != target.parent.stat().st_dev:
+            return _files_match(source, target, compare, checksums)
+        return False
+
+    # A hardlink shares the source's inode, so it is not a real copy
+    return not is_hardlink and _files_match(source, target, compare, checksums)
+
+
+def sync_experiment_files(
+    experiment_dirs: List[Path],
+    experiments_root: Path,
+    data_output_dir: Path,
+    compare: str = "mtime",
+    link_mode: str = "copy",
+    checksum_cache: Optional[ChecksumCache] = None,
+) -> SyncStats:
     """
-    Copy experiment files to the output data directory.
+    Incrementally sync experiment files into the output data directory.
+
+    Only files that are new or differ from their existing copy are written,
+    each through a temporary file so readers never see a partial file.
+    Experiment files in the output that no longer have a source are deleted,
+    along with their gzip siblings and the directories they leave empty.
+    Other files and directories in data_output_dir (the manifest, its
+    shards and the CSV exports) are left alone, even when empty.
+
+    Files can be published as hardlinks, symlinks or reflinks instead of
+    copies, which avoids duplicating large result trees.
 
     Args:
-        experiments: List of ExperimentData objects
+        experiment_dirs: Experiment directories whose files should be published
         experiments_root: Path to experiments root
         data_output_dir: Path to output data directory
+        compare: "mtime" compares size and modification time, "checksum"
+            compares size and SHA256 of the contents
+        link_mode: One of LINK_MODES ("copy", "hardlink", "symlink", "reflink")
+        checksum_cache: Optional ChecksumCache used when compare is "checksum"
+
+    Returns:
+        SyncStats describing the files copied, linked, skipped and deleted
     """
-    import shutil
+    if link_mode not in LINK_MODES:
+        raise ValueError(
+            f"Unknown link mode {link_mode!r}, expected one of {LINK_MODES}"
+        )
 
-    for experiment in experiments:
+    stats = SyncStats()
+    expected_targets = set()
+    files = []
+
+    for experiment_dir in experiment_dirs:
         # Determine relative path for copying
-        relative_experiment_path = experiment.experiment_path.relative_to(
-            experiments_root
-        )
+        relative_experiment_path = experiment_dir.relative_to(experiments_root)
         target_experiment_dir = data_output_dir / relative_experiment_path
-        target_experiment_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy relevant files
-        shutil.copy(
-            experiment.experiment_path / "input_output.json",
-            target_experiment_dir / "input_output.json",
+        for file_name in EXPERIMENT_DATA_FILES:
+            source = experiment_dir / file_name
+            target = target_experiment_dir / file_name
+            if target in expected_targets or not source.exists():
+                continue
+            expected_targets.add(target)
+            files.append((source, target))
+
+    # Hash every pair that needs a content comparison on a thread pool first
+    checksums = None
+    if compare == "checksum":
+        checksums = calculate_file_checksums(
+            [
+                path
+                for source, target in files
+                if _needs_content_check(source, target)
+                for path in (source, target)
+            ],
+            cache=checksum_cache,
         )
 
-        # Copy scores.json if it exists
-        scores_path = experiment.experiment_path / "scores.json"
-        if scores_path.exists():
-            shutil.copy(scores_path, target_experiment_dir / "scores.json")
+    for source, target in files:
+        size = source.stat().st_size
+        if _target_up_to_date(source, target, compare, link_mode, checksums):
+            stats.files_skipped += 1
+            stats.bytes_skipped += size
+            continue
 
-        shutil.copy(
-            experiment.experiment_path / "timing.json",
-            target_experiment_dir / "timing.json",
-        )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if _publish_file(source, target, link_mode):
+            stats.files_linked += 1
+        else:
+            if link_mode != "copy":
+                stats.link_fallbacks += 1
+            stats.files_copied += 1
+            stats.bytes_copied += size
+
+    # Remove experiment files whose source is gone
+    orphan_dirs = set()
+    for dirpath, dirnames, filenames in os.walk(data_output_dir):
+        directory = Path(dirpath)
+        for file_name in filenames:
+            # Gzip siblings are removed along with their data file
+            data_file_name = file_name.removesuffix(GZIP_SUFFIX)
+            if (
+                data_file_name in EXPERIMENT_DATA_FILES
+                and directory / data_file_name not in expected_targets
+            ):
+                (directory / file_name).unlink()
+                stats.files_deleted += 1
+                orphan_dirs.add(directory)
+
+    # Then the directories they left empty, up to the first one that is not
+    for directory in sorted(orphan_dirs, key=lambda path: -len(path.parts)):
+        while (
+            directory != data_output_dir
+            and directory.is_dir()
+            and not any(directory.iterdir())
+        ):
+            directory.rmdir()
+            directory = directory.parent
+
+    return stats
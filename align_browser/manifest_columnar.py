@@ -0,0 +1,144 @@
+"""Dictionary-encoded columnar layout of the manifest (manifest v3)."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+from align_browser.cascade_index import build_cascade_index, js_object_items
+from align_browser.experiment_models import Manifest
+
+COLUMNAR_MANIFEST_VERSION = "3.0"
+COLUMNAR_MANIFEST_FILE = "manifest_v3.json"
+
+
+class _StringTable:
+    """Assign each distinct value a code, in order of first use."""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: Any) -> int:
+        # Values may be lists of dicts (KDMA values), so key them by their JSON
+        key = json.dumps(value, sort_keys=True)
+        code = self._codes.get(key)
+        if code is None:
+            code = len(self.values)
+            self._codes[key] = code
+            self.values.append(value)
+        return code
+
+
+def encode_columnar_manifest(manifest: Manifest) -> Dict[str, Any]:
+    """
+    Encode the parts of a manifest the frontend uses as columns.
+
+    Strings (ADM and LLM names, KDMA value sets, run variants, scenario
+    and scene IDs, file paths) are stored once in "tables" and referred to
+    by their index. "experiments" holds one value per experiment (in the
+    order of tables["experiment"]) and "scenes" one value per scene of
+    each experiment's scenarios, in the order the frontend iterates the
+    full manifest (see js_object_items).
+    The ADM instance and inference engine configuration are left out.
+    "cascade" holds the cascade index (see build_cascade_index) with
+    table codes as node values.
+
+    An experiment's scenarios share its input_output, timing and scores
+    files, so file paths and checksums are stored per experiment.
+    """
+    tables = {
+        name: _StringTable()
+        for name in (
+            "adm",
+            "llm",
+            "kdma_values",
+            "run_variant",
+            "scenario",
+            "scene",
+            "path",
+        )
+    }
+    experiments = {
+        name: []
+        for name in (
+            "adm",
+            "llm",
+            "kdma_values",
+            "run_variant",
+            "input_output",
+            "checksum",
+            "timing",
+            "scores",
+        )
+    }
+    scenes = {
+        name: []
+        for name in ("experiment", "scenario", "scene", "source_index", "timing_s")
+    }
+
+    experiment_keys = []
+    for exp_key, experiment in js_object_items(manifest.experiments):
+        if not experiment.scenarios:
+            continue
+        experiment_code = len(experiment_keys)
+        experiment_keys.append(exp_key)
+
+        parameters = experiment.parameters
+        llm = parameters["llm"]
+        experiments["adm"].append(tables["adm"].code(parameters["adm"]["name"]))
+        experiments["llm"].append(
+            tables["llm"].code(llm["model_name"] if llm else None)
+        )
+        experiments["kdma_values"].append(
+            tables["kdma_values"].code(parameters["kdma_values"])
+        )
+        experiments["run_variant"].append(
+            tables["run_variant"].code(parameters["run_variant"])
+        )
+
+        first_scenario = next(iter(experiment.scenarios.values()))
+        experiments["input_output"].append(
+            tables["path"].code(first_scenario.input_output.file)
+        )
+        experiments["checksum"].append(first_scenario.input_output.checksum)
+        experiments["timing"].append(tables["path"].code(first_scenario.timing))
+        experiments["scores"].append(
+            tables["path"].code(first_scenario.scores)
+            if first_scenario.scores is not None
+            else -1
+        )
+
+        for scenario_id, scenario in js_object_items(experiment.scenarios):
+            scenario_code = tables["scenario"].code(scenario_id)
+            for scene_id, scene in js_object_items(scenario.scenes):
+                scenes["experiment"].append(experiment_code)
+                scenes["scenario"].append(scenario_code)
+                scenes["scene"].append(tables["scene"].code(scene_id))
+                scenes["source_index"].append(scene.source_index)
+                scenes["timing_s"].append(scene.timing_s)
+
+    return {
+        "manifest_version": COLUMNAR_MANIFEST_VERSION,
+        "generated_at": manifest.generated_at,
+        "metadata": manifest.metadata,
+        "tables": {
+            "experiment": experiment_keys,
+            **{name: table.values for name, table in tables.items()},
+        },
+        "experiments": experiments,
+        "scenes": scenes,
+        # Nodes hold table codes, like the columns
+        "cascade": build_cascade_index(
+            manifest, lambda parameter, value: tables[parameter].code(value)
+        ),
+    }
+
+
+def write_columnar_manifest(manifest: Manifest, data_output_dir: Path) -> Path:
+    """Write the columnar manifest next to manifest.json and return its path."""
+    path = data_output_dir / COLUMNAR_MANIFEST_FILE
+    with open(path.with_name(f".{COLUMNAR_MANIFEST_FILE}.tmp"), "w") as f:
+        json.dump(encode_columnar_manifest(manifest), f, separators=(",", ":"))
+    os.replace(path.with_name(f".{COLUMNAR_MANIFEST_FILE}.tmp"), path)
+    return path
@@ -0,0 +1,108 @@
+"""Per-scenario manifest shards that let the frontend load the manifest lazily."""
+
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from align_browser.cascade_index import build_cascade_index, js_object_items
+from align_browser.experiment_models import ChunkedExperimentData, Manifest
+
+# Where the build writes the shards and their index, relative to data/
+MANIFEST_SHARDS_DIR = "manifest_shards"
+MANIFEST_INDEX_FILE = "manifest_index.json"
+
+
+def _shard_file_name(scenario_id: str, used_names: set) -> str:
+    """Pick a unique, filesystem-safe file name for a scenario's shard."""
+    stem = re.sub(r"[^A-Za-z0-9._-]+", "_", scenario_id).strip("._") or "empty"
+    name = stem
+    suffix = 1
+    while name in used_names:
+        suffix += 1
+        name = f"{stem}_{suffix}"
+    used_names.add(name)
+    return f"{name}.json"
+
+
+def manifest_scenario_ids(manifest: Manifest) -> List[str]:
+    """List scenario IDs in the order the frontend first meets them."""
+    scenario_ids = {}
+    for _, experiment in js_object_items(manifest.experiments):
+        for scenario_id, _ in js_object_items(experiment.scenarios):
+            scenario_ids.setdefault(scenario_id, None)
+    return list(scenario_ids)
+
+
+def write_manifest_shards(
+    manifest: Manifest, data_output_dir: Path, columnar_manifest: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Write one manifest shard per scenario and the index that lists them.
+
+    The index holds the manifest metadata (ADMs, LLMs, KDMA combinations),
+    the scenarios and where each scenario's shard is, so the frontend can
+    render after fetching it alone and fetch shards as scenarios are
+    picked. Each shard carries its scenario's part of the cascade index
+    (see build_cascade_index). Shards are written to a temporary directory
+    that then replaces the published one.
+
+    Args:
+        manifest: Manifest to split
+        data_output_dir: Path to output data directory
+        columnar_manifest: File name of a columnar manifest written next to
+            the index, which the frontend then loads instead of the shards
+
+    Returns:
+        The index written to MANIFEST_INDEX_FILE
+    """
+    shards_dir = data_output_dir / MANIFEST_SHARDS_DIR
+    temp_dir = shards_dir.with_name(f".{shards_dir.name}.tmp")
+    old_dir = shards_dir.with_name(f".{shards_dir.name}.old")
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    temp_dir.mkdir(parents=True)
+
+    scenario_ids = manifest_scenario_ids(manifest)
+    cascade = dict(build_cascade_index(manifest))
+    # In the order the frontend scans the full manifest, so each shard's
+    # entries follow the cascade index
+    experiments = dict(js_object_items(manifest.experiments))
+    shards = {}
+    used_names = set()
+    for scenario_id in scenario_ids:
+        chunk = ChunkedExperimentData.create_manifest_scenario_chunk(
+            scenario_id, experiments, cascade[scenario_id]
+        )
+        file_name = _shard_file_name(scenario_id, used_names)
+        with open(temp_dir / file_name, "w") as f:
+            json.dump(chunk.model_dump(), f, separators=(",", ":"))
+        shards[scenario_id] = {
+            "file": f"{MANIFEST_SHARDS_DIR}/{file_name}",
+            "experiments": chunk.metadata["count"],
+            "scenes": chunk.metadata["scenes"],
+            "bytes": (temp_dir / file_name).stat().st_size,
+        }
+
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if shards_dir.exists():
+        os.replace(shards_dir, old_dir)
+    os.replace(temp_dir, shards_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    index = {
+        "manifest_version": manifest.manifest_version,
+        "generated_at": manifest.generated_at,
+        "metadata": manifest.metadata,
+        # A list keeps the order the frontend offers scenarios in
+        "scenarios": scenario_ids,
+        "shards": shards,
+    }
+    if columnar_manifest:
+        index["columnar_manifest"] = columnar_manifest
+    index_path = data_output_dir / MANIFEST_INDEX_FILE
+    with open(index_path.with_name(f".{MANIFEST_INDEX_FILE}.tmp"), "w") as f:
+        json.dump(index, f, indent=2)
+    os.replace(index_path.with_name(f".{MANIFEST_INDEX_FILE}.tmp"), index_path)
+    return index
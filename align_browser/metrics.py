@@ -0,0 +1,221 @@
+"""Request metrics of the align-browser server."""
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+# Upper bounds of the request latency histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+class LatencyHistogram:
+    """Histogram of request latencies over LATENCY_BUCKETS."""
+
+    def __init__(self):
+        # One count per bucket plus the +Inf overflow bucket
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                break
+        else:
+            i = len(LATENCY_BUCKETS)
+        self.counts[i] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def cumulative_buckets(self) -> Dict[str, int]:
+        """Return the cumulative count of each bucket keyed by its "le" label."""
+        buckets = {}
+        total = 0
+        for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), self.counts):
+            total += count
+            buckets[str(bound)] = total
+        return buckets
+
+
+class ServerMetrics:
+    """
+    Thread-safe request counters of the server.
+
+    Requests are counted per route class (e.g. "manifest", "data",
+    "static", "not_found") and status code, with the bytes sent and a
+    latency histogram per route class. Data file requests are also
+    counted per dataset (top-level experiment directory), showing which
+    results drive load.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.bytes_sent: Dict[str, int] = defaultdict(int)
+        self.latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.dataset_requests: Dict[str, int] = defaultdict(int)
+        self.dataset_bytes: Dict[str, int] = defaultdict(int)
+
+    def observe(
+        self,
+        route: str,
+        status: str,
+        bytes_sent: int,
+        seconds: float,
+        dataset: Optional[str] = None,
+    ):
+        """Record a finished request."""
+        status_code = status.split(" ", 1)[0]
+        with self._lock:
+            self.requests[route][status_code] += 1
+            self.bytes_sent[route] += bytes_sent
+            self.latency[route].observe(seconds)
+            if dataset is not None:
+                self.dataset_requests[dataset] += 1
+                self.dataset_bytes[dataset] += bytes_sent
+
+    def to_json(
+        self, response_cache: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
+        """Return the metrics as a JSON-serializable dict."""
+        with self._lock:
+            routes = {
+                route: {
+                    "requests": sum(statuses.values()),
+                    "status": dict(statuses),
+                    "bytes_sent": self.bytes_sent[route],
+                    "latency_seconds": {
+                        "buckets": self.latency[route].cumulative_buckets(),
+                        "sum": self.latency[route].sum,
+                        "count": self.latency[route].count,
+                    },
+                }
+                for route, statuses in sorted(self.requests.items())
+            }
+            datasets = {
+                dataset: {
+                    "requests": requests,
+                    "bytes_sent": self.dataset_bytes[dataset],
+                }
+                for dataset, requests in sorted(self.dataset_requests.items())
+            }
+        return {
+            "routes": routes,
+            "datasets": datasets,
+            "response_cache": response_cache,
+        }
+
+    def to_prometheus(self, response_cache: Optional[Dict[str, int]] = None) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        metrics = self.to_json(response_cache)
+        routes = metrics["routes"]
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family(
+            "align_browser_requests_total",
+            "counter",
+            "Requests served by route class and status code.",
+        )
+        for route, info in routes.items():
+            for status_code, count in sorted(info["status"].items()):
+                lines.append(
+                    f'align_browser_requests_total{{route="{route}",'
+                    f'status="{status_code}"}} {count}'
+                )
+
+        family(
+            "align_browser_response_bytes_total",
+            "counter",
+            "Response body bytes sent by route class.",
+        )
+        for route, info in routes.items():
+            lines.append(
+                f'align_browser_response_bytes_total{{route="{route}"}} '
+                f"{info['bytes_sent']}"
+            )
+
+        family(
+            "align_browser_request_duration_seconds",
+            "histogram",
+            "Time to handle a request by route class.",
+        )
+        for route, info in routes.items():
+            latency = info["latency_seconds"]
+            for bound, count in latency["buckets"].items():
+                lines.append(
+                    f"align_browser_request_duration_seconds_bucket"
+                    f'{{route="{route}",le="{bound}"}} {count}'
+                )
+            lines.append(
+                f'align_browser_request_duration_seconds_sum{{route="{route}"}} '
+                f"{latency['sum']}"
+            )
+            lines.append(
+                f'align_browser_request_duration_seconds_count{{route="{route}"}} '
+                f"{latency['count']}"
+            )
+
+        family(
+            "align_browser_dataset_requests_total",
+            "counter",
+            "Data file requests by dataset (top-level experiment directory).",
+        )
+        for dataset, info in metrics["datasets"].items():
+            lines.append(
+                f'align_browser_dataset_requests_total{{dataset="{_escape(dataset)}"}} '
+                f"{info['requests']}"
+            )
+        family(
+            "align_browser_dataset_bytes_total",
+            "counter",
+            "Data file bytes sent by dataset (top-level experiment directory).",
+        )
+        for dataset, info in metrics["datasets"].items():
+            lines.append(
+                f'align_browser_dataset_bytes_total{{dataset="{_escape(dataset)}"}} '
+                f"{info['bytes_sent']}"
+            )
+
+        if response_cache is not None:
+            for name in ("hits", "misses", "evictions"):
+                family(
+                    f"align_browser_response_cache_{name}_total",
+                    "counter",
+                    f"Response cache {name}.",
+                )
+                lines.append(
+                    f"align_browser_response_cache_{name}_total {response_cache[name]}"
+                )
+            family(
+                "align_browser_response_cache_bytes",
+                "gauge",
+                "Bytes of file bodies held in the response cache.",
+            )
+            lines.append(
+                f"align_browser_response_cache_bytes {response_cache['bytes']}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label_value: str) -> str:
+    """Escape a Prometheus label value."""
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
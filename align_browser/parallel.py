@@ -0,0 +1,52 @@
+"""Order-preserving, bounded fan-out of work to a process pool."""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+
+class Finished(NamedTuple):
+    """A result that is already known and needs no worker."""
+
+    result: Any
+
+
+def imap_ordered(func: Callable, tasks: Iterable, jobs: int) -> Iterator:
+    """
+    Lazily apply func to argument tuples, on a process pool when jobs > 1.
+
+    tasks yields tuples of positional arguments for func, or results that
+    are already known wrapped in Finished, which are passed through as they
+    are. Results are yielded in task order. Tasks are consumed lazily and at
+    most jobs * 2 are submitted ahead of the result being yielded, so memory
+    use does not grow with the number of tasks.
+
+    Args:
+        func: Picklable function run for each task
+        tasks: Iterable of argument tuples or Finished results
+        jobs: Number of worker processes (0 uses one per CPU core, 1 runs
+            everything in this process)
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs <= 1:
+        for task in tasks:
+            yield task.result if isinstance(task, Finished) else func(*task)
+        return
+
+    def resolve(entry):
+        return entry.result if isinstance(entry, Finished) else entry.result()
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        in_flight = deque()
+        for task in tasks:
+            if isinstance(task, Finished):
+                in_flight.append(task)
+            else:
+                in_flight.append(executor.submit(func, *task))
+            while len(in_flight) > jobs * 2:
+                yield resolve(in_flight.popleft())
+        while in_flight:
+            yield resolve(in_flight.popleft())
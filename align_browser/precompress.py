@@ -0,0 +1,67 @@
+"""Gzip-compressed copies of site files for the server to send as-is."""
+
+import gzip
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+# Suffix of the precompressed sibling of a file
+GZIP_SUFFIX = ".gz"
+
+# Static assets written by copy_static_assets that are worth compressing
+PRECOMPRESS_ASSET_SUFFIXES = (".html", ".js", ".css")
+
+
+def gzip_sibling(path: Path) -> Path:
+    """Return the path of a file's precompressed sibling."""
+    return path.with_name(path.name + GZIP_SUFFIX)
+
+
+def is_current_sibling(stat: os.stat_result, sibling_stat: os.stat_result) -> bool:
+    """
+    Check that a sibling was compressed from the file as it is now.
+
+    Siblings are given the modification time of the file they were
+    compressed from, so any later change to the file makes them stale.
+    """
+    return sibling_stat.st_mtime_ns == stat.st_mtime_ns
+
+
+def precompress_file(path: Path) -> bool:
+    """
+    Write the gzip sibling of a file unless an up-to-date one exists.
+
+    Returns whether the sibling was (re)written.
+    """
+    sibling = gzip_sibling(path)
+    stat = os.stat(path)
+    try:
+        if is_current_sibling(stat, os.stat(sibling)):
+            return False
+    except FileNotFoundError:
+        pass
+
+    temp_path = sibling.with_name(f".{sibling.name}.tmp")
+    with open(path, "rb") as source, open(temp_path, "wb") as raw:
+        # No file name or timestamp in the header, so output is reproducible
+        with gzip.GzipFile(fileobj=raw, mode="wb", filename="", mtime=0) as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+    os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(temp_path, sibling)
+    return True
+
+
+def precompress_files(paths: List[Path], threads: Optional[int] = None) -> int:
+    """
+    Write gzip siblings for files on a thread pool (zlib releases the GIL).
+
+    Returns the number of siblings written; unchanged files are skipped.
+    """
+    if threads != 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            written = list(executor.map(precompress_file, paths))
+    else:
+        written = [precompress_file(path) for path in paths]
+    return sum(written)
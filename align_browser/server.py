@@ -0,0 +1,767 @@
+"""WSGI app that serves a built site and exports CSV slices on demand."""
+
+import csv
+import io
+import json
+import mimetypes
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache, partial
+from pathlib import Path
+from stat import S_ISREG
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from align_browser.csv_exporter import CSV_FIELDNAMES, iter_experiment_csv_rows
+from align_browser.experiment_models import (
+    ExperimentConfig,
+    ExperimentData,
+    InputOutputFile,
+    ScoresFile,
+    TimingData,
+)
+from align_browser.manifest_columnar import COLUMNAR_MANIFEST_FILE
+from align_browser.manifest_shards import MANIFEST_INDEX_FILE, MANIFEST_SHARDS_DIR
+from align_browser.metrics import ServerMetrics
+from align_browser.precompress import gzip_sibling, is_current_sibling
+
+# URL of the on-demand CSV export
+EXPORT_CSV_PATH = "/api/export.csv"
+
+# Query parameters of the export and the manifest index each one selects from
+EXPORT_FILTERS = {
+    "adm": "by_adm",
+    "llm": "by_llm",
+    "kdma": "by_kdma",
+    "scenario": "by_scenario",
+}
+
+# Encoded CSV bytes gathered before a chunk is sent to the client
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Bytes read from disk at a time when sending a file
+FILE_BLOCK_SIZE = 256 * 1024
+
+# Default size of the in-memory cache of static file bodies
+DEFAULT_RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+
+# URL reporting the response cache counters
+CACHE_STATS_PATH = "/api/cache-stats"
+
+# URL reporting request metrics (Prometheus text, or JSON with ?format=json)
+METRICS_PATH = "/metrics"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Cache-Control of URLs that carry the checksum of their content
+CONTENT_ADDRESSED_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Cache-Control of other files, which browsers revalidate with their ETag
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class ManifestIndex:
+    """
+    In-memory view of a site's data/manifest.json for the server.
+
+    Holds the experiments and their lookup indices, and the experiments
+    that share each input_output.json file so mixed KDMA directories can be
+    split by alignment target again.
+    """
+
+    def __init__(self, manifest: Dict[str, Any], site_dir: Path):
+        self.site_dir = site_dir
+        self.experiments: Dict[str, Any] = manifest.get("experiments", {})
+        self.indices: Dict[str, Dict[str, List[str]]] = manifest.get("indices", {})
+        self.file_experiments: Dict[str, List[str]] = {
+            path: info.get("experiments", [])
+            for path, info in manifest.get("files", {}).items()
+        }
+
+    @classmethod
+    def load(cls, site_dir: Path) -> "ManifestIndex":
+        """Load the manifest of a built site."""
+        with open(site_dir / "data" / "manifest.json") as f:
+            return cls(json.load(f), site_dir)
+
+    def select(self, filters: Dict[str, str]) -> List[str]:
+        """Return the keys of experiments matching every filter, in manifest order."""
+        selected = None
+        for name, value in filters.items():
+            keys = set(self.indices.get(EXPORT_FILTERS[name], {}).get(value, []))
+            selected = keys if selected is None else selected & keys
+        if selected is None:
+            return list(self.experiments)
+        return [key for key in self.experiments if key in selected]
+
+    def load_experiment(self, exp_key: str) -> ExperimentData:
+        """Load an experiment from the data files published with the site."""
+        experiment = self.experiments[exp_key]
+        scenario = next(iter(experiment["scenarios"].values()))
+        input_output_info = scenario["input_output"]
+        input_output_path = input_output_info["file"]
+
+        input_output = InputOutputFile.from_file(self.site_dir / input_output_path)
+        if len(self.file_experiments.get(input_output_path, [])) > 1:
+            # Mixed KDMA directory: keep the items of this alignment target
+            target = input_output_info["alignment_target_filter"]
+            input_output = InputOutputFile(
+                data=[
+                    item
+                    for item in input_output.data
+                    if (item.input.alignment_target_id or "unaligned") == target
+                ]
+            )
+
+        with open(self.site_dir / scenario["timing"]) as f:
+            timing = TimingData(**json.load(f))
+        scores = None
+        if scenario.get("scores"):
+            scores = ScoresFile.from_file(self.site_dir / scenario["scores"])
+
+        return ExperimentData(
+            config=ExperimentConfig.from_manifest_parameters(experiment["parameters"]),
+            input_output=input_output,
+            scores=scores,
+            timing=timing,
+            experiment_path=self.site_dir / Path(input_output_path).parent,
+        )
+
+
+def load_manifest_file_checksums(site_dir: Path) -> Dict[str, str]:
+    """Read the checksum of each data file from a built site's manifest."""
+    with open(site_dir / "data" / "manifest.json") as f:
+        files = json.load(f).get("files", {})
+    return {
+        path: info["checksum"] for path, info in files.items() if info.get("checksum")
+    }
+
+
+def iter_export_csv_chunks(
+    index: ManifestIndex, filters: Dict[str, str]
+) -> Iterator[bytes]:
+    """
+    Yield the encoded CSV rows of the experiments matching the filters.
+
+    Experiments whose files cannot be loaded are reported and skipped, as
+    in the build's CSV export, so the response is not cut off midway.
+    """
+    scenario_id = filters.get("scenario")
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDNAMES)
+    writer.writeheader()
+
+    for exp_key in index.select(filters):
+        try:
+            # Convert a whole experiment first so a failure writes no rows
+            experiment = index.load_experiment(exp_key)
+            rows = list(iter_experiment_csv_rows(experiment, index.site_dir / "data"))
+        except Exception as e:
+            print(f"Warning: Failed to export experiment {exp_key}: {e}")
+            continue
+        for row in rows:
+            if scenario_id is None or row["scenario_id"] == scenario_id:
+                writer.writerow(row)
+            if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+
+    yield buffer.getvalue().encode("utf-8")
+
+
+def _resolve_static_path(directory: Path, path_info: str) -> Optional[Path]:
+    """Map a request path to a file path, refusing paths outside the directory."""
+    parts = [part for part in path_info.split("/") if part not in ("", ".")]
+    if ".." in parts:
+        return None
+    # Symlinked data directories are served as they are, so no resolve()
+    return directory.joinpath(*parts)
+
+
+def _regular_file_stat(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, returning None unless it is an existing regular file."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat if S_ISREG(stat.st_mode) else None
+
+
+@lru_cache(maxsize=1024)
+def content_type_for(file_name: str) -> str:
+    """Return the Content-Type to send for a file name."""
+    content_type, _ = mimetypes.guess_type(file_name)
+    return content_type or "application/octet-stream"
+
+
+def file_etag(stat: os.stat_result, checksum: Optional[str] = None) -> str:
+    """Return the ETag of a file: its sha256 checksum if known, else size and mtime."""
+    if checksum:
+        return '"{}"'.format(checksum.replace(":", "-", 1))
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def is_not_modified(environ, etag: str, mtime: float) -> bool:
+    """Check a request's If-None-Match or If-Modified-Since against a file."""
+    if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+    if if_none_match is not None:
+        # If-None-Match uses weak comparison and takes precedence
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = environ.get("HTTP_IF_MODIFIED_SINCE")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # Last-Modified has a resolution of whole seconds
+        return int(mtime) <= since
+    return False
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Check whether an Accept-Encoding header allows a gzip response."""
+    if not accept_encoding:
+        return False
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    # An explicit gzip entry (e.g. "gzip;q=0") overrides the wildcard
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+class RangeNotSatisfiable(ValueError):
+    """Raised for a byte range that starts beyond the end of the file."""
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a Range header into the first and last byte offsets it selects.
+
+    Only single byte ranges are supported; None is returned for other or
+    malformed headers, which are answered with the whole file.
+    """
+    unit, _, spec = header.partition("=")
+    first, dash, last = spec.strip().partition("-")
+    if unit.strip().lower() != "bytes" or not dash or not (first or last):
+        return None
+    if not all(value.isdigit() for value in (first, last) if value):
+        # Malformed, or several comma-separated ranges
+        return None
+
+    if first:
+        start = int(first)
+        end = int(last) if last else size - 1
+        if last and start > end:
+            return None
+    else:
+        # Suffix range: the last N bytes
+        suffix = int(last)
+        if suffix == 0:
+            raise RangeNotSatisfiable(header)
+        start, end = max(size - suffix, 0), size - 1
+
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    return start, min(end, size - 1)
+
+
+def iter_file(f: BinaryIO, length: int) -> Iterator[bytes]:
+    """Yield length bytes from the current position of a file, then close it."""
+    try:
+        while length > 0:
+            block = f.read(min(FILE_BLOCK_SIZE, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+    finally:
+        f.close()
+
+
+class ResponseCache:
+    """
+    Bounded in-memory LRU cache of static file bodies, sized in bytes.
+
+    Entries are keyed by path and remember the identity (device, inode,
+    size and mtime_ns) of the file they were read from, so a file that has
+    been rewritten since is read again. Files larger than a quarter of the
+    cache are streamed from disk instead. Thread safe, as waitress serves
+    requests from several threads.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_bytes // 4
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Path, Tuple[Tuple[int, ...], bytes]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _identity(stat: os.stat_result) -> Tuple[int, ...]:
+        return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def get(self, path: Path, stat: os.stat_result) -> Optional[bytes]:
+        """Return the cached body of a file if it is unchanged since it was read."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == self._identity(stat):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def admits(self, size: int) -> bool:
+        """Check whether a file of this size is kept in the cache."""
+        return size <= self.max_entry_bytes
+
+    def put(self, path: Path, stat: os.stat_result, body: bytes):
+        """Cache the body of a file, evicting the least recently used entries."""
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self.size -= len(previous[1])
+            self._entries[path] = (self._identity(stat), body)
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache's size and hit, miss and eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def classify_request(path_info: str, status: str) -> Tuple[str, Optional[str]]:
+    """
+    Return the route class of a request for metrics, and for data files the
+    dataset (top-level experiment directory) they belong to.
+    """
+    if status.startswith("404"):
+        return "not_found", None
+    if path_info in (EXPORT_CSV_PATH, CACHE_STATS_PATH, METRICS_PATH):
+        return path_info.rsplit("/", 1)[-1].split(".")[0].replace("-", "_"), None
+    parts = [part for part in path_info.split("/") if part]
+    if parts[:1] != ["data"]:
+        return "static", None
+    if parts[1:2] and parts[1] in (
+        "manifest.json",
+        COLUMNAR_MANIFEST_FILE,
+        MANIFEST_INDEX_FILE,
+        MANIFEST_SHARDS_DIR,
+    ):
+        return "manifest", None
+    if len(parts) > 2:
+        return "data", parts[1]
+    return "data", None
+
+
+def _observe_body(body: Iterable[bytes], record) -> Iterator[bytes]:
+    """Pass a response body through, recording the request once it is sent."""
+    sent = 0
+    try:
+        for block in body:
+            sent += len(block)
+            yield block
+    finally:
+        close = getattr(body, "close", None)
+        if close is not None:
+            close()
+        record(sent)
+
+
+class SiteApp:
+    """
+    WSGI app serving a built site directory.
+
+    Static files are sent with ETag and Last-Modified validators so
+    browsers can revalidate them with a 304, support single byte ranges,
+    and are replaced by their precompressed .gz sibling for clients that
+    accept gzip. Requests for EXPORT_CSV_PATH stream CSV rows generated
+    from the site's manifest and data files.
+    """
+
+    def __init__(
+        self, directory, response_cache_bytes: int = DEFAULT_RESPONSE_CACHE_BYTES
+    ):
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / "data" / "manifest.json"
+        self.response_cache = (
+            ResponseCache(response_cache_bytes) if response_cache_bytes > 0 else None
+        )
+        self.metrics = ServerMetrics()
+        self._index: Optional[ManifestIndex] = None
+        self._index_mtime_ns: Optional[int] = None
+        self._index_lock = threading.Lock()
+        self._file_checksums: Dict[str, str] = {}
+        self._checksums_mtime_ns: Optional[int] = None
+        self._checksums_lock = threading.Lock()
+
+    def manifest_index(self) -> ManifestIndex:
+        """Return the manifest index, reloading it after a rebuild."""
+        mtime_ns = os.stat(self.manifest_path).st_mtime_ns
+        # Requests arrive on several threads; only one of them reloads
+        with self._index_lock:
+            if self._index_mtime_ns != mtime_ns:
+                self._index = ManifestIndex.load(self.directory)
+                self._index_mtime_ns = mtime_ns
+            return self._index
+
+    def manifest_checksum(
+        self, relative_path: str, stat: os.stat_result
+    ) -> Optional[str]:
+        """
+        Return a data file's checksum from the manifest if it still applies.
+
+        Only the manifest's files map is kept, loaded on the first request
+        for a data file after each rebuild.
+        """
+        if not relative_path.startswith("data/"):
+            return None
+        try:
+            mtime_ns = os.stat(self.manifest_path).st_mtime_ns
+            with self._checksums_lock:
+                if self._checksums_mtime_ns != mtime_ns:
+                    self._file_checksums = load_manifest_file_checksums(self.directory)
+                    self._checksums_mtime_ns = mtime_ns
+                checksums = self._file_checksums
+        except (OSError, ValueError):
+            return None
+        # A file modified after the build (e.g. a linked source) may not match
+        if stat.st_mtime_ns > mtime_ns:
+            return None
+        return checksums.get(relative_path)
+
+    def __call__(self, environ, start_response):
+        started = time.perf_counter()
+        response = {}
+
+        def recording_start_response(status, headers, exc_info=None):
+            response["status"] = status
+            response["headers"] = headers
+            if exc_info is None:
+                return start_response(status, headers)
+            return start_response(status, headers, exc_info)
+
+        body = self.dispatch(environ, recording_start_response)
+        record = partial(self._record_request, environ["PATH_INFO"], response, started)
+
+        if isinstance(body, list):
+            record(sum(len(block) for block in body))
+            return body
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        if file_wrapper is not None and isinstance(body, file_wrapper):
+            # Returned as is so the server can send the file itself; the
+            # latency covers the request up to handing over the file
+            record(int(dict(response["headers"])["Content-Length"]))
+            return body
+        return _observe_body(body, record)
+
+    def _record_request(
+        self, path_info: str, response: Dict[str, Any], started: float, sent: int
+    ):
+        status = response.get("status", "500 Internal Server Error")
+        route, dataset = classify_request(path_info, status)
+        self.metrics.observe(
+            route, status, sent, time.perf_counter() - started, dataset
+        )
+
+    def dispatch(self, environ, start_response):
+        """Route a request to the handler for its path."""
+        path_info = environ["PATH_INFO"]
+        if path_info == EXPORT_CSV_PATH:
+            return self.export_csv(environ, start_response)
+        if path_info == CACHE_STATS_PATH:
+            return self.cache_stats(environ, start_response)
+        if path_info == METRICS_PATH:
+            return self.serve_metrics(environ, start_response)
+        return self.serve_static(environ, start_response)
+
+    def serve_metrics(self, environ, start_response):
+        """Report request metrics, as Prometheus text or with ?format=json as JSON."""
+        cache_stats = self.response_cache.stats() if self.response_cache else None
+        query = parse_qs(environ.get("QUERY_STRING", ""))
+        if query.get("format") == ["json"]:
+            body = json.dumps(self.metrics.to_json(cache_stats)).encode("utf-8")
+            content_type = "application/json"
+        else:
+            body = self.metrics.to_prometheus(cache_stats).encode("utf-8")
+            content_type = PROMETHEUS_CONTENT_TYPE
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", content_type),
+                ("Content-Length", str(len(body))),
+                ("Cache-Control", "no-store"),
+            ],
+        )
+        return [body]
+
+    def cache_stats(self, environ, start_response):
+        """Report the response cache counters as JSON."""
+        stats = self.response_cache.stats() if self.response_cache else None
+        body = json.dumps({"response_cache": stats}).encode("utf-8")
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", "application/json"),
+                ("Content-Length", str(len(body))),
+                ("Cache-Control", "no-store"),
+            ],
+        )
+        return [body]
+
+    def export_csv(self, environ, start_response):
+        """Stream the CSV rows of the experiments selected by the query."""
+        query = parse_qs(environ.get("QUERY_STRING", ""))
+        filters = {name: query[name][0] for name in EXPORT_FILTERS if query.get(name)}
+        try:
+            index = self.manifest_index()
+        except FileNotFoundError:
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"404 Not Found"]
+
+        # No Content-Length, so the server sends the rows chunked as they are made
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", "text/csv; charset=utf-8"),
+                (
+                    "Content-Disposition",
+                    'attachment; filename="experiment_data_export.csv"',
+                ),
+            ],
+        )
+        return iter_export_csv_chunks(index, filters)
+
+    def serve_static(self, environ, start_response):
+        """Serve a file of the site directory."""
+        path_info = environ["PATH_INFO"]
+        if path_info == "/":
+            path_info = "/index.html"
+
+        file_path = _resolve_static_path(self.directory, path_info)
+        stat = _regular_file_stat(file_path) if file_path else None
+        if stat is None:
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"404 Not Found"]
+
+        # Send the precompressed sibling to clients that accept gzip
+        body_path, body_stat = file_path, stat
+        if accepts_gzip(environ.get("HTTP_ACCEPT_ENCODING")):
+            sibling_path = gzip_sibling(file_path)
+            sibling_stat = _regular_file_stat(sibling_path)
+            if sibling_stat and is_current_sibling(stat, sibling_stat):
+                body_path, body_stat = sibling_path, sibling_stat
+
+        body = f = None
+        if self.response_cache:
+            body = self.response_cache.get(body_path, body_stat)
+        if body is None:
+            # Headers describe the file as opened, in case it was just replaced
+            try:
+                f = open(body_path, "rb")
+            except OSError:
+                start_response("404 Not Found", [("Content-Type", "text/plain")])
+                return [b"404 Not Found"]
+            body_stat = os.fstat(f.fileno())
+            if body_path == file_path:
+                stat = body_stat
+            if self.response_cache and self.response_cache.admits(body_stat.st_size):
+                with f:
+                    body = f.read()
+                f = None
+                self.response_cache.put(body_path, body_stat, body)
+
+        try:
+            relative_path = file_path.relative_to(self.directory).as_posix()
+            checksum = self.manifest_checksum(relative_path, stat)
+            etag = file_etag(stat, checksum)
+            if body_path != file_path:
+                etag = etag[:-1] + '-gzip"'
+
+            # URLs carrying the current checksum (?v=<sha256>) never change content
+            version = parse_qs(environ.get("QUERY_STRING", "")).get("v", [None])[0]
+            if checksum and version == checksum.split(":", 1)[-1]:
+                cache_control = CONTENT_ADDRESSED_CACHE_CONTROL
+            else:
+                cache_control = REVALIDATE_CACHE_CONTROL
+
+            headers = [
+                ("ETag", etag),
+                ("Last-Modified", formatdate(stat.st_mtime, usegmt=True)),
+                ("Cache-Control", cache_control),
+                ("Vary", "Accept-Encoding"),
+            ]
+            if body_path != file_path:
+                headers.append(("Content-Encoding", "gzip"))
+            if is_not_modified(environ, etag, stat.st_mtime):
+                if f:
+                    f.close()
+                start_response("304 Not Modified", headers)
+                return []
+
+            # Ranges select bytes of the body as sent, i.e. after encoding
+            status = "200 OK"
+            start = 0
+            size = length = body_stat.st_size
+            try:
+                byte_range = self._requested_range(environ, headers, size)
+            except RangeNotSatisfiable:
+                if f:
+                    f.close()
+                start_response(
+                    "416 Range Not Satisfiable",
+                    [
+                        ("Content-Type", "text/plain"),
+                        ("Content-Range", f"bytes */{size}"),
+                    ],
+                )
+                return [b"416 Range Not Satisfiable"]
+            if byte_range is not None:
+                start, end = byte_range
+                length = end - start + 1
+                status = "206 Partial Content"
+                headers.append(("Content-Range", f"bytes {start}-{end}/{size}"))
+                if f:
+                    f.seek(start)
+
+            start_response(
+                status,
+                [
+                    ("Content-Type", content_type_for(file_path.name)),
+                    ("Content-Length", str(length)),
+                    ("Accept-Ranges", "bytes"),
+                ]
+                + headers,
+            )
+        except BaseException:
+            if f:
+                f.close()
+            raise
+
+        if body is not None:
+            return [body if length == size else body[start : start + length]]
+
+        # Send the file in blocks rather than reading it into memory; waitress
+        # streams its own file wrapper straight from the open file, starting
+        # at its position and stopping after Content-Length bytes
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        if file_wrapper is None:
+            return iter_file(f, length)
+        return file_wrapper(f, FILE_BLOCK_SIZE)
+
+    @staticmethod
+    def _requested_range(
+        environ, headers: List[Tuple[str, str]], size: int
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Return the (first, last) byte offsets requested by a Range header.
+
+        Returns None to send the whole file: without a usable Range header,
+        or when an If-Range validator no longer matches.
+        """
+        header = environ.get("HTTP_RANGE")
+        if not header:
+            return None
+
+        if_range = environ.get("HTTP_IF_RANGE")
+        if if_range is not None:
+            # If-Range requires a strong match: the same ETag or date
+            validators = dict(headers)
+            if if_range.strip() not in (
+                validators["ETag"],
+                validators["Last-Modified"],
+            ):
+                return None
+
+        return parse_range(header, size)
+
+
+def create_app(directory, response_cache_bytes: int = DEFAULT_RESPONSE_CACHE_BYTES):
+    """Create the WSGI app serving a built site directory."""
+    return SiteApp(directory, response_cache_bytes)
+
+
+def serve_directory(
+    directory,
+    host="localhost",
+    port=8000,
+    response_cache_bytes=DEFAULT_RESPONSE_CACHE_BYTES,
+):
+    """Start HTTP server to serve the specified directory."""
+    from waitress import serve
+
+    # Find an available port starting from the requested port
+    actual_port = find_available_port(port, host)
+
+    if actual_port != port:
+        print(f"Port {port} was busy, using port {actual_port} instead")
+
+    # Display appropriate URL based on host
+    if host == "0.0.0.0":
+        url = f"http://localhost:{actual_port}"
+        print(f"Serving {directory} on all network interfaces at port {actual_port}")
+        print(f"Local access: {url}")
+        print(f"Network access: http://<your-ip>:{actual_port}")
+    else:
+        url = f"http://{host}:{actual_port}"
+        print(f"Serving {directory} at {url}")
+    print(f"CSV export: {url}{EXPORT_CSV_PATH}?adm=&kdma=&scenario=")
+
+    print("Press Ctrl+C to stop the server")
+    try:
+        serve(create_app(directory, response_cache_bytes), host=host, port=actual_port)
+    except KeyboardInterrupt:
+        print("\nServer stopped")
+
+
+def find_available_port(start_port=8000, host="localhost"):
+    """Find an available port starting from start_port."""
+    port = start_port
+    bind_host = "" if host == "0.0.0.0" else host
+
+    while port < start_port + 100:  # Try up to 100 ports
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.bind((bind_host, port))
+                return port
+        except OSError:
+            port += 1
+
+    # If no port found in range, let the system assign one
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind((bind_host, 0))
+        return s.getsockname()[1]
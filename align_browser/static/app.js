@@ -6,6 +6,10 @@ import {
   encodeStateToURL,
   decodeStateFromURL,
   loadManifest,
+  loadScenarioShards,
+  loadCsvPartitionIndex,
+  hasFullCsvExport,
+  selectCsvDownload,
   fetchRunData,
   resolveParametersToRun,
   KDMAUtils,
@@ -27,6 +31,8 @@ import {
   getValidKDMAsForRun
 } from './table-formatter.js';
 
+import { showError } from './notifications.js';
+
 
 // Generic function to preserve linked parameters after validation
 // Takes snake_case params from API and returns mixed camelCase/snake_case for internal use
@@ -62,11 +68,36 @@ function preserveLinkedParameters(validatedSnakeParams, originalCamelParams, app
 }
 
 // CSV Download functionality
+let csvPartitionIndex = null;
+// False once neither the partitions nor the full CSV turned out to exist
+let csvExportAvailable = true;
+
+function getCsvDownload() {
+  const pinnedRuns = window.appState ? Array.from(window.appState.pinnedRuns.values()) : [];
+  return selectCsvDownload(csvPartitionIndex, pinnedRuns);
+}
+
+// Describe the partition the download button will offer for the pinned runs
+function updateCsvDownloadButton() {
+  const button = document.getElementById('download-csv-btn');
+  if (!button) return;
+
+  button.style.display = csvExportAvailable ? '' : 'none';
+  const download = getCsvDownload();
+  if (download.label) {
+    button.textContent = `📥 Download CSV (${download.label})`;
+    button.title = `Download ${download.rows} rows for ${download.label} as gzip-compressed CSV`;
+  } else {
+    button.textContent = '📥 Download CSV';
+    button.title = 'Download experiment data as CSV';
+  }
+}
+
 function downloadCSV() {
-  const csvPath = './data/experiment_data.csv';
+  const download = getCsvDownload();
   const link = document.createElement('a');
-  link.href = csvPath;
-  link.download = 'experiment_data.csv';
+  link.href = download.href;
+  link.download = download.filename;
   document.body.appendChild(link);
   link.click();
   document.body.removeChild(link);
@@ -89,13 +120,13 @@ document.addEventListener("DOMContentLoaded", () => {
   };
 
   // Standalone function to create run config from parameters
-  function createRunConfigFromParams(params) {
+  async function createRunConfigFromParams(params) {
     // Get context-specific available options using updateAppParameters with the run's parameters
     let availableKDMAs = [];
     let enhancedParams = { ...params };
     
     if (window.updateAppParameters) {
-      const result = window.updateAppParameters({
+      const result = await window.updateAppParameters({
         scenario: params.scenario,
         scene: params.scene,
         kdma_values: params.kdmaValues || {},
@@ -154,8 +185,8 @@ document.addEventListener("DOMContentLoaded", () => {
     reloadPinnedRun: reloadPinnedRun
   };
   
-  window.toggleParameterLink = (paramName) => {
-    const result = toggleParameterLink(paramName, appState, syncCallbacks);
+  window.toggleParameterLink = async (paramName) => {
+    const result = await toggleParameterLink(paramName, appState, syncCallbacks);
     
     // Trigger async reloads if needed (fire-and-forget when enabling a link)
     if (result && result.needsReload && result.runIdsToReload && result.runIdsToReload.length > 0) {
@@ -172,7 +203,7 @@ document.addEventListener("DOMContentLoaded", () => {
   window.appState = appState;
 
   // Update a parameter for any run with validation and UI sync
-  function updateParameterForRun(runId, paramType, newValue, isPropagatedUpdate = false) {
+  async function updateParameterForRun(runId, paramType, newValue, isPropagatedUpdate = false) {
     const params = getParametersForRun(runId);
     const run = appState.pinnedRuns.get(runId);
     
@@ -189,7 +220,7 @@ document.addEventListener("DOMContentLoaded", () => {
       run_variant: params.runVariant || null
     };
     
-    const result = window.updateAppParameters(stateParams, {});
+    const result = await window.updateAppParameters(stateParams, {});
     const validParams = result.params;
     const validOptions = result.options;
     
@@ -258,7 +289,7 @@ document.addEventListener("DOMContentLoaded", () => {
     
     // If this is a linked parameter and this is a direct user update, propagate to other runs
     if (!isPropagatedUpdate && isParameterLinked(paramType, appState)) {
-      const propagationResult = propagateParameterToAllRuns(paramType, newValue, runId, appState, syncCallbacks);
+      const propagationResult = await propagateParameterToAllRuns(paramType, newValue, runId, appState, syncCallbacks);
       
       // Trigger async reloads if needed (fire-and-forget)
       if (propagationResult.needsReload && propagationResult.runIdsToReload.length > 0) {
@@ -293,6 +324,7 @@ document.addEventListener("DOMContentLoaded", () => {
         
         // Restore pinned runs
         if (state.pinnedRuns && state.pinnedRuns.length > 0) {
+          await loadScenarioShards(state.pinnedRuns.map(runConfig => runConfig.scenario));
           for (const runConfig of state.pinnedRuns) {
             // Convert runConfig to params format expected by addColumn
             // Don't pass availableOptions - let addColumn calculate them fresh
@@ -319,39 +351,57 @@ document.addEventListener("DOMContentLoaded", () => {
 
   // Function to fetch and parse manifest.json
   async function fetchManifest() {
-      const result = await loadManifest();
-      window.updateAppParameters = result.updateAppParameters;
+      // The table shell is already on the page; show that data is loading
+      // while the manifest worker parses and indexes the manifest
+      showLoadingSpinner();
+      try {
+        const result = await loadManifest();
+        window.updateAppParameters = result.updateAppParameters;
+
+        // The partition index only changes which file the CSV button offers;
+        // without it, hide the button unless the full CSV was written
+        loadCsvPartitionIndex().then(async index => {
+          csvPartitionIndex = index;
+          csvExportAvailable = index !== null || await hasFullCsvExport();
+          updateCsvDownloadButton();
+        });
       
-      const initialResult = window.updateAppParameters({
-        scenario: null,
-        scene: null,
-        kdma_values: [],
-        adm: null,
-        llm: null,
-        run_variant: null
-      }, {});
+        const initialResult = await window.updateAppParameters({
+          scenario: null,
+          scene: null,
+          kdma_values: [],
+          adm: null,
+          llm: null,
+          run_variant: null
+        }, {});
       
-      // Store first valid parameters for auto-pinning but don't populate appState selections
-      const firstValidParams = {
-        scenario: initialResult.params.scenario,
-        scene: initialResult.params.scene,
-        admType: initialResult.params.adm,
-        llmBackbone: initialResult.params.llm,
-        runVariant: initialResult.params.run_variant,
-        kdmaValues: initialResult.params.kdma_values || {},
-        availableScenarios: initialResult.options.scenario || [],
-        availableScenes: initialResult.options.scene || [], 
-        availableAdmTypes: initialResult.options.adm || [],
-        availableLLMs: initialResult.options.llm || []
-      };
+        // Store first valid parameters for auto-pinning but don't populate appState selections
+        const firstValidParams = {
+          scenario: initialResult.params.scenario,
+          scene: initialResult.params.scene,
+          admType: initialResult.params.adm,
+          llmBackbone: initialResult.params.llm,
+          runVariant: initialResult.params.run_variant,
+          kdmaValues: initialResult.params.kdma_values || {},
+          availableScenarios: initialResult.options.scenario || [],
+          availableScenes: initialResult.options.scene || [], 
+          availableAdmTypes: initialResult.options.adm || [],
+          availableLLMs: initialResult.options.llm || []
+        };
       
-      // Try to restore state from URL, otherwise auto-pin first valid configuration
-      const restoredFromURL = await urlState.restoreFromURL();
-      if (!restoredFromURL) {
-        // Auto-pin the first valid configuration if no pinned runs exist
-        if (appState.pinnedRuns.size === 0 && firstValidParams.scenario) {
-          await addColumn(firstValidParams);
+        // Try to restore state from URL, otherwise auto-pin first valid configuration
+        const restoredFromURL = await urlState.restoreFromURL();
+        if (!restoredFromURL) {
+          // Auto-pin the first valid configuration if no pinned runs exist
+          if (appState.pinnedRuns.size === 0 && firstValidParams.scenario) {
+            await addColumn(firstValidParams);
+          }
         }
+      } catch (error) {
+        console.error('Error loading manifest:', error);
+        showError(`Failed to load experiment data: ${error.message}`);
+      } finally {
+        hideLoadingSpinner();
       }
   }
 
@@ -578,7 +628,7 @@ document.addEventListener("DOMContentLoaded", () => {
     
     try {
       // Check if parameters resolve to a valid run before attempting fetch
-      const runInfo = resolveParametersToRun({
+      const runInfo = await resolveParametersToRun({
         scenario: params.scenario,
         scene: params.scene,
         admType: params.admType,
@@ -661,6 +711,7 @@ document.addEventListener("DOMContentLoaded", () => {
     if (addColumnBtn) {
       addColumnBtn.style.display = appState.pinnedRuns.size > 0 ? 'inline-block' : 'none';
     }
+    updateCsvDownloadButton();
     
     // Find the existing table elements
     const table = container.querySelector('.comparison-table');
@@ -874,7 +925,7 @@ document.addEventListener("DOMContentLoaded", () => {
     }
 
     // Create run config from parameters
-    const runConfig = createRunConfigFromParams(params);
+    const runConfig = await createRunConfigFromParams(params);
     
     // Fetch data for these parameters
     const runData = await fetchRunData({
@@ -1037,7 +1088,10 @@ document.addEventListener("DOMContentLoaded", () => {
           case 'update':
           default:
             if (runId && parameter !== undefined) {
-              updateParameterForRun(runId, parameter, value);
+              if (parameter === 'scenario') {
+                await loadScenarioShards([value]);
+              }
+              await updateParameterForRun(runId, parameter, value);
             }
             break;
         }
@@ -0,0 +1,13 @@
+// Manifest worker: loads the manifest, builds the option index and answers
+// the page's cascade and run queries (see ManifestWorker in state.js)
+import { handleManifestRequest } from './state.js';
+
+self.addEventListener('message', async (event) => {
+  const { id, type, payload } = event.data;
+  try {
+    const result = await handleManifestRequest(type, payload);
+    self.postMessage({ id, result });
+  } catch (error) {
+    self.postMessage({ id, error: error.message });
+  }
+});
@@ -24,6 +24,10 @@ export const APP_TO_API = {
 // Priority order for parameter cascading
 export const PARAMETER_PRIORITY_ORDER = ['scenario', 'scene', 'kdma_values', 'adm', 'llm', 'run_variant'];
 
+// Bitsets per parameter and option lists a BitsetIndex keeps at most
+const BITSET_INDEX_MAX_BITSETS = 64;
+const BITSET_INDEX_MAX_CACHED_OPTIONS = 10000;
+
 // Constants for KDMA processing
 const KDMA_CONSTANTS = {
   DECIMAL_PRECISION: 10, // For 1 decimal place normalization
@@ -239,103 +243,73 @@ export function decodeStateFromURL() {
 }
 
 // Parameter update system with priority-based cascading
-const updateParametersBase = (priorityOrder) => (manifest) => (currentParams, changes) => {
-  const newParams = { ...currentParams, ...changes };
+const updateParametersBase = (priorityOrder) => (manifest) => {
+  // Entries are indexed once per manifest; a CascadeIndex from the build
+  // (which follows PARAMETER_PRIORITY_ORDER) is used as it is
+  const optionIndex = manifest instanceof CascadeIndex
+    ? manifest
+    : new BitsetIndex(manifest, priorityOrder);
+  
+  // Helper to get valid options for a parameter
+  const getValidOptionsFor = (parameterName, currentSelection) =>
+    optionIndex.optionsFor(parameterName, currentSelection);
   
-  // Helper to check if manifest entry matches current selection
-  const matchesCurrentSelection = (manifestEntry, excludeParam, currentSelection) => {
-    const excludeParamIndex = priorityOrder.indexOf(excludeParam);
+  return (currentParams, changes) => {
+    const newParams = { ...currentParams, ...changes };
     
-    for (const param of priorityOrder) {
-      if (param === excludeParam) continue;
+    // Find the highest priority parameter that changed
+    const changedParams = Object.keys(changes);
+    let highestChangedIndex;
+    
+    if (changedParams.length === 0) {
+      // No changes provided - validate/correct all parameters from the beginning
+      highestChangedIndex = -1;
+    } else {
+      highestChangedIndex = Math.min(
+        ...changedParams.map(param => priorityOrder.indexOf(param))
+      );
+    }
+    
+    // Check and potentially update parameters starting from the highest changed index
+    for (let i = highestChangedIndex + 1; i < priorityOrder.length; i++) {
+      const param = priorityOrder[i];
+      const currentValue = newParams[param];
+      const validOptions = getValidOptionsFor(param, newParams);
       
-      const paramIndex = priorityOrder.indexOf(param);
+      // Only change if current value is invalid
+      let isValid = validOptions.includes(currentValue);
       
-      // Only apply constraints from higher priority parameters (already set)
-      // Lower priority parameters shouldn't constrain higher priority ones
-      if (paramIndex >= excludeParamIndex) {
-        continue; // Skip constraints from same or lower priority parameters
+      // For kdma_values, compare canonical keys
+      if (param === 'kdma_values' && !isValid && currentValue) {
+        const currentKey = KDMAUtils.serializeToKey(currentValue);
+        isValid = validOptions.some(option =>
+          option && KDMAUtils.serializeToKey(option) === currentKey
+        );
       }
       
-      // Only check constraint if the current selection has a non-null value for this parameter
-      if (currentSelection[param] !== null && currentSelection[param] !== undefined) {
-        // Special handling for kdma_values which needs deep comparison
-        if (param === 'kdma_values') {
-          const manifestKdmas = manifestEntry[param];
-          const selectionKdmas = currentSelection[param];
-          
-          if (!KDMAUtils.deepEqual(manifestKdmas, selectionKdmas)) {
-            return false;
-          }
-        } else if (manifestEntry[param] !== currentSelection[param]) {
-          return false;
-        }
+      if (!isValid) {
+        const newValue = validOptions.length > 0 ? validOptions[0] : null;
+        newParams[param] = newValue;
       }
     }
-    return true;
-  };
-  
-  // Helper to get valid options for a parameter
-  const getValidOptionsFor = (parameterName, currentSelection) => {
-    const validEntries = manifest.filter(entry => 
-      matchesCurrentSelection(entry, parameterName, currentSelection)
-    );
-    const options = [...new Set(validEntries.map(entry => entry[parameterName]))];
     
-    return options;
-  };
-  
-  // Find the highest priority parameter that changed
-  const changedParams = Object.keys(changes);
-  let highestChangedIndex;
-  
-  if (changedParams.length === 0) {
-    // No changes provided - validate/correct all parameters from the beginning
-    highestChangedIndex = -1;
-  } else {
-    highestChangedIndex = Math.min(
-      ...changedParams.map(param => priorityOrder.indexOf(param))
-    );
-  }
-  
-  // Check and potentially update parameters starting from the highest changed index
-  for (let i = highestChangedIndex + 1; i < priorityOrder.length; i++) {
-    const param = priorityOrder[i];
-    const currentValue = newParams[param];
-    const validOptions = getValidOptionsFor(param, newParams);
-    
-    // Only change if current value is invalid
-    let isValid = validOptions.includes(currentValue);
-    
-    // For kdma_values, use custom comparison logic
-    if (param === 'kdma_values' && !isValid) {
-      isValid = validOptions.some(option => {
-        return KDMAUtils.deepEqual(option, currentValue);
-      });
+    // Calculate available options for all parameters
+    const availableOptions = {};
+    for (const param of priorityOrder) {
+      availableOptions[param] = getValidOptionsFor(param, newParams);
     }
     
-    if (!isValid) {
-      const newValue = validOptions.length > 0 ? validOptions[0] : null;
-      newParams[param] = newValue;
-    }
-  }
-  
-  // Calculate available options for all parameters
-  const availableOptions = {};
-  for (const param of priorityOrder) {
-    availableOptions[param] = getValidOptionsFor(param, newParams);
-  }
-  
-  return {
-    params: newParams,
-    options: availableOptions
+    return {
+      params: newParams,
+      options: availableOptions
+    };
   };
 };
 
 // Export updateParameters with priority order already curried
 export const updateParameters = updateParametersBase(PARAMETER_PRIORITY_ORDER);
 
-export function toggleParameterLink(paramName, appState, callbacks) {
+export async function toggleParameterLink(paramName, appState, callbacks) {
   if (appState.linkedParameters.has(paramName)) {
     appState.linkedParameters.delete(paramName);
     callbacks.renderTable();
@@ -346,14 +320,14 @@ export function toggleParameterLink(paramName, appState, callbacks) {
     // When enabling link, propagate the leftmost column's value
     const firstRun = Array.from(appState.pinnedRuns.values())[0];
     const currentValue = getParameterValueFromRun(firstRun, paramName);
-    const propagationResult = propagateParameterToAllRuns(paramName, currentValue, firstRun.id, appState, callbacks);
+    const propagationResult = await propagateParameterToAllRuns(paramName, currentValue, firstRun.id, appState, callbacks);
     callbacks.renderTable();
     callbacks.updateURL();
     return propagationResult;
   }
 }
 
-export function propagateParameterToAllRuns(paramName, value, sourceRunId, appState, callbacks) {
+export async function propagateParameterToAllRuns(paramName, value, sourceRunId, appState, callbacks) {
   // Temporarily disable link for this parameter to prevent infinite loops
   const wasLinked = appState.linkedParameters.has(paramName);
   appState.linkedParameters.delete(paramName);
@@ -368,16 +342,16 @@ export function propagateParameterToAllRuns(paramName, value, sourceRunId, appSt
   // Collect run IDs that need reloading for the callback to handle
   const runIdsToReload = [];
   
-  appState.pinnedRuns.forEach((_, runId) => {
+  for (const runId of appState.pinnedRuns.keys()) {
     if (runId !== sourceRunId) {
-      callbacks.updateParameterForRun(runId, paramName, value, true);
+      await callbacks.updateParameterForRun(runId, paramName, value, true);
       
       // If this parameter change requires data reload, collect the runId
       if (needsReload) {
         runIdsToReload.push(runId);
       }
     }
-  });
+  }
   
   // Re-enable link if it was previously enabled
   if (wasLinked) {
@@ -412,13 +386,16 @@ export function isResultParameter(paramName) {
 const GlobalState = {
   manifest: null,
   parameterRunMap: new Map(),
+  columnarEntries: null,
   
   // Getters
   getManifest: () => GlobalState.manifest,
   getParameterRunMap: () => GlobalState.parameterRunMap,
+  getColumnarEntries: () => GlobalState.columnarEntries,
   
   // Setters
   setManifest: (newManifest) => { GlobalState.manifest = newManifest; },
+  setColumnarEntries: (entries) => { GlobalState.columnarEntries = entries; },
   clearParameterRunMap: () => { GlobalState.parameterRunMap.clear(); },
   setParameterRun: (key, value) => { GlobalState.parameterRunMap.set(key, value); },
   getParameterRun: (key) => GlobalState.parameterRunMap.get(key),
@@ -428,21 +405,351 @@ const GlobalState = {
   isParameterRunMapEmpty: () => GlobalState.parameterRunMap.size === 0
 };
 
-// Load and initialize manifest
+// Load the manifest in the manifest worker and return its summary with an
+// updateAppParameters that asks the worker for the cascade. The returned
+// function is async: it resolves to { params, options }.
 export async function loadManifest() {
-    const response = await fetch("./data/manifest.json");
+    const manifest = await ManifestWorker.request('load');
+    GlobalState.setManifest(manifest);
+    
+    const updateAppParameters = (currentParams, changes) =>
+      ManifestWorker.request('update', { currentParams, changes });
+    
+    return { manifest, updateAppParameters };
+}
+
+// Requests the page sends the manifest worker (manifest-worker.js), which
+// runs them on its copy of this module. Parsing the manifest, building the
+// option index and answering cascade queries then happen off the main
+// thread; only the manifest summary and each query's result are posted back.
+// Without worker support the handlers run on the main thread. Requests
+// that arrive while the manifest loads wait for it.
+export async function handleManifestRequest(type, payload = {}) {
+  if (type !== 'load') {
+    await ManifestQueries.loading;
+  }
+  switch (type) {
+    case 'load': {
+      ManifestQueries.loading = loadManifestData();
+      const { manifest, updateAppParameters } = await ManifestQueries.loading;
+      ManifestQueries.updateAppParameters = updateAppParameters;
+      return {
+        manifest_version: manifest.manifest_version,
+        generated_at: manifest.generated_at,
+        metadata: manifest.metadata
+      };
+    }
+    case 'update':
+      return ManifestQueries.updateAppParameters(payload.currentParams, payload.changes);
+    case 'loadShards':
+      return fetchScenarioShards(payload.scenarioIds);
+    case 'resolve':
+      return lookupParametersRun(payload.params);
+    default:
+      throw new Error(`Unknown manifest request: ${type}`);
+  }
+}
+
+// The cascade over the manifest loaded by handleManifestRequest
+const ManifestQueries = {
+  loading: null,
+  updateAppParameters: null
+};
+
+// Client of the manifest worker. Each request gets an ID that its reply
+// carries back. If the worker cannot be started, or fails, requests are
+// handled on the main thread, replaying the manifest load first.
+const ManifestWorker = {
+  worker: null,
+  started: false,
+  nextId: 0,
+  pending: new Map(),
+  loadRequest: null,
+
+  start: () => {
+    ManifestWorker.started = true;
+    if (typeof Worker === 'undefined') {
+      return;
+    }
+    try {
+      const worker = new Worker(new URL('./manifest-worker.js', import.meta.url), { type: 'module' });
+      worker.addEventListener('message', (event) => {
+        const { id, result, error } = event.data;
+        const request = ManifestWorker.pending.get(id);
+        if (!request) {
+          return;
+        }
+        ManifestWorker.pending.delete(id);
+        if (error !== undefined) {
+          request.reject(new Error(error));
+        } else {
+          request.resolve(result);
+        }
+      });
+      worker.addEventListener('error', (event) => {
+        console.warn('Manifest worker failed, loading the manifest on the main thread:', event.message);
+        ManifestWorker.fallBack();
+      });
+      ManifestWorker.worker = worker;
+    } catch (error) {
+      console.warn('Manifest worker unavailable, loading the manifest on the main thread:', error);
+    }
+  },
+
+  fallBack: () => {
+    ManifestWorker.worker.terminate();
+    ManifestWorker.worker = null;
+    const requests = [...ManifestWorker.pending.values()];
+    ManifestWorker.pending.clear();
+    // Replay in order, so queries follow the load they depend on
+    let queue = ManifestWorker.loadRequest && !requests.some(request => request.type === 'load')
+      ? handleManifestRequest('load', ManifestWorker.loadRequest).catch(() => {})
+      : Promise.resolve();
+    for (const { type, payload, resolve, reject } of requests) {
+      queue = queue.then(() => handleManifestRequest(type, payload).then(resolve, reject));
+    }
+  },
+
+  request: (type, payload = {}) => {
+    if (!ManifestWorker.started) {
+      ManifestWorker.start();
+    }
+    if (type === 'load') {
+      ManifestWorker.loadRequest = payload;
+    }
+    if (!ManifestWorker.worker) {
+      return handleManifestRequest(type, payload);
+    }
+    return new Promise((resolve, reject) => {
+      const id = ManifestWorker.nextId++;
+      ManifestWorker.pending.set(id, { type, payload, resolve, reject });
+      ManifestWorker.worker.postMessage({ id, type, payload });
+    });
+  }
+};
+
+// Load and initialize manifest. Builds that write manifest shards are loaded
+// from their small index, with only the first scenario's shard fetched up
+// front; loadScenarioShards fetches the others as scenarios are picked.
+// Builds with a columnar manifest are loaded from it in one request instead.
+async function loadManifestData() {
+    const index = await fetchManifestIndex();
+    if (index?.columnar_manifest) {
+      return loadWholeManifest(`./data/${index.columnar_manifest}`);
+    }
+    if (!index) {
+      return loadWholeManifest("./data/manifest.json");
+    }
+
+    GlobalState.setManifest(index);
+    GlobalState.clearParameterRunMap();
+    ManifestShards.reset(index);
+    await fetchScenarioShards(index.scenarios.slice(0, 1));
+
+    // Entries change as shards load, so look them up on every call
+    const updateAppParameters = (currentParams, changes) =>
+      ManifestShards.updater()(currentParams, changes);
+
+    return { manifest: index, updateAppParameters };
+}
+
+// Load a full or columnar manifest that covers every scenario
+async function loadWholeManifest(url) {
+    const response = await fetch(url);
     const manifest = await response.json();
     GlobalState.setManifest(manifest);
     
-    // Initialize updateParameters with the transformed manifest
+    // Initialize updateParameters with the transformed manifest, or the
+    // cascade index of columnar manifests
     const transformedManifest = transformManifestForUpdateParameters(manifest);
-    const updateAppParameters = updateParameters(transformedManifest);
+    const updateAppParameters = updateParameters(
+      manifest.cascade ? new CascadeIndex(manifest.cascade, manifest.tables) : transformedManifest
+    );
     
     return { manifest, updateAppParameters };
 }
 
+// Fetch the manifest shard index, or null when the site has none (older builds)
+async function fetchManifestIndex() {
+  try {
+    const response = await fetch("./data/manifest_index.json");
+    if (!response.ok) {
+      return null;
+    }
+    return await response.json();
+  } catch (error) {
+    return null;
+  }
+}
+
+// Entries of the loaded manifest shards, in the index's scenario order.
+// Scenarios whose shard is not loaded yet get a placeholder entry, so they
+// are still offered as scenario options. Shards carry their part of the
+// cascade index, which is used instead of the entries while all have one.
+const ManifestShards = {
+  index: null,
+  entriesByScenario: new Map(),
+  pending: new Map(),
+  cachedEntries: null,
+  cachedUpdater: null,
+  cascadeIndex: null,
+
+  reset: (index) => {
+    ManifestShards.index = index;
+    ManifestShards.entriesByScenario.clear();
+    ManifestShards.pending.clear();
+    ManifestShards.cachedEntries = null;
+    ManifestShards.cachedUpdater = null;
+    ManifestShards.cascadeIndex = new CascadeIndex(
+      index.scenarios.map(scenarioId => [scenarioId, []])
+    );
+  },
+
+  entries: () => {
+    if (!ManifestShards.cachedEntries) {
+      ManifestShards.cachedEntries = ManifestShards.index.scenarios.flatMap(scenarioId =>
+        ManifestShards.entriesByScenario.get(scenarioId) || [{
+          scenario: scenarioId,
+          scene: null,
+          kdma_values: null,
+          adm: null,
+          llm: null,
+          run_variant: null
+        }]
+      );
+    }
+    return ManifestShards.cachedEntries;
+  },
+
+  // updateParameters over the cascade index, or the entries when a shard
+  // has no cascade index; rebuilt when a shard loads
+  updater: () => {
+    if (!ManifestShards.cachedUpdater) {
+      ManifestShards.cachedUpdater = updateParameters(
+        ManifestShards.cascadeIndex || ManifestShards.entries()
+      );
+    }
+    return ManifestShards.cachedUpdater;
+  },
+
+  load: (scenarioId) => {
+    if (!ManifestShards.pending.has(scenarioId)) {
+      const shardInfo = ManifestShards.index.shards[scenarioId];
+      const loading = fetch(`./data/${shardInfo.file}`)
+        .then(response => {
+          if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+          return response.json();
+        })
+        .then(shard => {
+          const entries = [];
+          for (const experiment of shard.experiments) {
+            addScenarioEntries(experiment.key, experiment.parameters, scenarioId, experiment.scenario, entries);
+          }
+          ManifestShards.entriesByScenario.set(scenarioId, entries);
+          ManifestShards.cachedEntries = null;
+          ManifestShards.cachedUpdater = null;
+          if (shard.cascade && ManifestShards.cascadeIndex) {
+            ManifestShards.cascadeIndex.setScenarioNodes(scenarioId, shard.cascade);
+          } else {
+            ManifestShards.cascadeIndex = null;
+          }
+        })
+        .catch(error => {
+          // Let a later selection of the scenario try again
+          ManifestShards.pending.delete(scenarioId);
+          console.error(`Error loading manifest shard for ${scenarioId}:`, error);
+        });
+      ManifestShards.pending.set(scenarioId, loading);
+    }
+    return ManifestShards.pending.get(scenarioId);
+  }
+};
+
+// Fetch the manifest shards of scenarios that are not loaded yet. Call this
+// before selecting a scenario; it does nothing for unsharded manifests.
+export async function loadScenarioShards(scenarioIds) {
+  await ManifestWorker.request('loadShards', { scenarioIds });
+}
+
+async function fetchScenarioShards(scenarioIds) {
+  if (!ManifestShards.index) {
+    return;
+  }
+  const sharded = [...new Set(scenarioIds)].filter(scenarioId =>
+    ManifestShards.index.shards[scenarioId]
+  );
+  await Promise.all(sharded.map(ManifestShards.load));
+}
+
+// Load the index of per-ADM and per-scenario CSV partitions written by the build.
+// Returns null when the site has none (older or manifest-only builds).
+export async function loadCsvPartitionIndex() {
+  try {
+    const response = await fetch("./data/csv_partitions/index.json");
+    if (!response.ok) {
+      return null;
+    }
+    return await response.json();
+  } catch (error) {
+    return null;
+  }
+}
+
+// Check whether the build wrote the full CSV export; manifest-only builds do not
+export async function hasFullCsvExport() {
+  try {
+    const response = await fetch('./data/experiment_data.csv', { method: 'HEAD' });
+    return response.ok;
+  } catch (error) {
+    return false;
+  }
+}
+
+// Pick the smallest CSV download that covers every pinned run: the partition
+// for their shared scenario or shared ADM, falling back to the full export
+export function selectCsvDownload(partitionIndex, pinnedRuns) {
+  const fullExport = {
+    href: './data/experiment_data.csv',
+    filename: 'experiment_data.csv',
+    label: null
+  };
+  if (!partitionIndex || !partitionIndex.partitions || pinnedRuns.length === 0) {
+    return fullExport;
+  }
+
+  const sharedValue = (runKey) => {
+    const values = new Set(pinnedRuns.map(run => run[runKey]));
+    return values.size === 1 ? [...values][0] : null;
+  };
+  const candidates = [
+    { column: 'scenario_id', value: sharedValue('scenario'), label: 'scenario' },
+    { column: 'adm_name', value: sharedValue('admType'), label: 'ADM' }
+  ];
+
+  let best = null;
+  for (const { column, value, label } of candidates) {
+    const partition = value !== null && partitionIndex.partitions[column]?.[value];
+    if (partition && (!best || partition.bytes < best.bytes)) {
+      best = {
+        href: `./data/csv_partitions/${partition.file}`,
+        filename: `experiment_data_${partition.file.replace('/', '_')}`,
+        label: `${label} ${value}`,
+        rows: partition.rows,
+        bytes: partition.bytes
+      };
+    }
+  }
+  return best || fullExport;
+}
 
-export function resolveParametersToRun(params) {
+// Look up the run for a set of parameters (in the manifest worker)
+export async function resolveParametersToRun(params) {
+  return ManifestWorker.request('resolve', { params });
+}
+
+function lookupParametersRun(params) {
   if (GlobalState.isParameterRunMapEmpty()) {
     console.warn('parameterRunMap is empty or not initialized');
     return undefined;
@@ -453,11 +760,13 @@ export function resolveParametersToRun(params) {
   const kdmaString = KDMAUtils.serializeToKey(kdmaValues || {});
   const mapKey = `${scenario}:${scene}:${kdmaString}:${admType}:${llmBackbone}:${runVariant}`;
   
-  return GlobalState.getParameterRun(mapKey);
+  const run = GlobalState.getParameterRun(mapKey);
+  // Columnar manifests map keys to scene rows, decoded on lookup
+  return typeof run === 'number' ? GlobalState.getColumnarEntries().runInfo(run) : run;
 }
 
 export async function fetchRunData(params) {
-  const runInfo = resolveParametersToRun(params);
+  const runInfo = await resolveParametersToRun(params);
   if (!runInfo) {
     return undefined;
   }
@@ -487,8 +796,18 @@ export async function fetchRunData(params) {
   }
 }
 
-// Transform hierarchical manifest to flat array for updateParameters
+// Add a file's checksum to its URL so the server can let browsers cache it for good
+function versionedPath(path, checksum) {
+  return checksum ? `${path}?v=${checksum.split(':').pop()}` : path;
+}
+
+// Transform hierarchical manifest to flat array for updateParameters.
+// Columnar (v3) manifests are wrapped as ColumnarEntries instead.
 export function transformManifestForUpdateParameters(manifest) {
+  if (manifest.manifest_version?.startsWith('3.')) {
+    return transformColumnarManifest(manifest);
+  }
+
   const entries = [];
   
   if (!manifest.experiments) {
@@ -497,49 +816,344 @@ export function transformManifestForUpdateParameters(manifest) {
   }
   
   GlobalState.clearParameterRunMap();
+  GlobalState.setColumnarEntries(null);
   
   for (const [experimentKey, experiment] of Object.entries(manifest.experiments)) {
+    for (const [scenarioId, scenario] of Object.entries(experiment.scenarios)) {
+      addScenarioEntries(experimentKey, experiment.parameters, scenarioId, scenario, entries);
+    }
+  }
+  
+  
+  return entries;
+}
+
+// Convert a KDMA array from the manifest to object format for unified usage
+function kdmaValuesToObject(kdmaValues) {
+  const kdmaObject = {};
+  if (kdmaValues && Array.isArray(kdmaValues)) {
+    kdmaValues.forEach(kdmaItem => {
+      if (kdmaItem.kdma && kdmaItem.value !== undefined) {
+        kdmaObject[kdmaItem.kdma] = KDMAUtils.normalizeValue(kdmaItem.value);
+      }
+    });
+  }
+  return kdmaObject;
+}
+
+// Add an experiment's scenes in one scenario to entries and the parameterRunMap
+function addScenarioEntries(experimentKey, parameters, scenarioId, scenario, entries) {
+  const { adm, llm, kdma_values, run_variant } = parameters;
+  // Scenes share one KDMA object, so indexes serialize it once
+  const kdmaObject = kdmaValuesToObject(kdma_values);
+  const kdmaString = KDMAUtils.serializeToKey(kdmaObject);
+  
+  for (const [sceneId, sceneInfo] of Object.entries(scenario.scenes)) {
+    const entry = {
+      scenario: scenarioId,
+      scene: sceneId,
+      kdma_values: kdmaObject,
+      adm: adm.name,
+      llm: llm?.model_name || null,
+      run_variant: run_variant
+    };
     
-    const { adm, llm, kdma_values, run_variant } = experiment.parameters;
+    entries.push(entry);
     
-    for (const [scenarioId, scenario] of Object.entries(experiment.scenarios)) {
-      
-      for (const [sceneId, sceneInfo] of Object.entries(scenario.scenes)) {
-        // Convert KDMA array to object format for unified usage
-        const kdmaObject = {};
-        if (kdma_values && Array.isArray(kdma_values)) {
-          kdma_values.forEach(kdmaItem => {
-            if (kdmaItem.kdma && kdmaItem.value !== undefined) {
-              kdmaObject[kdmaItem.kdma] = KDMAUtils.normalizeValue(kdmaItem.value);
-            }
-          });
+    const mapKey = `${scenarioId}:${sceneId}:${kdmaString}:${adm.name}:${llm?.model_name || null}:${run_variant}`;
+    
+    GlobalState.setParameterRun(mapKey, {
+      experimentKey,
+      sourceIndex: sceneInfo.source_index,
+      inputOutputPath: versionedPath(scenario.input_output.file, scenario.input_output.checksum),
+      timingPath: scenario.timing,
+      timing_s: sceneInfo.timing_s
+    });
+  }
+}
+
+// Scene entries of a columnar (v3) manifest. Values are read from its string
+// tables through typed-array columns, so no object is built per entry.
+export class ColumnarEntries {
+  constructor(manifest) {
+    const { tables, experiments, scenes } = manifest;
+    this.tables = tables;
+    this.experiments = experiments;
+    this.length = scenes.experiment.length;
+    this.experiment = Int32Array.from(scenes.experiment);
+    this.scenario = Int32Array.from(scenes.scenario);
+    this.scene = Int32Array.from(scenes.scene);
+    this.sourceIndex = Int32Array.from(scenes.source_index);
+    this.timingS = Float64Array.from(scenes.timing_s);
+    // One object per KDMA value set, shared by all entries with that set
+    this.kdmaObjects = tables.kdma_values.map(kdmaValuesToObject);
+  }
+
+  // Value of an updateParameters parameter for an entry
+  value(index, param) {
+    switch (param) {
+      case 'scenario':
+        return this.tables.scenario[this.scenario[index]];
+      case 'scene':
+        return this.tables.scene[this.scene[index]];
+      case 'kdma_values':
+        return this.kdmaObjects[this.experiments.kdma_values[this.experiment[index]]];
+      default:
+        // adm, llm and run_variant are per-experiment columns
+        return this.tables[param][this.experiments[param][this.experiment[index]]];
+    }
+  }
+
+  // parameterRunMap value of an entry
+  runInfo(index) {
+    const experiment = this.experiment[index];
+    const { tables, experiments } = this;
+    return {
+      experimentKey: tables.experiment[experiment],
+      sourceIndex: this.sourceIndex[index],
+      inputOutputPath: versionedPath(
+        tables.path[experiments.input_output[experiment]],
+        experiments.checksum[experiment]
+      ),
+      timingPath: tables.path[experiments.timing[experiment]],
+      timing_s: this.timingS[index]
+    };
+  }
+}
+
+// Valid options of the parameter cascade, looked up in the trie the build
+// writes (see cascade_index.py) instead of scanning every entry. Each node
+// maps its children's keys to nodes in order of their first entry. Nodes of
+// columnar manifests hold codes into their string tables.
+export class CascadeIndex {
+  constructor(scenarioNodes, tables = null) {
+    this.tables = tables;
+    this.root = { children: this.decodeNodes(scenarioNodes, 0) };
+  }
+
+  // Turn [value, children] lists from the build into nodes, or
+  // [value, first] lists at the last level
+  decodeNodes(nodeLists, depth) {
+    const param = PARAMETER_PRIORITY_ORDER[depth];
+    const isKdma = param === 'kdma_values';
+    const isLeaf = depth === PARAMETER_PRIORITY_ORDER.length - 1;
+    const nodes = new Map();
+    for (const [value, childrenOrFirst] of nodeLists) {
+      const rawValue = this.tables ? this.tables[param][value] : value;
+      const nodeValue = isKdma ? kdmaValuesToObject(rawValue) : rawValue;
+      const children = isLeaf ? null : this.decodeNodes(childrenOrFirst, depth + 1);
+      nodes.set(isKdma ? KDMAUtils.serializeToKey(nodeValue) : nodeValue, {
+        value: nodeValue,
+        // An inner node's first entry is that of its first child
+        first: isLeaf ? childrenOrFirst : children.values().next().value?.first,
+        children
+      });
+    }
+    return nodes;
+  }
+
+  // Fill in a scenario's nodes from its manifest shard
+  setScenarioNodes(scenarioId, sceneNodes) {
+    const node = this.root.children.get(scenarioId);
+    node.children = this.decodeNodes(sceneNodes, 1);
+    node.first = node.children.values().next().value?.first;
+  }
+
+  // Options for a parameter under the selection of the parameters above it,
+  // in the order a scan of the entries would find them
+  optionsFor(parameterName, selection) {
+    const depth = PARAMETER_PRIORITY_ORDER.indexOf(parameterName);
+    let nodes = [this.root];
+    for (let level = 0; level < depth; level++) {
+      const param = PARAMETER_PRIORITY_ORDER[level];
+      const selected = selection[param];
+      const next = [];
+      for (const node of nodes) {
+        if (selected === null || selected === undefined) {
+          next.push(...node.children.values());
+        } else {
+          const child = node.children.get(
+            param === 'kdma_values' ? KDMAUtils.serializeToKey(selected) : selected
+          );
+          if (child) {
+            next.push(child);
+          }
+        }
+      }
+      nodes = next;
+    }
+    
+    if (nodes.length === 1) {
+      return Array.from(nodes[0].children.values(), child => child.value);
+    }
+    // A parameter above was left open: merge the branches by first entry
+    const merged = new Map();
+    for (const node of nodes) {
+      for (const [key, child] of node.children) {
+        const seen = merged.get(key);
+        if (!seen || child.first < seen.first) {
+          merged.set(key, child);
+        }
+      }
+    }
+    return [...merged.values()].sort((a, b) => a.first - b.first).map(child => child.value);
+  }
+}
+
+// Valid options of the parameter cascade over flat entries (an entries array
+// or ColumnarEntries), indexed once per manifest. Each parameter's values
+// get integer codes, with KDMA combinations coded by their canonical key so
+// no deepEqual is needed, and entries are stored as a typed-array column of
+// codes per parameter. The first time a value is selected, a bitset of the
+// entries holding it is built; options for a parameter are then read from
+// the entries in the intersection of the bitsets of the selections above it.
+export class BitsetIndex {
+  constructor(entries, priorityOrder = PARAMETER_PRIORITY_ORDER) {
+    this.priorityOrder = priorityOrder;
+    this.length = entries.length;
+    this.words = Math.ceil(this.length / 32);
+    this.optionsCache = new Map();
+    
+    // KDMA objects shared by several entries are only serialized once
+    const kdmaKeys = new Map();
+    const keyOf = (param, value) => {
+      if (param !== 'kdma_values' || !value) {
+        return value;
+      }
+      let key = kdmaKeys.get(value);
+      if (key === undefined) {
+        key = KDMAUtils.serializeToKey(value);
+        kdmaKeys.set(value, key);
+      }
+      return key;
+    };
+    const valueAt = entries instanceof ColumnarEntries
+      ? (index, param) => entries.value(index, param)
+      : (index, param) => entries[index][param];
+    this.params = {};
+    for (const param of priorityOrder) {
+      const codes = new Int32Array(this.length);
+      const codeByKey = new Map();
+      const values = [];
+      for (let i = 0; i < this.length; i++) {
+        const value = valueAt(i, param);
+        const key = keyOf(param, value);
+        let code = codeByKey.get(key);
+        if (code === undefined) {
+          code = values.length;
+          codeByKey.set(key, code);
+          values.push(value);
+        }
+        codes[i] = code;
+      }
+      this.params[param] = { codes, codeByKey, values, bitsets: new Map() };
+    }
+  }
+
+  // Bitset of the entries holding a value, built on first use
+  bitsetFor(param, code) {
+    const { codes, bitsets } = this.params[param];
+    let bitset = bitsets.get(code);
+    if (!bitset) {
+      bitset = new Uint32Array(this.words);
+      for (let i = 0; i < this.length; i++) {
+        if (codes[i] === code) {
+          bitset[i >>> 5] |= 1 << (i & 31);
         }
-        
-        const entry = {
-          scenario: scenarioId,
-          scene: sceneId,
-          kdma_values: kdmaObject,
-          adm: adm.name,
-          llm: llm?.model_name || null,
-          run_variant: run_variant
-        };
-        
-        entries.push(entry);
-        
-        const kdmaString = KDMAUtils.serializeToKey(kdmaObject);
-        const mapKey = `${scenarioId}:${sceneId}:${kdmaString}:${adm.name}:${llm?.model_name || null}:${run_variant}`;
-        
-        GlobalState.setParameterRun(mapKey, {
-          experimentKey,
-          sourceIndex: sceneInfo.source_index,
-          inputOutputPath: scenario.input_output.file,
-          timingPath: scenario.timing,
-          timing_s: sceneInfo.timing_s
-        });
+      }
+      if (bitsets.size >= BITSET_INDEX_MAX_BITSETS) {
+        bitsets.delete(bitsets.keys().next().value);
+      }
+      bitsets.set(code, bitset);
+    }
+    return bitset;
+  }
+
+  // Options for a parameter under the selection of the parameters above it,
+  // in the order of the first entry holding each
+  optionsFor(parameterName, selection) {
+    const depth = this.priorityOrder.indexOf(parameterName);
+    const selected = [];
+    for (let level = 0; level < depth; level++) {
+      const param = this.priorityOrder[level];
+      const value = selection[param];
+      if (value === null || value === undefined) {
+        continue;
+      }
+      const key = param === 'kdma_values' ? KDMAUtils.serializeToKey(value) : value;
+      const code = this.params[param].codeByKey.get(key);
+      if (code === undefined) {
+        return []; // No entry holds the selected value
+      }
+      selected.push([param, code]);
+    }
+    
+    const cacheKey = `${parameterName}|${selected.map(([param, code]) => `${param}=${code}`).join('|')}`;
+    let options = this.optionsCache.get(cacheKey);
+    if (!options) {
+      options = this.collectOptions(this.params[parameterName], selected);
+      if (this.optionsCache.size >= BITSET_INDEX_MAX_CACHED_OPTIONS) {
+        this.optionsCache.clear();
+      }
+      this.optionsCache.set(cacheKey, options);
+    }
+    return [...options];
+  }
+
+  // Distinct values of a parameter among the entries matching all selections
+  collectOptions(target, selected) {
+    const { codes, values } = target;
+    const seen = new Uint8Array(values.length);
+    const options = [];
+    const addOption = (entryIndex) => {
+      const code = codes[entryIndex];
+      if (!seen[code]) {
+        seen[code] = 1;
+        options.push(values[code]);
+      }
+    };
+    
+    if (selected.length === 0) {
+      for (let i = 0; i < this.length && options.length < values.length; i++) {
+        addOption(i);
+      }
+      return options;
+    }
+    
+    let mask = this.bitsetFor(...selected[0]);
+    if (selected.length > 1) {
+      mask = Uint32Array.from(mask);
+      for (const [param, code] of selected.slice(1)) {
+        const bitset = this.bitsetFor(param, code);
+        for (let w = 0; w < this.words; w++) {
+          mask[w] &= bitset[w];
+        }
+      }
+    }
+    for (let w = 0; w < this.words && options.length < values.length; w++) {
+      let bits = mask[w];
+      while (bits !== 0) {
+        const lowestBit = bits & -bits;
+        addOption((w << 5) + 31 - Math.clz32(lowestBit));
+        bits ^= lowestBit;
       }
     }
+    return options;
   }
+}
+
+// Map each entry of a columnar manifest to its row for resolveParametersToRun
+function transformColumnarManifest(manifest) {
+  const entries = new ColumnarEntries(manifest);
+  GlobalState.clearParameterRunMap();
+  GlobalState.setColumnarEntries(entries);
   
+  const kdmaStrings = entries.kdmaObjects.map(kdmaObject => KDMAUtils.serializeToKey(kdmaObject));
+  for (let i = 0; i < entries.length; i++) {
+    const kdmaString = kdmaStrings[manifest.experiments.kdma_values[entries.experiment[i]]];
+    const mapKey = `${entries.value(i, 'scenario')}:${entries.value(i, 'scene')}:${kdmaString}:${entries.value(i, 'adm')}:${entries.value(i, 'llm')}:${entries.value(i, 'run_variant')}`;
+    GlobalState.setParameterRun(mapKey, i);
+  }
   
   return entries;
-}
\ No newline at end of file
+}
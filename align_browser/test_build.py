@@ -1,11 +1,26 @@
 """Test the build.py script end-to-end."""
 
+import json
 import sys
 import subprocess
 import tempfile
+import tracemalloc
 import os
 from pathlib import Path
+from align_browser.build import build_frontend
+from align_browser.cascade_index import (
+    CASCADE_PARAMETERS,
+    build_cascade_index,
+    iter_cascade_entries,
+    js_object_items,
+)
+from align_browser.experiment_models import Manifest
 from align_browser.test_config import check_experiments_path_exists
+from align_browser.test_sample_data import (
+    build_sample_site,
+    create_experiment_dir,
+    create_sample_input_output_data,
+)
 
 
 def get_resolved_experiments_path():
@@ -198,6 +213,202 @@ def test_build_output_location():
             os.chdir(original_cwd)
 
 
+def _peak_build_memory(directory_count):
+    """Build a site from directory_count large experiments, returning peak traced memory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        for i in range(directory_count):
+            experiment_dir = experiments_root / f"pipeline_{i}" / "affiliation-0.5"
+            create_experiment_dir(experiment_dir)
+            # About 1 MB per directory that ends up in the CSV export
+            input_output_data = create_sample_input_output_data()
+            input_output_data[0]["output"]["choice"] = 0
+            input_output_data[0]["choice_info"] = {"reasoning": "x" * 1_000_000}
+            with open(experiment_dir / "input_output.json", "w") as f:
+                json.dump(input_output_data, f)
+
+        tracemalloc.start()
+        try:
+            build_frontend(experiments_root, temp_path / "site", use_cache=False)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert (temp_path / "site" / "data" / "experiment_data.csv").stat().st_size > (
+            directory_count * 1_000_000
+        )
+        return peak
+
+
+def test_build_peak_memory_does_not_grow_with_experiments():
+    """Test that the build streams experiments instead of holding them all in memory."""
+    small = _peak_build_memory(2)
+    large = _peak_build_memory(12)
+    # Holding every directory's CSV rows would add at least 10 MB
+    assert large < small + 3_000_000, (small, large)
+
+
+def test_build_writes_manifest_shards_per_scenario(build_site):
+    """Test that each scenario's manifest entries are written to a shard."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = build_site(Path(temp_dir)) / "data"
+        with open(data_dir / "manifest.json") as f:
+            manifest = json.load(f)
+        with open(data_dir / "manifest_index.json") as f:
+            index = json.load(f)
+
+        assert index["generated_at"] == manifest["generated_at"]
+        assert index["scenarios"] == ["June2025-AF-train", "June2025-MF-train"]
+        assert index["metadata"]["adm_types"] == ["pipeline_a", "pipeline_b"]
+
+        for scenario_id in index["scenarios"]:
+            shard_info = index["shards"][scenario_id]
+            with open(data_dir / shard_info["file"]) as f:
+                shard = json.load(f)
+            assert shard["chunk_type"] == "by_scenario"
+            assert shard["metadata"]["scenario_id"] == scenario_id
+            assert shard_info["experiments"] == len(shard["experiments"])
+
+            expected_keys = [
+                key
+                for key, experiment in manifest["experiments"].items()
+                if scenario_id in experiment["scenarios"]
+            ]
+            assert [exp["key"] for exp in shard["experiments"]] == expected_keys
+            for experiment in shard["experiments"]:
+                full = manifest["experiments"][experiment["key"]]
+                assert experiment["scenario"] == full["scenarios"][scenario_id]
+                # Only the parameters runs are selected by are kept
+                assert experiment["parameters"]["adm"] == {
+                    "name": full["parameters"]["adm"]["name"]
+                }
+                assert (
+                    experiment["parameters"]["kdma_values"]
+                    == full["parameters"]["kdma_values"]
+                )
+
+        assert index["shards"]["June2025-MF-train"]["experiments"] == 1
+
+
+def test_columnar_manifest_decodes_to_manifest_scenes(build_site):
+    """Test that the columnar manifest holds every scene of the full manifest."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = build_site(Path(temp_dir), columnar_manifest=True) / "data"
+        with open(data_dir / "manifest.json") as f:
+            manifest = json.load(f)
+        with open(data_dir / "manifest_v3.json") as f:
+            columnar = json.load(f)
+        with open(data_dir / "manifest_index.json") as f:
+            assert json.load(f)["columnar_manifest"] == "manifest_v3.json"
+
+        tables = columnar["tables"]
+        experiments = columnar["experiments"]
+        scenes = columnar["scenes"]
+        decoded = []
+        for row in range(len(scenes["experiment"])):
+            experiment = scenes["experiment"][row]
+            llm = tables["llm"][experiments["llm"][experiment]]
+            decoded.append(
+                (
+                    tables["experiment"][experiment],
+                    tables["scenario"][scenes["scenario"][row]],
+                    tables["scene"][scenes["scene"][row]],
+                    tables["adm"][experiments["adm"][experiment]],
+                    {"model_name": llm} if llm else None,
+                    tables["kdma_values"][experiments["kdma_values"][experiment]],
+                    tables["path"][experiments["input_output"][experiment]],
+                    experiments["checksum"][experiment],
+                    tables["path"][experiments["timing"][experiment]],
+                    scenes["source_index"][row],
+                    scenes["timing_s"][row],
+                )
+            )
+
+        expected = []
+        for key, experiment in manifest["experiments"].items():
+            parameters = experiment["parameters"]
+            llm = parameters["llm"]
+            for scenario_id, scenario in experiment["scenarios"].items():
+                for scene_id, scene in scenario["scenes"].items():
+                    expected.append(
+                        (
+                            key,
+                            scenario_id,
+                            scene_id,
+                            parameters["adm"]["name"],
+                            {"model_name": llm["model_name"]} if llm else None,
+                            parameters["kdma_values"],
+                            scenario["input_output"]["file"],
+                            scenario["input_output"]["checksum"],
+                            scenario["timing"],
+                            scene["source_index"],
+                            scene["timing_s"],
+                        )
+                    )
+        assert decoded == expected
+        assert len(decoded) > 1
+
+        # Without the option the columnar manifest is removed again
+        build_frontend(Path(temp_dir) / "experiments", data_dir.parent, use_cache=False)
+        assert not (data_dir / "manifest_v3.json").exists()
+
+
+def test_cascade_index_lists_options_in_entry_order(build_site):
+    """Test that each cascade index node lists the options a scan would find."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = build_site(Path(temp_dir)) / "data"
+        with open(data_dir / "manifest.json") as f:
+            manifest = Manifest.model_validate(json.load(f))
+        entries = list(iter_cascade_entries(manifest))
+        assert len({entry[:2] for entry in entries}) > 1
+
+        def check(nodes, prefix):
+            depth = len(prefix)
+            options = []
+            for entry in entries:
+                if list(entry[:depth]) == prefix and entry[depth] not in options:
+                    options.append(entry[depth])
+            assert [node[0] for node in nodes] == options
+            for node in nodes:
+                if depth == len(CASCADE_PARAMETERS) - 1:
+                    assert entries[node[1]] == tuple(prefix + [node[0]])
+                else:
+                    check(node[1], prefix + [node[0]])
+
+        check(build_cascade_index(manifest), [])
+
+
+def test_cascade_index_follows_javascript_key_order(build_site):
+    """Test that integer-like scene IDs come first, as the frontend iterates them."""
+    assert [
+        key for key, _ in js_object_items(dict.fromkeys(["b", "10", "01", "2", "a"]))
+    ] == [
+        "2",
+        "10",
+        "b",
+        "01",
+        "a",
+    ]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = build_site(Path(temp_dir)) / "data"
+        with open(data_dir / "manifest.json") as f:
+            manifest_data = json.load(f)
+        experiment = next(iter(manifest_data["experiments"].values()))
+        scenario_id, scenario = next(iter(experiment["scenarios"].items()))
+        scene = next(iter(scenario["scenes"].values()))
+        scenario["scenes"] = {
+            scene_id: {**scene, "scene_id": scene_id}
+            for scene_id in ("intro", "10", "2")
+        }
+        manifest = Manifest.model_validate(manifest_data)
+
+        entries = list(iter_cascade_entries(manifest))
+        assert [entry[1] for entry in entries[:3]] == ["2", "10", "intro"]
+        scenario_nodes = dict(build_cascade_index(manifest))[scenario_id]
+        assert [node[0] for node in scenario_nodes][:3] == ["2", "10", "intro"]
+
+
 def main():
     """Run the build tests."""
     print("🧪 Testing build.py script...\n")
@@ -205,6 +416,28 @@ def main():
     tests = [
         ("Build script functionality", test_build_script),
         ("Build output location", test_build_output_location),
+        (
+            "Build peak memory",
+            test_build_peak_memory_does_not_grow_with_experiments,
+        ),
+        (
+            "Manifest shards",
+            lambda: test_build_writes_manifest_shards_per_scenario(build_sample_site),
+        ),
+        (
+            "Columnar manifest",
+            lambda: test_columnar_manifest_decodes_to_manifest_scenes(
+                build_sample_site
+            ),
+        ),
+        (
+            "Cascade index entry order",
+            lambda: test_cascade_index_lists_options_in_entry_order(build_sample_site),
+        ),
+        (
+            "Cascade index JavaScript key order",
+            lambda: test_cascade_index_follows_javascript_key_order(build_sample_site),
+        ),
     ]
 
     passed = 0
@@ -213,12 +446,12 @@ def main():
     for test_name, test_func in tests:
         print(f"\n🔬 Running test: {test_name}")
         try:
-            if test_func():
-                print(f"✅ {test_name} PASSED")
-                passed += 1
-            else:
-                print(f"❌ {test_name} FAILED")
-                failed += 1
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+            failed += 1
         except Exception as e:
             print(f"❌ {test_name} ERROR: {e}")
             failed += 1
@@ -0,0 +1,161 @@
+"""Tests for the persistent build and checksum caches."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from align_browser.build import build_frontend
+from align_browser.build_cache import BuildCache, ChecksumCache
+from align_browser.experiment_models import (
+    calculate_file_checksum,
+    calculate_file_checksums,
+)
+from align_browser.experiment_parser import summarize_experiments_directory
+from align_browser.test_sample_data import create_experiment_dir
+
+
+def test_unchanged_directories_are_loaded_from_cache():
+    """Test that a rebuild only re-parses directories whose files changed."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        create_experiment_dir(experiments_root / "pipeline_a" / "affiliation-0.5")
+        changed_dir = experiments_root / "pipeline_b" / "affiliation-0.5"
+        create_experiment_dir(changed_dir)
+        cache_dir = temp_path / "cache"
+        checksum_file = cache_dir / "checksums.json"
+
+        def summarize():
+            checksum_cache = ChecksumCache(checksum_file)
+            results = summarize_experiments_directory(
+                experiments_root, cache=cache, checksum_cache=checksum_cache
+            )
+            cache.save()
+            checksum_cache.save()
+            return results, checksum_cache
+
+        cache = BuildCache(cache_dir)
+        first, _ = summarize()
+        assert (cache.hits, cache.misses) == (0, 2)
+
+        cache = BuildCache(cache_dir)
+        second, _ = summarize()
+        assert (cache.hits, cache.misses) == (2, 0)
+        assert [r.model_dump() for r in second] == [r.model_dump() for r in first]
+
+        # Bump the modification time of one file
+        timing_path = changed_dir / "timing.json"
+        stat = timing_path.stat()
+        os.utime(timing_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        # The checksum of input_output.json survived the fully cached build
+        cache = BuildCache(cache_dir)
+        _, checksum_cache = summarize()
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert (checksum_cache.hits, checksum_cache.misses) == (1, 0)
+
+
+def test_manifest_only_results_are_not_used_for_full_builds():
+    """Test that cached manifest-only results without CSV rows are re-parsed."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        create_experiment_dir(experiments_root / "pipeline_a" / "affiliation-0.5")
+        cache_dir = temp_path / "cache"
+
+        cache = BuildCache(cache_dir)
+        summarize_experiments_directory(
+            experiments_root, cache=cache, manifest_only=True
+        )
+        cache.save()
+
+        cache = BuildCache(cache_dir)
+        (result,) = summarize_experiments_directory(experiments_root, cache=cache)
+        cache.save()
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert not result.manifest_only
+
+        # Full results can serve manifest-only builds
+        cache = BuildCache(cache_dir)
+        summarize_experiments_directory(
+            experiments_root, cache=cache, manifest_only=True
+        )
+        assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_cache_is_discarded_on_version_change():
+    """Test that entries written by another package version are not reused."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        create_experiment_dir(experiments_root / "pipeline_a" / "affiliation-0.5")
+        cache_dir = temp_path / "cache"
+
+        cache = BuildCache(cache_dir)
+        summarize_experiments_directory(experiments_root, cache=cache)
+        cache.save()
+
+        info_path = cache_dir / "cache_info.json"
+        info = json.loads(info_path.read_text())
+        info["package_version"] = "0.0.0"
+        info_path.write_text(json.dumps(info))
+
+        cache = BuildCache(cache_dir)
+        assert not any(cache.entries_dir.iterdir())
+        summarize_experiments_directory(experiments_root, cache=cache)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_checksum_cache_reuses_unchanged_files():
+    """Test that checksums persist between builds until a file is rewritten."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        files = [temp_path / f"file_{i}.json" for i in range(4)]
+        for i, file_path in enumerate(files):
+            file_path.write_text(json.dumps({"value": i}))
+        cache_file = temp_path / "cache" / "checksums.json"
+
+        cache = ChecksumCache(cache_file)
+        checksums = calculate_file_checksums(files, cache=cache)
+        cache.save()
+        assert (cache.hits, cache.misses) == (0, 4)
+        assert checksums == {str(f): calculate_file_checksum(f) for f in files}
+        assert all(value.startswith("sha256:") for value in checksums.values())
+
+        files[0].write_text(json.dumps({"value": "changed"}))
+
+        cache = ChecksumCache(cache_file)
+        checksums = calculate_file_checksums(files[:3], cache=cache, threads=2)
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert checksums[str(files[0])] == calculate_file_checksum(files[0])
+        assert cache.checksum(temp_path / "missing.json") == ""
+        cache.save()
+
+        # Files not looked at by a build are dropped from the cache
+        cache = ChecksumCache(cache_file)
+        assert cache.lookup(files[3]) is None
+        assert cache.lookup(files[2]) is not None
+
+
+def test_rebuild_from_another_root_does_not_reuse_entries():
+    """Test that cached paths relative to one experiments root are not reused for another."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        create_experiment_dir(
+            experiments_root / "group" / "pipeline_a" / "affiliation-0.5"
+        )
+        output_dir = temp_path / "site"
+
+        build_frontend(experiments_root, output_dir)
+        build_frontend(experiments_root / "group", output_dir)
+
+        manifest = json.loads((output_dir / "data" / "manifest.json").read_text())
+        files = [
+            scenario["input_output"]["file"]
+            for experiment in manifest["experiments"].values()
+            for scenario in experiment["scenarios"].values()
+        ]
+        assert files
+        assert all((output_dir / file).exists() for file in files)
+        assert not any("group/" in file for file in files)
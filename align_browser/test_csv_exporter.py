@@ -0,0 +1,94 @@
+"""Tests for the CSV export."""
+
+import csv
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from align_browser import csv_exporter
+from align_browser.csv_exporter import (
+    CSV_FIELDNAMES,
+    PartitionedCsvWriter,
+    write_experiments_to_csv,
+)
+from align_browser.experiment_parser import iter_experiments_directory
+from align_browser.test_sample_data import (
+    create_experiment_dir,
+    create_sample_input_output_data,
+)
+
+
+def test_write_experiments_to_csv_streams_experiments():
+    """Test exporting experiments from a generator, reading timing from the models."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        for name in ("pipeline_a", "pipeline_b"):
+            experiment_dir = experiments_root / name / "affiliation-0.5"
+            create_experiment_dir(experiment_dir)
+            input_output_data = create_sample_input_output_data()
+            input_output_data[0]["output"]["choice"] = 0
+            with open(experiment_dir / "input_output.json", "w") as f:
+                json.dump(input_output_data, f)
+            with open(experiment_dir / "scores.json", "w") as f:
+                json.dump([{"score": 0.75}], f)
+
+        output_file = temp_path / "experiment_data.csv"
+        write_experiments_to_csv(
+            iter_experiments_directory(experiments_root), experiments_root, output_file
+        )
+
+        with open(output_file, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        assert [row["experiment_path"] for row in rows] == [
+            "pipeline_a/affiliation-0.5",
+            "pipeline_b/affiliation-0.5",
+        ]
+        assert rows[0]["choice_text"] == "Treat Patient A"
+        assert rows[0]["decision_time_s"] == "0.0003"
+        # scores.json holds run-level data, not per-item scores
+        assert rows[0]["score"] == ""
+
+
+def test_partitioned_csv_writer_splits_rows_by_column():
+    """Test gzip partitions per ADM and scenario, including reopened partition files."""
+    rows = [
+        dict.fromkeys(CSV_FIELDNAMES, "")
+        | {"adm_name": f"adm {i % 3}", "scenario_id": f"scenario/{i % 5}"}
+        for i in range(30)
+    ]
+    original_max_open = csv_exporter.MAX_OPEN_PARTITIONS
+    csv_exporter.MAX_OPEN_PARTITIONS = 2
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir) / "csv_partitions"
+            output_dir.mkdir()
+            (output_dir / "stale.csv.gz").write_bytes(b"")
+
+            with PartitionedCsvWriter(output_dir) as writer:
+                for row in rows:
+                    writer.writerows([row])
+            writer.publish()
+
+            index = json.loads((output_dir / "index.json").read_text())
+            assert index == writer.index
+            assert index["total_rows"] == 30
+            assert sorted(index["partitions"]["adm_name"]) == [
+                "adm 0",
+                "adm 1",
+                "adm 2",
+            ]
+            assert not (output_dir / "stale.csv.gz").exists()
+
+            partition = index["partitions"]["scenario_id"]["scenario/3"]
+            assert partition["file"] == "scenario_id/scenario_3.csv.gz"
+            assert partition["rows"] == 6
+            assert partition["bytes"] == (output_dir / partition["file"]).stat().st_size
+            with gzip.open(output_dir / partition["file"], "rt", newline="") as f:
+                partition_rows = list(csv.DictReader(f))
+            assert partition_rows == [
+                r for r in rows if r["scenario_id"] == "scenario/3"
+            ]
+    finally:
+        csv_exporter.MAX_OPEN_PARTITIONS = original_max_open
@@ -1,6 +1,7 @@
 """Tests for experiment parsing functionality."""
 
 import json
+import os
 import yaml
 import tempfile
 from pathlib import Path
@@ -13,86 +14,24 @@ from align_browser.experiment_models import (
     ExperimentData,
     ChunkedExperimentData,
     Manifest,
+    calculate_file_checksum,
 )
+from align_browser.build_cache import ChecksumCache
 from align_browser.experiment_parser import (
+    discover_experiment_directories,
     parse_experiments_directory,
     build_manifest_from_experiments,
+    summarize_experiments_directory,
+    sync_experiment_files,
 )
 from align_browser.test_config import get_experiments_path_or_skip
-
-
-def create_sample_config_data():
-    """Create sample config.yaml data for testing."""
-    return {
-        "name": "action_based",
-        "adm": {
-            "name": "pipeline_random",
-            "instance": {
-                "_target_": "align_system.algorithms.pipeline_adm.PipelineADM",
-                "steps": ["step1", "step2"],
-            },
-            "structured_inference_engine": {"model_name": "llama3.3-70b"},
-        },
-        "alignment_target": {
-            "id": "ADEPT-June2025-affiliation-0.5",
-            "kdma_values": [{"kdes": None, "kdma": "affiliation", "value": 0.5}],
-        },
-    }
-
-
-def create_sample_input_output_data():
-    """Create sample input_output.json data for testing."""
-    return [
-        {
-            "input": {
-                "scenario_id": "June2025-AF-train",
-                "alignment_target_id": "ADEPT-June2025-affiliation-0.5",
-                "full_state": {
-                    "unstructured": "Test scenario description",
-                    "characters": [],
-                },
-                "state": "Test scenario",
-                "choices": [
-                    {
-                        "action_id": "treat_patient_a",
-                        "action_type": "TREAT_PATIENT",
-                        "unstructured": "Treat Patient A",
-                    }
-                ],
-            },
-            "output": {
-                "choice": "treat_patient_a",
-                "justification": "Test justification",
-            },
-        }
-    ]
-
-
-def create_sample_scores_data():
-    """Create sample scores.json data for testing."""
-    return [
-        {
-            "alignment_source": [
-                {"scenario_id": "June2025-AF-train", "probes": ["Probe 1", "Probe 2"]}
-            ]
-        }
-    ]
-
-
-def create_sample_timing_data():
-    """Create sample timing.json data for testing."""
-    return {
-        "scenarios": [
-            {
-                "n_actions_taken": 92,
-                "total_time_s": 0.026,
-                "avg_time_s": 0.0003,
-                "max_time_s": 0.0005,
-                "raw_times_s": [0.0003, 0.0004, 0.0002],
-            }
-        ],
-        "raw_times_s": [0.0003, 0.0004, 0.0002],
-    }
+from align_browser.test_sample_data import (
+    create_experiment_dir,
+    create_sample_config_data,
+    create_sample_input_output_data,
+    create_sample_scores_data,
+    create_sample_timing_data,
+)
 
 
 def test_kdma_value_model():
@@ -202,6 +141,34 @@ def test_experiment_data_from_directory():
         assert len(experiment.timing.scenarios) == 1
 
 
+def test_mixed_kdma_experiments_share_parsed_files():
+    """Test that every alignment target of a mixed KDMA run shares one parse."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        experiment_dir = Path(temp_dir) / "pipeline_mixed"
+        config_data = create_sample_config_data()
+        del config_data["alignment_target"]
+        create_experiment_dir(experiment_dir, config_data)
+
+        input_output_data = [
+            item for _ in range(3) for item in create_sample_input_output_data()
+        ]
+        targets = ["ADEPT-June2025-affiliation-0.5", "ADEPT-June2025-merit-0.2"]
+        for i, item in enumerate(input_output_data):
+            item["input"]["alignment_target_id"] = targets[i % 2]
+        with open(experiment_dir / "input_output.json", "w") as f:
+            json.dump(input_output_data, f)
+
+        experiments = parse_experiments_directory(experiment_dir)
+
+        assert len(experiments) == 2
+        first, second = experiments
+        assert [e.config.alignment_target.id for e in experiments] == targets
+        assert [e.input_output.data[0].original_index for e in experiments] == [0, 1]
+        assert first.timing is second.timing
+        assert first.scores is second.scores
+        assert first.config.adm is second.config.adm
+
+
 def test_has_required_files():
     """Test checking for required files."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -326,6 +293,246 @@ def test_parse_experiments_directory_excludes_outdated():
         )
 
 
+def test_parse_experiments_directory_parallel_matches_serial():
+    """Test that parsing with a process pool returns the same experiments in order."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        experiments_root = Path(temp_dir) / "experiments"
+
+        for value in ["0.0", "0.5", "1.0"]:
+            config_data = create_sample_config_data()
+            config_data["alignment_target"] = {
+                "id": f"ADEPT-June2025-affiliation-{value}",
+                "kdma_values": [{"kdma": "affiliation", "value": float(value)}],
+            }
+            create_experiment_dir(
+                experiments_root / "pipeline_test" / f"affiliation-{value}",
+                config_data,
+            )
+
+        # A directory with the required files but invalid content is reported and skipped
+        broken_dir = experiments_root / "pipeline_broken" / "affiliation-0.5"
+        create_experiment_dir(broken_dir)
+        (broken_dir / "timing.json").write_text("{}")
+
+        serial = parse_experiments_directory(experiments_root)
+        parallel = parse_experiments_directory(experiments_root, jobs=2)
+
+        assert len(serial) == 3
+        assert [exp.key for exp in parallel] == [exp.key for exp in serial]
+        assert [exp.experiment_path for exp in parallel] == [
+            exp.experiment_path for exp in serial
+        ]
+
+
+def test_discover_experiment_directories_prunes_subtrees():
+    """Test that discovery skips OUTDATED subtrees and stops at experiment directories."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        experiments_root = Path(temp_dir) / "experiments"
+
+        first = experiments_root / "pipeline_b" / "affiliation-0.5"
+        second = experiments_root / "pipeline_a" / "deeply" / "nested" / "run"
+        create_experiment_dir(first)
+        create_experiment_dir(second)
+
+        # Never entered: nested inside an experiment, or under an OUTDATED directory
+        create_experiment_dir(first / "nested_run")
+        create_experiment_dir(experiments_root / "OUTDATED_runs" / "a" / "b" / "c")
+
+        # Missing .hydra/config.yaml
+        incomplete = experiments_root / "pipeline_c" / "incomplete"
+        incomplete.mkdir(parents=True)
+        (incomplete / "input_output.json").touch()
+        (incomplete / "timing.json").touch()
+
+        experiment_dirs, stats = discover_experiment_directories(experiments_root)
+
+        assert experiment_dirs == [second, first]
+        assert stats.experiment_directories == 2
+        assert stats.directories_pruned == 1
+        # root, pipeline_a, deeply, nested, run, pipeline_b, affiliation-0.5,
+        # pipeline_c, incomplete
+        assert stats.directories_scanned == 9
+
+        threaded_dirs, threaded_stats = discover_experiment_directories(
+            experiments_root, threads=4
+        )
+        assert threaded_dirs == experiment_dirs
+        assert threaded_stats == stats
+
+
+def test_discover_experiment_directories_root_is_experiment():
+    """Test discovery when the root path itself is an experiment directory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        experiment_dir = Path(temp_dir) / "run"
+        create_experiment_dir(experiment_dir)
+
+        experiment_dirs, stats = discover_experiment_directories(experiment_dir)
+
+        assert experiment_dirs == [experiment_dir]
+        assert stats.directories_scanned == 1
+
+
+def test_sync_experiment_files_is_incremental():
+    """Test that syncing copies only changed files and removes orphans."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        data_output_dir = temp_path / "site" / "data"
+        data_output_dir.mkdir(parents=True)
+        (data_output_dir / "manifest.json").write_text("{}")
+        (data_output_dir / ".csv_partitions.tmp").mkdir()
+
+        kept_dir = experiments_root / "pipeline_a" / "affiliation-0.5"
+        removed_dir = experiments_root / "pipeline_b" / "affiliation-0.5"
+        create_experiment_dir(kept_dir)
+        create_experiment_dir(removed_dir)
+
+        stats = sync_experiment_files(
+            [kept_dir, removed_dir], experiments_root, data_output_dir
+        )
+        assert (stats.files_copied, stats.files_skipped) == (6, 0)
+        assert (
+            data_output_dir / "pipeline_a" / "affiliation-0.5" / "timing.json"
+        ).read_text() == (kept_dir / "timing.json").read_text()
+
+        # Nothing changed, so nothing is copied; both sides of each file were hashed
+        checksum_cache = ChecksumCache(temp_path / "checksums.json")
+        stats = sync_experiment_files(
+            [kept_dir, removed_dir],
+            experiments_root,
+            data_output_dir,
+            "checksum",
+            checksum_cache=checksum_cache,
+        )
+        assert (stats.files_copied, stats.files_skipped) == (0, 6)
+        assert stats.bytes_copied == 0
+        assert (checksum_cache.hits, checksum_cache.misses) == (0, 12)
+
+        # One file changed and one experiment is no longer published
+        with open(kept_dir / "timing.json", "w") as f:
+            json.dump({"scenarios": [], "raw_times_s": []}, f)
+        stats = sync_experiment_files([kept_dir], experiments_root, data_output_dir)
+        assert (stats.files_copied, stats.files_skipped) == (1, 2)
+        assert stats.files_deleted == 3
+        assert not (data_output_dir / "pipeline_b").exists()
+        assert (data_output_dir / "manifest.json").exists()
+        # Empty directories that never held experiment files are not removed
+        assert (data_output_dir / ".csv_partitions.tmp").is_dir()
+        assert json.loads(
+            (
+                data_output_dir / "pipeline_a" / "affiliation-0.5" / "timing.json"
+            ).read_text()
+        ) == {"scenarios": [], "raw_times_s": []}
+
+
+def test_sync_experiment_files_link_modes():
+    """Test publishing experiment files as hardlinks and symlinks."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        data_output_dir = temp_path / "site" / "data"
+        experiment_dir = experiments_root / "pipeline_a" / "affiliation-0.5"
+        create_experiment_dir(experiment_dir)
+        source = experiment_dir / "input_output.json"
+        target = (
+            data_output_dir / "pipeline_a" / "affiliation-0.5" / "input_output.json"
+        )
+
+        stats = sync_experiment_files(
+            [experiment_dir], experiments_root, data_output_dir, link_mode="hardlink"
+        )
+        assert stats.files_linked == 3
+        assert stats.bytes_copied == 0
+        assert os.path.samefile(source, target)
+
+        # Switching modes replaces the links
+        stats = sync_experiment_files(
+            [experiment_dir], experiments_root, data_output_dir, link_mode="symlink"
+        )
+        assert stats.files_linked == 3
+        assert target.is_symlink()
+        assert target.read_text() == source.read_text()
+
+        stats = sync_experiment_files(
+            [experiment_dir], experiments_root, data_output_dir, link_mode="symlink"
+        )
+        assert stats.files_skipped == 3
+
+        stats = sync_experiment_files(
+            [experiment_dir], experiments_root, data_output_dir, link_mode="copy"
+        )
+        assert stats.files_copied == 3
+        assert not target.is_symlink()
+        assert not os.path.samefile(source, target)
+
+        # Reflinks either work or fall back to copies, depending on the filesystem
+        stats = sync_experiment_files(
+            [experiment_dir], experiments_root, data_output_dir, link_mode="reflink"
+        )
+        assert stats.files_skipped == 3
+        assert target.read_text() == source.read_text()
+
+
+def test_summarize_publishes_copies_from_parsed_files():
+    """Test that parsing writes copies a following sync treats as up to date."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        data_output_dir = temp_path / "site" / "data"
+        experiment_dir = experiments_root / "pipeline_a" / "affiliation-0.5"
+        create_experiment_dir(experiment_dir)
+
+        results = summarize_experiments_directory(
+            experiments_root, publish_dir=data_output_dir
+        )
+        (summary,) = results[0].summaries
+        source = experiment_dir / "input_output.json"
+        assert summary.input_output_checksum == calculate_file_checksum(source)
+
+        target_dir = data_output_dir / "pipeline_a" / "affiliation-0.5"
+        for name in ("input_output.json", "scores.json", "timing.json"):
+            assert (target_dir / name).read_bytes() == (
+                experiment_dir / name
+            ).read_bytes()
+            assert not os.path.samefile(experiment_dir / name, target_dir / name)
+
+        stats = sync_experiment_files(
+            [experiment_dir], experiments_root, data_output_dir
+        )
+        assert (stats.files_copied, stats.files_skipped) == (0, 3)
+
+
+def test_manifest_only_summaries_match_full_parse():
+    """Test that the manifest-only parse summarizes directories like a full parse."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        experiments_root = Path(temp_dir) / "experiments"
+        create_experiment_dir(experiments_root / "pipeline_a" / "affiliation-0.5")
+
+        mixed_dir = experiments_root / "pipeline_mixed"
+        config_data = create_sample_config_data()
+        del config_data["alignment_target"]
+        create_experiment_dir(mixed_dir, config_data)
+        input_output_data = create_sample_input_output_data()
+        second_item = create_sample_input_output_data()[0]
+        second_item["input"]["alignment_target_id"] = None
+        second_item["input"]["full_state"]["meta_info"] = {"scene_id": 7}
+        input_output_data.append(second_item)
+        with open(mixed_dir / "input_output.json", "w") as f:
+            json.dump(input_output_data, f)
+        with open(mixed_dir / "timing.json", "w") as f:
+            json.dump({"scenarios": [], "raw_times_s": [0.5, 1.5]}, f)
+
+        full = summarize_experiments_directory(experiments_root)
+        lean = summarize_experiments_directory(experiments_root, manifest_only=True)
+
+        assert [len(r.summaries) for r in full] == [1, 2]
+        assert [r.model_dump()["summaries"] for r in lean] == [
+            r.model_dump()["summaries"] for r in full
+        ]
+        assert not any(r.manifest_only for r in full)
+        assert all(r.manifest_only and not r.csv_rows for r in lean)
+
+
 def test_run_variant_conflict_resolution():
     """Test that run_variant is added to experiment keys when conflicts occur."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -656,9 +863,17 @@ def run_all_tests():
         test_input_output_file_model,
         test_scores_file_model,
         test_experiment_data_from_directory,
+        test_mixed_kdma_experiments_share_parsed_files,
         test_has_required_files,
         test_parse_experiments_directory,
         test_parse_experiments_directory_excludes_outdated,
+        test_parse_experiments_directory_parallel_matches_serial,
+        test_discover_experiment_directories_prunes_subtrees,
+        test_discover_experiment_directories_root_is_experiment,
+        test_sync_experiment_files_is_incremental,
+        test_sync_experiment_files_link_modes,
+        test_summarize_publishes_copies_from_parsed_files,
+        test_manifest_only_summaries_match_full_parse,
         test_run_variant_conflict_resolution,
         test_build_manifest_from_experiments,
         test_chunked_experiment_data_model,
@@ -0,0 +1,106 @@
+"""Tests for the frontend's option engines, run on node against the reference scan."""
+
+import copy
+import json
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+import pytest
+from align_browser.build import build_frontend
+from align_browser.test_sample_data import (
+    create_experiment_dir,
+    create_sample_config_data,
+    create_sample_input_output_data,
+    create_sample_timing_data,
+)
+
+CHECK_SCRIPT = (
+    Path(__file__).resolve().parent.parent / "scripts" / "check_option_engines.mjs"
+)
+
+
+def create_option_tree(experiments_root):
+    """
+    Write experiments that exercise every cascade parameter.
+
+    Two ADMs, one of them with two LLMs and a rerun told apart by
+    run_variant, two KDMA targets, and scenarios whose scene IDs mix
+    integer-like and other keys.
+    """
+    scenes = {
+        "June2025-AF-train": ["intro", "10", "2"],
+        "June2025-MF-train": ["2", "intro"],
+    }
+    for adm_dir in ("pipeline_a", "pipeline_a_rerun", "pipeline_b"):
+        adm_name = "pipeline_b" if adm_dir == "pipeline_b" else "pipeline_a"
+        llms = (
+            ["llama3.3-70b"]
+            if adm_name == "pipeline_b"
+            else ["llama3.3-70b", "mistral-7b"]
+        )
+        for llm in llms:
+            for kdma, value in (("affiliation", 0.5), ("merit", 0.0)):
+                target = f"ADEPT-June2025-{kdma}-{value}"
+                config_data = create_sample_config_data()
+                config_data["adm"]["name"] = adm_name
+                config_data["adm"]["structured_inference_engine"]["model_name"] = llm
+                config_data["alignment_target"] = {
+                    "id": target,
+                    "kdma_values": [{"kdes": None, "kdma": kdma, "value": value}],
+                }
+                experiment_dir = experiments_root / adm_dir / llm / f"{kdma}-{value}"
+                create_experiment_dir(experiment_dir, config_data)
+
+                sample_item = create_sample_input_output_data()[0]
+                items = []
+                for scenario_id, scene_ids in scenes.items():
+                    if adm_name == "pipeline_b":
+                        scene_ids = scene_ids[:-1]
+                    for scene_id in scene_ids:
+                        item = copy.deepcopy(sample_item)
+                        item["input"]["scenario_id"] = scenario_id
+                        item["input"]["alignment_target_id"] = target
+                        item["input"]["full_state"]["meta_info"] = {
+                            "scene_id": scene_id
+                        }
+                        item["output"]["choice"] = 0
+                        items.append(item)
+                with open(experiment_dir / "input_output.json", "w") as f:
+                    json.dump(items, f)
+                timing_data = create_sample_timing_data()
+                timing_data["raw_times_s"] = [0.0003] * len(items)
+                with open(experiment_dir / "timing.json", "w") as f:
+                    json.dump(timing_data, f)
+
+
+def test_option_engines_match_reference_scan():
+    """Test every option engine, the manifest worker and its fallback against the scan."""
+    node = shutil.which("node")
+    if node is None or not CHECK_SCRIPT.exists():
+        pytest.skip("node and scripts/check_option_engines.mjs are required")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        create_option_tree(experiments_root)
+        site_dirs = []
+        for name, columnar_manifest in (("sharded", False), ("columnar", True)):
+            site_dir = temp_path / name
+            build_frontend(
+                experiments_root,
+                site_dir,
+                use_cache=False,
+                columnar_manifest=columnar_manifest,
+            )
+            site_dirs.append(str(site_dir))
+
+        result = subprocess.run(
+            [node, str(CHECK_SCRIPT), *site_dirs],
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        print(result.stdout, result.stderr)
+        assert result.returncode == 0
+        assert "CascadeIndex" in result.stdout
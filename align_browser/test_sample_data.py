@@ -0,0 +1,118 @@
+"""Sample experiment data shared by test files."""
+
+import copy
+import json
+import yaml
+from align_browser.build import build_frontend
+
+
+def create_sample_config_data():
+    """Create sample config.yaml data for testing."""
+    return {
+        "name": "action_based",
+        "adm": {
+            "name": "pipeline_random",
+            "instance": {
+                "_target_": "align_system.algorithms.pipeline_adm.PipelineADM",
+                "steps": ["step1", "step2"],
+            },
+            "structured_inference_engine": {"model_name": "llama3.3-70b"},
+        },
+        "alignment_target": {
+            "id": "ADEPT-June2025-affiliation-0.5",
+            "kdma_values": [{"kdes": None, "kdma": "affiliation", "value": 0.5}],
+        },
+    }
+
+
+def create_sample_input_output_data():
+    """Create sample input_output.json data for testing."""
+    return [
+        {
+            "input": {
+                "scenario_id": "June2025-AF-train",
+                "alignment_target_id": "ADEPT-June2025-affiliation-0.5",
+                "full_state": {
+                    "unstructured": "Test scenario description",
+                    "characters": [],
+                },
+                "state": "Test scenario",
+                "choices": [
+                    {
+                        "action_id": "treat_patient_a",
+                        "action_type": "TREAT_PATIENT",
+                        "unstructured": "Treat Patient A",
+                    }
+                ],
+            },
+            "output": {
+                "choice": "treat_patient_a",
+                "justification": "Test justification",
+            },
+        }
+    ]
+
+
+def create_sample_scores_data():
+    """Create sample scores.json data for testing."""
+    return [
+        {
+            "alignment_source": [
+                {"scenario_id": "June2025-AF-train", "probes": ["Probe 1", "Probe 2"]}
+            ]
+        }
+    ]
+
+
+def create_sample_timing_data():
+    """Create sample timing.json data for testing."""
+    return {
+        "scenarios": [
+            {
+                "n_actions_taken": 92,
+                "total_time_s": 0.026,
+                "avg_time_s": 0.0003,
+                "max_time_s": 0.0005,
+                "raw_times_s": [0.0003, 0.0004, 0.0002],
+            }
+        ],
+        "raw_times_s": [0.0003, 0.0004, 0.0002],
+    }
+
+
+def create_experiment_dir(experiment_dir, config_data=None):
+    """Write a complete sample experiment into experiment_dir."""
+    hydra_dir = experiment_dir / ".hydra"
+    hydra_dir.mkdir(parents=True)
+
+    with open(hydra_dir / "config.yaml", "w") as f:
+        yaml.dump(config_data or create_sample_config_data(), f)
+    with open(experiment_dir / "input_output.json", "w") as f:
+        json.dump(create_sample_input_output_data(), f)
+    with open(experiment_dir / "scores.json", "w") as f:
+        json.dump(create_sample_scores_data(), f)
+    with open(experiment_dir / "timing.json", "w") as f:
+        json.dump(create_sample_timing_data(), f)
+
+
+def build_sample_site(temp_path, **build_options):
+    """Build a site from two ADMs, one of them with a second scenario."""
+    experiments_root = temp_path / "experiments"
+    for adm_name in ("pipeline_a", "pipeline_b"):
+        experiment_dir = experiments_root / adm_name / "affiliation-0.5"
+        config_data = create_sample_config_data()
+        config_data["adm"]["name"] = adm_name
+        create_experiment_dir(experiment_dir, config_data)
+
+        input_output_data = create_sample_input_output_data()
+        input_output_data[0]["output"]["choice"] = 0
+        if adm_name == "pipeline_b":
+            second = copy.deepcopy(input_output_data[0])
+            second["input"]["scenario_id"] = "June2025-MF-train"
+            input_output_data.append(second)
+        with open(experiment_dir / "input_output.json", "w") as f:
+            json.dump(input_output_data, f)
+
+    site_dir = temp_path / "site"
+    build_frontend(experiments_root, site_dir, use_cache=False, **build_options)
+    return site_dir
@@ -0,0 +1,494 @@
+"""Tests for the WSGI app serving built sites."""
+
+import csv
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+from pathlib import Path
+from wsgiref.util import FileWrapper, setup_testing_defaults
+from align_browser.build import build_frontend
+from align_browser import server
+from align_browser.server import FILE_BLOCK_SIZE, create_app
+from align_browser.test_sample_data import (
+    create_experiment_dir,
+    create_sample_input_output_data,
+)
+
+
+def request(app, path, query="", headers=None):
+    """Call a WSGI app, returning the status, headers and body."""
+    environ = {"PATH_INFO": path, "QUERY_STRING": query}
+    for name, value in (headers or {}).items():
+        environ["HTTP_" + name.upper().replace("-", "_")] = value
+    setup_testing_defaults(environ)
+    response = {}
+
+    def start_response(status, headers):
+        response["status"] = status
+        response["headers"] = dict(headers)
+
+    body = b"".join(app(environ, start_response))
+    return response["status"], response["headers"], body
+
+
+def read_csv(body):
+    return list(csv.DictReader(io.StringIO(body.decode("utf-8"))))
+
+
+def test_export_csv_streams_selected_rows(build_site):
+    """Test that the export endpoint matches the build's CSV and applies filters."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        site_dir = build_site(Path(temp_dir))
+        app = create_app(site_dir)
+
+        status, headers, body = request(app, "/api/export.csv")
+        assert status == "200 OK"
+        assert headers["Content-Type"] == "text/csv; charset=utf-8"
+        assert "Content-Length" not in headers
+        with open(site_dir / "data" / "experiment_data.csv", newline="") as f:
+            assert read_csv(body) == list(csv.DictReader(f))
+
+        _, _, body = request(app, "/api/export.csv", "adm=pipeline_b")
+        rows = read_csv(body)
+        assert [row["scenario_id"] for row in rows] == [
+            "June2025-AF-train",
+            "June2025-MF-train",
+        ]
+
+        _, _, body = request(
+            app,
+            "/api/export.csv",
+            "scenario=June2025-AF-train&kdma=affiliation-0.5",
+        )
+        assert [row["adm_name"] for row in read_csv(body)] == [
+            "pipeline_a",
+            "pipeline_b",
+        ]
+
+        # Unknown values select nothing but still return the header
+        _, _, body = request(app, "/api/export.csv", "adm=missing")
+        assert body.decode("utf-8").strip().startswith("experiment_path,")
+        assert read_csv(body) == []
+
+        # An experiment whose files cannot be loaded is skipped, not truncating
+        # the response
+        manifest = json.loads((site_dir / "data" / "manifest.json").read_text())
+        broken = [
+            scenario["timing"]
+            for experiment in manifest["experiments"].values()
+            if experiment["parameters"]["adm"]["name"] == "pipeline_b"
+            for scenario in experiment["scenarios"].values()
+        ]
+        for timing_path in broken:
+            (site_dir / timing_path).write_text("{not json")
+        status, _, body = request(app, "/api/export.csv")
+        assert status == "200 OK"
+        rows = read_csv(body)
+        assert rows
+        assert {row["adm_name"] for row in rows} == {"pipeline_a"}
+
+
+def test_export_csv_matches_build_csv_for_run_variants():
+    """Test that the endpoint and the build's CSVs agree on resolved run variants."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        experiments_root = temp_path / "experiments"
+        # Identical parameters, told apart by run_variant in the manifest
+        input_output_data = create_sample_input_output_data()
+        input_output_data[0]["output"]["choice"] = 0
+        for adm_dir in ("pipeline_a", "pipeline_a_rerun", "pipeline_b"):
+            experiment_dir = experiments_root / adm_dir / "affiliation-0.5"
+            create_experiment_dir(experiment_dir)
+            with open(experiment_dir / "input_output.json", "w") as f:
+                json.dump(input_output_data, f)
+        site_dir = temp_path / "site"
+        build_frontend(experiments_root, site_dir, use_cache=False)
+
+        _, _, body = request(create_app(site_dir), "/api/export.csv")
+        exported = read_csv(body)
+        with open(site_dir / "data" / "experiment_data.csv", newline="") as f:
+            built = list(csv.DictReader(f))
+        partition_dir = site_dir / "data" / "csv_partitions" / "adm_name"
+        partitioned = [
+            row
+            for partition in sorted(partition_dir.iterdir())
+            for row in read_csv(gzip.decompress(partition.read_bytes()))
+        ]
+
+        def by_path(rows):
+            return sorted(rows, key=lambda row: row["experiment_path"])
+
+        assert len({row["run_variant"] for row in built}) == 3
+        assert by_path(exported) == by_path(built) == by_path(partitioned)
+
+
+def test_static_files_stay_inside_site_directory():
+    """Test serving static files and refusing paths that leave the site."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        site_dir = temp_path / "site"
+        site_dir.mkdir()
+        (site_dir / "index.html").write_text("<html></html>")
+        (temp_path / "secret.txt").write_text("secret")
+        app = create_app(site_dir)
+
+        status, headers, body = request(app, "/")
+        assert status == "200 OK"
+        assert headers["Content-Type"] == "text/html"
+        assert body == b"<html></html>"
+
+        assert request(app, "/../secret.txt")[0] == "404 Not Found"
+        assert request(app, "/missing.js")[0] == "404 Not Found"
+        # No manifest has been built yet
+        assert request(app, "/api/export.csv")[0] == "404 Not Found"
+
+
+def test_conditional_requests_return_not_modified(build_site):
+    """Test ETag and Last-Modified validators, 304 responses and Cache-Control."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        site_dir = build_site(Path(temp_dir))
+        app = create_app(site_dir)
+        manifest = json.loads((site_dir / "data" / "manifest.json").read_text())
+        data_path, info = next(iter(manifest["files"].items()))
+        checksum = info["checksum"]
+
+        # Only requests for data files read the manifest's checksums
+        loads = []
+        original_load = server.load_manifest_file_checksums
+        server.load_manifest_file_checksums = lambda site_dir: (
+            loads.append(site_dir) or original_load(site_dir)
+        )
+        try:
+            request(app, "/index.html")
+            assert loads == []
+            request(app, "/" + data_path)
+            request(app, "/" + data_path)
+            assert loads == [site_dir]
+        finally:
+            server.load_manifest_file_checksums = original_load
+
+        # Files listed in the manifest are tagged with their sha256 checksum
+        status, headers, body = request(app, "/" + data_path)
+        assert status == "200 OK"
+        assert headers["ETag"] == '"{}"'.format(checksum.replace(":", "-"))
+        assert headers["Cache-Control"] == "no-cache"
+        assert body == (site_dir / data_path).read_bytes()
+
+        status, headers, body = request(
+            app, "/" + data_path, headers={"If-None-Match": headers["ETag"]}
+        )
+        assert (status, body) == ("304 Not Modified", b"")
+        assert "Content-Type" not in headers
+
+        # Requests naming the current checksum may be cached for good
+        _, headers, _ = request(app, "/" + data_path, "v=" + checksum.split(":")[1])
+        assert "immutable" in headers["Cache-Control"]
+        _, headers, _ = request(app, "/" + data_path, "v=outdated")
+        assert headers["Cache-Control"] == "no-cache"
+
+        # Other files are tagged by size and modification time
+        _, headers, _ = request(app, "/index.html")
+        last_modified = headers["Last-Modified"]
+        assert headers["ETag"].startswith('"') and "sha256" not in headers["ETag"]
+        status, _, _ = request(
+            app, "/index.html", headers={"If-Modified-Since": last_modified}
+        )
+        assert status == "304 Not Modified"
+        # If-None-Match takes precedence over If-Modified-Since
+        status, _, _ = request(
+            app,
+            "/index.html",
+            headers={"If-None-Match": '"other"', "If-Modified-Since": last_modified},
+        )
+        assert status == "200 OK"
+
+        # A data file changed after the build no longer uses the manifest checksum
+        data_file = site_dir / data_path
+        data_file.write_text("[]")
+        stat = data_file.stat()
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        status, headers, _ = request(
+            app,
+            "/" + data_path,
+            headers={"If-None-Match": '"{}"'.format(checksum.replace(":", "-"))},
+        )
+        assert status == "200 OK"
+        assert "sha256" not in headers["ETag"]
+
+
+def test_large_files_are_streamed_in_blocks():
+    """Test that serving a file holds one block in memory rather than the file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        site_dir = Path(temp_dir)
+        size = 32 * 1024 * 1024
+        with open(site_dir / "large.json", "wb") as f:
+            f.truncate(size)
+        app = create_app(site_dir)
+
+        environ = {"PATH_INFO": "/large.json"}
+        setup_testing_defaults(environ)
+        response = {}
+
+        def start_response(status, headers):
+            response["headers"] = dict(headers)
+
+        tracemalloc.start()
+        try:
+            body = app(environ, start_response)
+            sent = sum(len(block) for block in body)
+            body.close()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert sent == size
+        assert response["headers"]["Content-Length"] == str(size)
+        assert peak < 4 * FILE_BLOCK_SIZE
+
+
+def test_range_requests_return_partial_content():
+    """Test single byte ranges, If-Range and unsatisfiable ranges."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        site_dir = Path(temp_dir)
+        content = bytes(range(100))
+        (site_dir / "data.json").write_bytes(content)
+        app = create_app(site_dir)
+
+        status, headers, body = request(app, "/data.json")
+        assert headers["Accept-Ranges"] == "bytes"
+        etag = headers["ETag"]
+
+        for header, expected in [
+            ("bytes=10-19", content[10:20]),
+            ("bytes=90-", content[90:]),
+            ("bytes=-5", content[-5:]),
+            ("bytes=95-500", content[95:]),
+        ]:
+            status, headers, body = request(
+                app, "/data.json", headers={"Range": header}
+            )
+            assert status == "206 Partial Content"
+            assert body == expected
+            assert headers["Content-Length"] == str(len(expected))
+            first = len(content) - len(expected) if header != "bytes=10-19" else 10
+            assert headers["Content-Range"] == (
+                f"bytes {first}-{first + len(expected) - 1}/100"
+            )
+
+        # Multiple or malformed ranges are answered with the whole file
+        for header in ("bytes=0-1,5-6", "bytes=5-2", "items=0-1", "bytes=x-"):
+            status, _, body = request(app, "/data.json", headers={"Range": header})
+            assert (status, body) == ("200 OK", content)
+
+        status, headers, _ = request(app, "/data.json", headers={"Range": "bytes=100-"})
+        assert status == "416 Range Not Satisfiable"
+        assert headers["Content-Range"] == "bytes */100"
+
+        # If-Range only applies the range while the file is unchanged
+        status, _, body = request(
+            app, "/data.json", headers={"Range": "bytes=0-9", "If-Range": etag}
+        )
+        assert (status, body) == ("206 Partial Content", content[:10])
+        status, _, body = request(
+            app, "/data.json", headers={"Range": "bytes=0-9", "If-Range": '"stale"'}
+        )
+        assert (status, body) == ("200 OK", content)
+
+
+def test_precompressed_siblings_are_negotiated(build_site):
+    """Test that gzip siblings are built, sent on request and kept in sync."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        site_dir = build_site(temp_path, precompress=True)
+        data_dir = site_dir / "data"
+        input_output_path = data_dir / "pipeline_a/affiliation-0.5/input_output.json"
+        for path in (
+            site_dir / "index.html",
+            site_dir / "app.js",
+            data_dir / "manifest.json",
+            data_dir / "experiment_data.csv",
+            input_output_path,
+            input_output_path.with_name("timing.json"),
+        ):
+            assert gzip.decompress(
+                (path.parent / (path.name + ".gz")).read_bytes()
+            ) == (path.read_bytes())
+        app = create_app(site_dir)
+        url = "/data/pipeline_a/affiliation-0.5/input_output.json"
+
+        status, identity_headers, body = request(app, url)
+        assert status == "200 OK"
+        assert body == input_output_path.read_bytes()
+        assert "Content-Encoding" not in identity_headers
+        assert identity_headers["Vary"] == "Accept-Encoding"
+
+        status, headers, body = request(
+            app, url, headers={"Accept-Encoding": "br, gzip;q=0.8"}
+        )
+        assert status == "200 OK"
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Content-Type"] == "application/json"
+        assert headers["Content-Length"] == str(len(body))
+        assert headers["ETag"] != identity_headers["ETag"]
+        assert gzip.decompress(body) == input_output_path.read_bytes()
+
+        status, headers, _ = request(
+            app, url, headers={"Accept-Encoding": "gzip;q=0, *"}
+        )
+        assert status == "200 OK"
+        assert "Content-Encoding" not in headers
+
+        # A sibling older than its file is not used
+        stat = input_output_path.stat()
+        os.utime(input_output_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        _, headers, _ = request(app, url, headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in headers
+
+        # Siblings of removed experiments are deleted with their data files
+        shutil.rmtree(temp_path / "experiments" / "pipeline_a")
+        build_frontend(
+            temp_path / "experiments", site_dir, use_cache=False, precompress=True
+        )
+        assert not (data_dir / "pipeline_a").exists()
+
+
+def test_dev_build_does_not_precompress_static_sources():
+    """Test that a dev build only precompresses the data it generates."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        create_experiment_dir(
+            temp_path / "experiments" / "pipeline_a" / "affiliation-0.5"
+        )
+        static_dir = temp_path / "static"
+        static_dir.mkdir()
+        (static_dir / "app.js").write_text("console.log('dev');")
+        build_frontend(
+            temp_path / "experiments",
+            static_dir,
+            dev_mode=True,
+            use_cache=False,
+            precompress=True,
+        )
+        assert not (static_dir / "app.js.gz").exists()
+        assert (static_dir / "data" / "manifest.json.gz").exists()
+
+
+def test_response_cache_serves_unchanged_files_from_memory():
+    """Test cache hits, revalidation by stat, eviction by size and the stats URL."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        site_dir = Path(temp_dir)
+        names = ["a.json", "b.json", "c.json", "d.json", "e.json"]
+        for name in names:
+            (site_dir / name).write_bytes(name.encode() * 40)  # 240 bytes each
+        (site_dir / "large.json").write_bytes(b"x" * 1000)
+        app = create_app(site_dir, response_cache_bytes=1000)
+        cache = app.response_cache
+
+        assert request(app, "/a.json")[2] == b"a.json" * 40
+        assert request(app, "/a.json")[2] == b"a.json" * 40
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # Ranges are cut from the cached body
+        status, _, body = request(app, "/a.json", headers={"Range": "bytes=0-5"})
+        assert (status, body) == ("206 Partial Content", b"a.json")
+        assert cache.hits == 2
+
+        # Rewriting a file replaces its entry
+        (site_dir / "a.json").write_bytes(b"A" * 240)
+        stat = (site_dir / "a.json").stat()
+        os.utime(site_dir / "a.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert request(app, "/a.json")[2] == b"A" * 240
+        assert request(app, "/a.json")[2] == b"A" * 240
+        assert (cache.hits, cache.misses) == (3, 2)
+
+        # The least recently used entry is evicted to stay within the size
+        for name in names[1:]:
+            request(app, "/" + name)
+        assert cache.evictions == 1 and cache.size <= 1000
+        request(app, "/e.json")
+        request(app, "/c.json")
+        assert (cache.hits, cache.misses) == (5, 6)
+        request(app, "/a.json")
+        assert cache.misses == 7
+
+        # Files over a quarter of the cache are streamed instead
+        assert request(app, "/large.json")[2] == b"x" * 1000
+        assert site_dir / "large.json" not in cache._entries
+
+        status, headers, body = request(app, "/api/cache-stats")
+        assert headers["Content-Type"] == "application/json"
+        stats = json.loads(body)["response_cache"]
+        assert stats == cache.stats()
+        assert stats["max_bytes"] == 1000
+
+        # A size of 0 disables the cache
+        assert create_app(site_dir, response_cache_bytes=0).response_cache is None
+
+
+def test_metrics_count_requests_by_route(build_site):
+    """Test request, byte and latency metrics in Prometheus and JSON format."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        site_dir = build_site(Path(temp_dir))
+        # Without the response cache, files are handed to the file wrapper
+        app = create_app(site_dir, response_cache_bytes=0)
+        data_url = "/data/pipeline_a/affiliation-0.5/input_output.json"
+        data_size = (site_dir / data_url.lstrip("/")).stat().st_size
+
+        request(app, "/data/manifest.json")
+        request(app, data_url)
+        request(app, "/")
+        request(app, "/missing.js")
+        request(app, "/api/export.csv", "adm=pipeline_a")
+
+        # Files handed to the server's file wrapper count their Content-Length
+        environ = {"PATH_INFO": data_url, "wsgi.file_wrapper": FileWrapper}
+        setup_testing_defaults(environ)
+        app(environ, lambda status, headers: None).close()
+
+        status, headers, body = request(app, "/metrics", "format=json")
+        assert status == "200 OK"
+        assert headers["Content-Type"] == "application/json"
+        routes = json.loads(body)["routes"]
+        assert {route: info["requests"] for route, info in routes.items()} == {
+            "data": 2,
+            "export": 1,
+            "manifest": 1,
+            "not_found": 1,
+            "static": 1,
+        }
+        assert routes["data"]["status"] == {"200": 2}
+        assert routes["data"]["bytes_sent"] == 2 * data_size
+        assert routes["export"]["bytes_sent"] > 0
+        latency = routes["static"]["latency_seconds"]
+        assert latency["count"] == 1 and latency["buckets"]["+Inf"] == 1
+        assert json.loads(body)["datasets"] == {
+            "pipeline_a": {"requests": 2, "bytes_sent": 2 * data_size}
+        }
+
+        status, headers, body = request(app, "/metrics")
+        assert status == "200 OK"
+        assert headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        text = body.decode("utf-8")
+        assert 'align_browser_requests_total{route="not_found",status="404"} 1' in text
+        assert (
+            f'align_browser_response_bytes_total{{route="data"}} {2 * data_size}'
+            in text
+        )
+        assert (
+            'align_browser_request_duration_seconds_bucket{route="manifest",le="+Inf"} 1'
+            in text
+        )
+        assert 'align_browser_dataset_requests_total{dataset="pipeline_a"} 2' in text
+        assert "align_browser_response_cache" not in text
+        # The JSON request above was counted too
+        assert 'align_browser_requests_total{route="metrics",status="200"} 1' in text
+
+        cached_app = create_app(site_dir)
+        request(cached_app, "/")
+        request(cached_app, "/")
+        _, _, body = request(cached_app, "/metrics")
+        assert "align_browser_response_cache_hits_total 1" in body.decode("utf-8")
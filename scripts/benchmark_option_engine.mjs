@@ -0,0 +1,74 @@
+#!/usr/bin/env node
+// Measure the frontend's parameter cascade on synthetic manifests.
+//
+// Builds flat entries of 10k, 100k and 1M scenes (or the given sizes),
+// indexes them with the BitsetIndex behind updateParameters and reports
+// the index build time and the latency of a parameter change, next to a
+// linear scan of the entries that checks every result.
+//
+//     node scripts/benchmark_option_engine.mjs [SIZE ...] [--changes N]
+
+import { updateParameters } from '../align_browser/static/state.js';
+import { createRandom, makeEntries, scanUpdater } from './option_engine_reference.mjs';
+
+const args = process.argv.slice(2);
+const changesFlag = args.indexOf('--changes');
+const changeCount = changesFlag >= 0 ? Number(args.splice(changesFlag, 2)[1]) : 20;
+const sizes = args.length > 0 ? args.map(Number) : [10_000, 100_000, 1_000_000];
+
+// Deterministic pseudo-random numbers, so runs are comparable
+let random = createRandom(1);
+
+const time = (fn) => {
+  const start = performance.now();
+  const result = fn();
+  return [result, performance.now() - start];
+};
+
+const milliseconds = (value) => `${value.toFixed(value < 10 ? 3 : 1)} ms`;
+
+console.log(`Parameter changes per size: ${changeCount}`);
+for (const size of sizes) {
+  random = createRandom(size);
+  const entries = makeEntries(size, random);
+  const [update, buildTime] = time(() => updateParameters(entries));
+  const scan = scanUpdater(entries);
+
+  // Walk through the scenarios and scenes, the way a user picks them
+  let state = update({}, {});
+  const changes = [];
+  for (let i = 0; i < changeCount; i++) {
+    const param = i % 2 === 0 ? 'scenario' : 'scene';
+    const options = state.options[param];
+    const change = { [param]: options[random(options.length)] };
+    changes.push([state.params, change]);
+    state = update(state.params, change);
+  }
+
+  const indexTimes = [];
+  const cachedTimes = [];
+  const scanTimes = [];
+  let mismatches = 0;
+  const freshUpdate = updateParameters(entries);
+  for (const [params, change] of changes) {
+    const [result, indexTime] = time(() => freshUpdate(params, change));
+    indexTimes.push(indexTime);
+    cachedTimes.push(time(() => freshUpdate(params, change))[1]);
+    const [expected, scanTime] = time(() => scan(params, change));
+    scanTimes.push(scanTime);
+    if (JSON.stringify(result) !== JSON.stringify(expected)) {
+      mismatches++;
+    }
+  }
+
+  const mean = (values) => values.reduce((sum, value) => sum + value, 0) / values.length;
+  console.log(`\n${size.toLocaleString('en-US')} entries`);
+  console.log(`  Index build:                ${milliseconds(buildTime)}`);
+  console.log(`  Per change (index):         ${milliseconds(mean(indexTimes))}`);
+  console.log(`  Per change (index, cached): ${milliseconds(mean(cachedTimes))}`);
+  console.log(`  Per change (linear scan):   ${milliseconds(mean(scanTimes))}`);
+  console.log(`  Results differing from scan: ${mismatches}`);
+  if (mismatches > 0) {
+    process.exitCode = 1;
+  }
+}
@@ -0,0 +1,252 @@
+#!/usr/bin/env node
+// Check the frontend's option engines against the reference scan.
+//
+// Every way the frontend can compute the parameter cascade must give the
+// same { params, options } as filtering the entries (scanUpdater):
+//
+//   - BitsetIndex over generated entries
+//   - BitsetIndex over the entries of a site's manifest.json
+//   - BitsetIndex over the ColumnarEntries of its manifest_v3.json, and the
+//     CascadeIndex stored with it
+//   - loadManifest (manifest shards and their CascadeIndex, or the columnar
+//     manifest) on the main thread, in a manifest worker, and after the
+//     worker fails and ManifestWorker.fallBack replays its requests
+//
+// The runs that loadManifest resolves are compared with the ones resolved
+// from manifest.json as well. Exits with status 1 on any difference.
+//
+//     node scripts/check_option_engines.mjs [SITE_DIR ...] [--queries N]
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { pathToFileURL } from 'url';
+import { Worker as NodeWorker } from 'worker_threads';
+import { createRandom, makeEntries, scanUpdater } from './option_engine_reference.mjs';
+
+const args = process.argv.slice(2);
+const queriesFlag = args.indexOf('--queries');
+const queryCount = queriesFlag >= 0 ? Number(args.splice(queriesFlag, 2)[1]) : 500;
+const siteDirs = args.map(siteDir => path.resolve(siteDir));
+
+const staticDir = new URL('../align_browser/static/', import.meta.url);
+// Each import gets its own copy of state.js, so loads do not share state
+let instances = 0;
+const importState = () => import(new URL(`state.js?instance=${instances++}`, staticDir));
+
+let failures = 0;
+const report = (name, checked, differences) => {
+  console.log(`${name}: ${checked} queries, ${differences.length} differing`);
+  for (const [query, expected, actual] of differences.slice(0, 3)) {
+    console.log(`  query    ${JSON.stringify(query)}`);
+    console.log(`  expected ${JSON.stringify(expected)}`);
+    console.log(`  actual   ${JSON.stringify(actual)}`);
+  }
+  failures += differences.length;
+};
+
+// Random current parameters and changes over the values in the entries,
+// plus values no entry has
+function makeQueries(entries, priorityOrder, random) {
+  const universe = {};
+  for (const param of priorityOrder) {
+    const values = new Map(entries.map(entry => [JSON.stringify(entry[param]), entry[param]]));
+    universe[param] = [null, ...values.values()];
+  }
+  universe.scene.push('missing-scene');
+  universe.kdma_values.push({}, { missing_kdma: 0.5 });
+  universe.llm.push(undefined);
+
+  const pick = param => universe[param][random(universe[param].length)];
+  const queries = [[Object.fromEntries(priorityOrder.map(param => [param, null])), {}]];
+  for (let i = 1; i < queryCount; i++) {
+    const currentParams = Object.fromEntries(priorityOrder.map(param => [param, pick(param)]));
+    const changes = {};
+    for (const param of priorityOrder) {
+      if (random(4) === 0) {
+        changes[param] = pick(param);
+      }
+    }
+    queries.push([currentParams, changes]);
+  }
+  return queries;
+}
+
+async function compare(name, queries, expectedFor, actualFor) {
+  const differences = [];
+  for (const query of queries) {
+    const expected = await expectedFor(...query);
+    const actual = await actualFor(...query);
+    if (JSON.stringify(actual) !== JSON.stringify(expected)) {
+      differences.push([query, expected, actual]);
+    }
+  }
+  report(name, queries.length, differences);
+}
+
+// fetch() of the page's relative ./data/ URLs, read from a site directory
+function siteFetchSource(siteDir) {
+  return `globalThis.fetch = async (url) => {
+    const { readFile } = await import('fs/promises');
+    const relative = String(url).split('?')[0].replace(/^\\.\\//, '');
+    try {
+      const body = await readFile(${JSON.stringify(siteDir)} + '/' + relative, 'utf8');
+      return { ok: true, status: 200, json: async () => JSON.parse(body) };
+    } catch (error) {
+      return { ok: false, status: 404, json: async () => { throw error; } };
+    }
+  };`;
+}
+
+// A Worker running manifest-worker.js on a worker thread. Messages posted
+// before the module has registered its listener are queued, as in browsers.
+function threadWorkerClass(siteDir) {
+  const shimDir = fs.mkdtempSync(path.join(os.tmpdir(), 'manifest-worker-'));
+  const shimPath = path.join(shimDir, 'worker.mjs');
+  fs.writeFileSync(shimPath, `import { parentPort } from 'worker_threads';
+${siteFetchSource(siteDir)}
+const listeners = [];
+const queued = [];
+globalThis.self = {
+  addEventListener: (type, listener) => listeners.push(listener),
+  postMessage: (message) => parentPort.postMessage(message)
+};
+parentPort.on('message', (data) => {
+  if (listeners.length) listeners.forEach(listener => listener({ data }));
+  else queued.push(data);
+});
+await import(${JSON.stringify(new URL('manifest-worker.js', staticDir).href)});
+queued.forEach(data => listeners.forEach(listener => listener({ data })));
+`);
+  process.on('exit', () => fs.rmSync(shimDir, { recursive: true, force: true }));
+
+  return class {
+    constructor() {
+      this.thread = new NodeWorker(pathToFileURL(shimPath));
+      this.thread.unref();
+    }
+    addEventListener(type, listener) {
+      if (type === 'message') {
+        this.thread.on('message', data => listener({ data }));
+      } else {
+        this.thread.on('error', error => listener({ message: error.message }));
+      }
+    }
+    postMessage(message) {
+      this.thread.postMessage(message);
+    }
+    terminate() {
+      this.thread.terminate();
+    }
+  };
+}
+
+// A Worker that fails once it has been sent its first requests
+class FailingWorker {
+  constructor() {
+    this.errorListeners = [];
+  }
+  addEventListener(type, listener) {
+    if (type === 'error') {
+      this.errorListeners.push(listener);
+    }
+  }
+  postMessage() {
+    if (!this.failing) {
+      this.failing = setTimeout(() => {
+        this.errorListeners.forEach(listener => listener({ message: 'worker failed to start' }));
+      }, 0);
+    }
+  }
+  terminate() {}
+}
+
+function checkGeneratedEntries(updateParameters, priorityOrder) {
+  const random = createRandom(7);
+  const entries = makeEntries(5000, random);
+  const queries = makeQueries(entries, priorityOrder, random);
+  return compare('BitsetIndex, generated entries', queries, scanUpdater(entries), updateParameters(entries));
+}
+
+async function checkSite(siteDir) {
+  const readJson = (name) => JSON.parse(fs.readFileSync(path.join(siteDir, 'data', name), 'utf8'));
+  const manifest = readJson('manifest.json');
+
+  // Reference: the scan over manifest.json, and its runs
+  const reference = await importState();
+  const entries = reference.transformManifestForUpdateParameters(manifest);
+  const scan = scanUpdater(entries, reference.PARAMETER_PRIORITY_ORDER);
+  const queries = makeQueries(entries, reference.PARAMETER_PRIORITY_ORDER, createRandom(entries.length));
+  const runParams = params => ({
+    scenario: params.scenario,
+    scene: params.scene,
+    kdmaValues: params.kdma_values,
+    admType: params.adm,
+    llmBackbone: params.llm,
+    runVariant: params.run_variant
+  });
+  const expectedRun = async (currentParams, changes) =>
+    (await reference.resolveParametersToRun(runParams(scan(currentParams, changes).params))) ?? null;
+
+  const site = path.basename(siteDir);
+  await compare(`BitsetIndex, ${site}/manifest.json`, queries, scan, reference.updateParameters(entries));
+
+  const columnarPath = path.join(siteDir, 'data', 'manifest_v3.json');
+  if (fs.existsSync(columnarPath)) {
+    const columnarState = await importState();
+    const columnar = JSON.parse(fs.readFileSync(columnarPath, 'utf8'));
+    await compare(
+      `BitsetIndex, ${site}/manifest_v3.json`,
+      queries,
+      scan,
+      columnarState.updateParameters(columnarState.transformManifestForUpdateParameters(columnar))
+    );
+    if (columnar.cascade) {
+      await compare(
+        `CascadeIndex, ${site}/manifest_v3.json`,
+        queries,
+        scan,
+        columnarState.updateParameters(new columnarState.CascadeIndex(columnar.cascade, columnar.tables))
+      );
+    }
+  }
+
+  // The page's async API, the way app.js uses it
+  eval(siteFetchSource(siteDir));
+  const scenarioIds = fs.existsSync(path.join(siteDir, 'data', 'manifest_index.json'))
+    ? readJson('manifest_index.json').scenarios
+    : [];
+  const workers = {
+    'main thread': undefined,
+    'manifest worker': threadWorkerClass(siteDir),
+    'worker fallback': FailingWorker
+  };
+  for (const [mode, WorkerClass] of Object.entries(workers)) {
+    globalThis.Worker = WorkerClass;
+    const state = await importState();
+    // Shards are requested while the load is pending, so a failing worker
+    // leaves both to be replayed in order
+    const [loaded] = await Promise.all([
+      state.loadManifest(),
+      state.loadScenarioShards(scenarioIds)
+    ]);
+    await compare(`loadManifest, ${site}, ${mode}`, queries, scan, loaded.updateAppParameters);
+    await compare(
+      `resolveParametersToRun, ${site}, ${mode}`,
+      queries,
+      expectedRun,
+      async (currentParams, changes) => {
+        const { params } = await loaded.updateAppParameters(currentParams, changes);
+        return (await state.resolveParametersToRun(runParams(params))) ?? null;
+      }
+    );
+  }
+  delete globalThis.Worker;
+}
+
+const state = await importState();
+await checkGeneratedEntries(state.updateParameters, state.PARAMETER_PRIORITY_ORDER);
+for (const siteDir of siteDirs) {
+  await checkSite(siteDir);
+}
+process.exit(failures > 0 ? 1 : 0);
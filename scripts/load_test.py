@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Measure the throughput of the align-browser server on a built site.
+
+Serves SITE_DIR with waitress on a free local port, fetches PATHS from
+several client threads for a fixed duration and reports requests per
+second, MB/s and the peak resident memory of this process.
+
+    python scripts/load_test.py align-browser-site /data/manifest.json \\
+        --clients 10 --duration 10
+"""
+
+import argparse
+import http.client
+import resource
+import threading
+import time
+
+from waitress.server import create_server
+
+from align_browser.server import create_app
+
+
+def run_client(port, paths, deadline, totals, lock):
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    requests = 0
+    received = 0
+    while time.monotonic() < deadline:
+        for path in paths:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            # Read in blocks so the client does not dominate memory use
+            while block := response.read(256 * 1024):
+                received += len(block)
+            if response.status != 200:
+                raise RuntimeError(f"{path}: HTTP {response.status}")
+            requests += 1
+    connection.close()
+    with lock:
+        totals["requests"] += requests
+        totals["bytes"] += received
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("site_dir", help="Built site directory to serve")
+    parser.add_argument("paths", nargs="+", help="URL paths to fetch, e.g. /")
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--threads", type=int, default=4, help="Server threads")
+    parser.add_argument(
+        "--response-cache-mb", type=int, default=64, help="0 disables the cache"
+    )
+    args = parser.parse_args()
+
+    server = create_server(
+        create_app(args.site_dir, args.response_cache_mb * 1024 * 1024),
+        host="127.0.0.1",
+        port=0,
+        threads=args.threads,
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+
+    totals = {"requests": 0, "bytes": 0}
+    lock = threading.Lock()
+    start = time.monotonic()
+    deadline = start + args.duration
+    clients = [
+        threading.Thread(
+            target=run_client,
+            args=(server.effective_port, args.paths, deadline, totals, lock),
+        )
+        for _ in range(args.clients)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.monotonic() - start
+    server.close()
+
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"Requests: {totals['requests']} in {elapsed:.1f}s")
+    print(f"Throughput: {totals['requests'] / elapsed:.1f} req/s")
+    print(f"Transfer: {totals['bytes'] / elapsed / 1024**2:.1f} MB/s")
+    print(f"Peak RSS: {peak_rss_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
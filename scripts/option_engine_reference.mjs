@@ -0,0 +1,94 @@
+// Reference data and results for the frontend's option engines, shared by
+// the option engine benchmark and check.
+
+import { KDMAUtils, PARAMETER_PRIORITY_ORDER } from '../align_browser/static/state.js';
+
+// Deterministic pseudo-random numbers: random(count) returns 0..count-1
+export function createRandom(seed) {
+  return (count) => {
+    seed = (seed * 1103515245 + 12345) % 2147483648;
+    return seed % count;
+  };
+}
+
+// Entries shaped like transformManifestForUpdateParameters output: a few
+// ADMs, LLMs and run variants, KDMA combinations from two attributes and
+// scenarios with 100 scenes each. As in that output, entries with the same
+// KDMA values share one object.
+export function makeEntries(size, random) {
+  const adms = ['pipeline_baseline', 'pipeline_random', 'pipeline_comparative', 'pipeline_fewshot'];
+  const llms = [null, 'Mistral-7B-Instruct-v0.3', 'Llama-3.3-70B-Instruct'];
+  const runVariants = ['default', 'seed_1', 'seed_2'];
+  const kdmaCombinations = [{}];
+  for (let affiliation = 0; affiliation <= 10; affiliation++) {
+    kdmaCombinations.push({ affiliation: affiliation / 10 });
+    for (let merit = 0; merit <= 10; merit++) {
+      kdmaCombinations.push({ affiliation: affiliation / 10, merit: merit / 10 });
+    }
+  }
+  const scenesPerScenario = 100;
+  const entries = [];
+  for (let i = 0; i < size; i++) {
+    const kdmaValues = kdmaCombinations[random(kdmaCombinations.length)];
+    const scenario = Math.floor(i / scenesPerScenario / 50) * 50 + random(50);
+    entries.push({
+      scenario: `scenario-${scenario}`,
+      scene: `scene-${random(scenesPerScenario)}`,
+      kdma_values: kdmaValues,
+      adm: adms[random(adms.length)],
+      llm: llms[random(llms.length)],
+      run_variant: runVariants[random(runVariants.length)],
+    });
+  }
+  return entries;
+}
+
+// The parameter cascade as it was computed before the option index: filter
+// the entries on every request, comparing KDMA values with deepEqual
+export function scanUpdater(entries, priorityOrder = PARAMETER_PRIORITY_ORDER) {
+  const optionsFor = (parameterName, selection) => {
+    const depth = priorityOrder.indexOf(parameterName);
+    const options = [];
+    const seen = new Set();
+    for (const entry of entries) {
+      const matches = priorityOrder.slice(0, depth).every(param => {
+        const value = selection[param];
+        if (value === null || value === undefined) {
+          return true;
+        }
+        return param === 'kdma_values'
+          ? KDMAUtils.deepEqual(entry[param], value)
+          : entry[param] === value;
+      });
+      if (!matches) {
+        continue;
+      }
+      const value = entry[parameterName];
+      const key = parameterName === 'kdma_values' ? KDMAUtils.serializeToKey(value) : value;
+      if (!seen.has(key)) {
+        seen.add(key);
+        options.push(value);
+      }
+    }
+    return options;
+  };
+  return (currentParams, changes) => {
+    const params = { ...currentParams, ...changes };
+    const changed = Object.keys(changes).map(param => priorityOrder.indexOf(param));
+    const start = changed.length > 0 ? Math.min(...changed) + 1 : 0;
+    for (const param of priorityOrder.slice(start)) {
+      const options = optionsFor(param, params);
+      const valid = param === 'kdma_values'
+        ? options.some(option => KDMAUtils.deepEqual(option, params[param]))
+        : options.includes(params[param]);
+      if (!valid) {
+        params[param] = options.length > 0 ? options[0] : null;
+      }
+    }
+    const options = {};
+    for (const param of priorityOrder) {
+      options[param] = optionsFor(param, params);
+    }
+    return { params, options };
+  };
+}